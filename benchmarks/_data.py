@@ -0,0 +1,45 @@
+from datetime import UTC, datetime, timedelta
+import random
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.schemas.todo_schema import TodoDict
+
+
+TAG_POOL = [f'tag-{n}' for n in range(200)]
+
+
+def make_records(size: int, *, seed: int = 1234, tags_per_task: int = 3) -> list[TodoDict]:
+    """Generate serialized tasks shaped like a real store.
+
+    Args:
+        size: Number of records.
+        seed: Random seed, fixed for comparable runs.
+        tags_per_task: Number of tags on every task.
+
+    Returns:
+        list[TodoDict]: Records accepted by ``Todo.from_dict``.
+    """
+    rng = random.Random(seed)
+    created_at = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    priorities = list(PriorityEnum)
+    statuses = list(StatusEnum)
+
+    records: list[TodoDict] = []
+    for _ in range(size):
+        deadline = created_at.date() + timedelta(days=rng.randrange(1, 365))
+        records.append({
+            'description': f'Task {rng.getrandbits(32):08x} for the benchmark',
+            'priority': rng.choice(priorities).value,
+            'created_at': (created_at + timedelta(seconds=rng.randrange(86_400))).isoformat(),
+            'deadline': deadline.isoformat() if rng.random() < 0.8 else None,
+            'tags': rng.sample(TAG_POOL, tags_per_task),
+            'status': rng.choice(statuses).value,
+            'idx': str(UUID(int=rng.getrandbits(128), version=4)),
+        })
+    return records
@@ -0,0 +1,77 @@
+"""Store size and save/load time per compression codec and JSON layout.
+
+Run from the project root::
+
+    python -m benchmarks.bench_compression --size 100000
+"""
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+from benchmarks._data import make_records
+from src.storage.compressed import LEVEL_BOUNDS, codec_of, read_compressed, write_compressed
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+
+LAYOUTS = {'indented': 4, 'minified': None}
+
+
+def save(path: Path, todo_list: TodoList, indent: int | None, level: int | None) -> None:
+    if codec_of(path) is None:
+        path.write_text(todo_list.to_json(indent=indent), encoding='utf-8')
+    else:
+        write_compressed(path, todo_list, level=level, indent=indent)
+
+
+def load(path: Path) -> TodoList:
+    if codec_of(path) is None:
+        return TodoList.from_json(path.read_text(encoding='utf-8'))
+    return read_compressed(path)
+
+
+def best_of(repeat: int, func: Callable[..., object], *args: object) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=100_000, help='Number of tasks in the store.')
+    parser.add_argument('--level', type=int, default=None, help='Compression level, codec default when omitted.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case, the best one is reported.')
+    args = parser.parse_args()
+
+    todo_list = TodoList.from_dict({'tasks': make_records(args.size)})
+
+    print(f'{args.size} tasks, level: {"default" if args.level is None else args.level}')
+    print(f'{"codec":>6} {"layout":>9} {"size [MB]":>10} {"ratio":>7} {"save [s]":>9} {"load [s]":>9}')
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline: int | None = None
+        for codec in ['', *LEVEL_BOUNDS]:
+            for layout, indent in LAYOUTS.items():
+                path = Path(directory) / f'data.json{codec}'
+                save_time = best_of(args.repeat, save, path, todo_list, indent, args.level)
+                load_time = best_of(args.repeat, load, path)
+
+                size = path.stat().st_size
+                baseline = baseline or size
+                print(
+                    f'{codec or "none":>6} {layout:>9} {size / 1e6:>10.2f} {baseline / size:>6.1f}x '
+                    f'{save_time:>9.3f} {load_time:>9.3f}'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Crossover between serial and parallel ``TodoList.filter_by(custom_filter=...)``.
+
+The predicate mimics the expensive ones used in practice: a regular
+expression over the description and some date math. The smallest size
+at which the parallel mode wins is a good value for ``parallel_threshold``
+(default: ``PARALLEL_FILTER_THRESHOLD``).
+
+Run from the project root::
+
+    python -m benchmarks.bench_parallel_filter --workers 4
+"""
+
+import argparse
+from datetime import date
+import re
+import time
+from typing import TYPE_CHECKING
+
+from benchmarks._data import make_records
+from src.todo_list.parallel import PARALLEL_FILTER_THRESHOLD, is_free_threaded
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+
+
+PATTERN = re.compile(r'\b(?:[0-9a-f]{2}){2,}\b.*benchmark', re.IGNORECASE)
+REFERENCE_DAY = date(2025, 6, 1)
+
+
+def expensive_predicate(task: Todo) -> bool:
+    """Regex over the description combined with deadline arithmetic."""
+    if not PATTERN.search(task.description):
+        return False
+    return task.deadline is None or (task.deadline - REFERENCE_DAY).days % 7 < 3
+
+
+def best_of(repeat: int, todo_list: TodoList, workers: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        todo_list.filter_by(custom_filter=expensive_predicate, workers=workers, parallel_threshold=0)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000, 200_000])
+    parser.add_argument('--workers', type=int, default=4, help='Workers used in the parallel mode.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, the best one is reported.')
+    args = parser.parse_args()
+
+    pool = 'threads' if is_free_threaded() else 'processes'
+    print(f'workers: {args.workers}, pool: {pool}, current threshold: {PARALLEL_FILTER_THRESHOLD}')
+    print(f'{"tasks":>9} {"serial [s]":>11} {"parallel [s]":>13} {"speedup":>8}')
+
+    crossover: int | None = None
+    for size in args.sizes:
+        todo_list = TodoList.from_dict({'tasks': make_records(size)})
+        serial = best_of(args.repeat, todo_list, workers=1)
+        parallel = best_of(args.repeat, todo_list, workers=args.workers)
+        if crossover is None and parallel < serial:
+            crossover = size
+        print(f'{size:>9} {serial:>11.4f} {parallel:>13.4f} {serial / parallel:>7.2f}x')
+
+    print(f'parallel wins from: {crossover if crossover is not None else "never (in the measured range)"}')
+
+
+if __name__ == '__main__':
+    main()
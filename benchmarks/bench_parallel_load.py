@@ -0,0 +1,43 @@
+"""Scaling of ``TodoList.from_dict`` with the number of parsing workers.
+
+Run from the project root::
+
+    python -m benchmarks.bench_parallel_load --size 200000
+"""
+
+import argparse
+import time
+
+from benchmarks._data import make_records
+from src.todo_list.parallel import is_free_threaded
+from src.todo_list.todo_list import TodoList
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200_000, help='Number of tasks in the store.')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Worker counts to compare.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per worker count, the best one is reported.')
+    args = parser.parse_args()
+
+    data = {'tasks': make_records(args.size)}
+    pool = 'threads' if is_free_threaded() else 'processes'
+
+    print(f'{args.size} tasks, pool: {pool}')
+    print(f'{"workers":>8} {"best [s]":>10} {"tasks/s":>12} {"speedup":>8}')
+
+    baseline: float | None = None
+    for workers in args.workers:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            TodoList.from_dict(data, workers=workers)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        baseline = baseline or best
+        print(f'{workers:>8} {best:>10.3f} {args.size / best:>12,.0f} {baseline / best:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Save/load round trip of the JSON store: ``TodoList.to_json`` and trusted ``from_json``.
+
+Run from the project root::
+
+    python -m benchmarks.bench_roundtrip --size 200000
+"""
+
+import argparse
+import time
+
+from benchmarks._data import make_records
+from src.todo_list.todo_list import TodoList
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200_000, help='Number of tasks in the store.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per step, the best one is reported.')
+    args = parser.parse_args()
+
+    raw = TodoList.from_dict({'tasks': make_records(args.size)}).to_json()
+
+    load_timings = []
+    save_timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        todo_list = TodoList.from_json(raw, trusted=True)
+        loaded = time.perf_counter()
+        todo_list.to_json()
+        saved = time.perf_counter()
+
+        load_timings.append(loaded - start)
+        save_timings.append(saved - loaded)
+
+    load, save = min(load_timings), min(save_timings)
+    print(f'{args.size} tasks')
+    print(f'{"step":>10} {"best [s]":>10} {"tasks/s":>12}')
+    for step, best in [('load', load), ('save', save), ('roundtrip', load + save)]:
+        print(f'{step:>10} {best:>10.3f} {args.size / best:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Cold-start import budget of the CLI.
+
+Runs ``python -X importtime -m src.main`` for ``--help`` and ``list-tasks``
+on a small generated store, sums the self import time per top-level
+package (median of several runs) and compares it with a per-package budget
+in milliseconds. Packages without their own budget share the ``other``
+budget. Exits with status 1 when a package or the total is over budget, so
+a new eager import of a heavy module fails the check.
+
+Run from the project root::
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 9 --scale 1.5
+"""
+
+import argparse
+from collections import defaultdict
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from src.cli.state import export_tasks
+from src.task.synthetic import generate_tasks
+
+
+# Self import time in milliseconds per top-level package, for one command.
+# Interactive prompts (questionary, prompt_toolkit), the process pool
+# (multiprocessing) and the profiler are imported on use only.
+BUDGET_MS: dict[str, float] = {
+    'src': 20.0,
+    'typer': 25.0,
+    'click': 20.0,
+    'rich': 70.0,
+    'markdown_it': 40.0,
+    'pygments': 15.0,
+    'questionary': 0.0,
+    'prompt_toolkit': 0.0,
+    'multiprocessing': 0.0,
+    'cProfile': 0.0,
+    'pstats': 0.0,
+    'other': 130.0,
+    'total': 300.0,
+}
+
+SCENARIOS = {
+    'help': ['--help'],
+    'list-tasks': ['list-tasks'],
+}
+
+
+def measure(args: list[str], env: dict[str, str]) -> dict[str, float]:
+    """Import times of one run of the CLI.
+
+    Args:
+        args: Command line arguments.
+        env: Environment of the run.
+
+    Returns:
+        dict[str, float]: Self import time in milliseconds per top-level package.
+    """
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, '-X', 'importtime', '-m', 'src.main', *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    packages: dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = (part.strip() for part in line.removeprefix('import time:').split('|'))
+        packages[name.split('.')[0]] += int(self_us) / 1000
+    return packages
+
+
+def check(packages: dict[str, float], scale: float) -> list[str]:
+    """Compare import times with the budget.
+
+    Args:
+        packages: Median self import time per top-level package.
+        scale: Factor applied to every budget, for slower machines.
+
+    Returns:
+        list[str]: Budget entries that were exceeded.
+    """
+    spent: dict[str, float] = defaultdict(float)
+    for name, ms in packages.items():
+        spent[name if name in BUDGET_MS else 'other'] += ms
+    spent['total'] = sum(packages.values())
+
+    over = []
+    for name, budget in BUDGET_MS.items():
+        limit = budget * scale
+        marker = 'OVER' if spent[name] > limit else ''
+        print(f'  {name:<16} {spent[name]:>8.1f} ms / {limit:>6.1f} ms {marker}')
+        if marker:
+            over.append(name)
+    return over
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per command; the median is compared.')
+    parser.add_argument('--scale', type=float, default=1.0, help='Factor applied to every budget.')
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        store = Path(directory) / 'store.json'
+        export_tasks(store, generate_tasks(100, seed=1))
+        # The warm-up run has to write the bytecode cache, or every run pays for compiling the sources.
+        env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+        env['STORAGE_PATH_ENV'] = str(store)
+
+        for scenario, command in SCENARIOS.items():
+            measure(command, env)  # warm up the bytecode cache
+            runs = [measure(command, env) for _ in range(args.repeat)]
+            names = {name for run in runs for name in run}
+            packages = {name: statistics.median(run.get(name, 0.0) for run in runs) for name in names}
+            print(f'{scenario}:')
+            failures.extend(f'{scenario}: {name}' for name in check(packages, args.scale))
+
+    if failures:
+        print(f'\nOver budget: {", ".join(failures)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Loading time of a store with many repeated tags, with and without the tag cache.
+
+The baseline normalizer is the previous implementation, an uncached
+``re.sub`` call going through the ``re`` module pattern cache lookup.
+
+Run from the project root::
+
+    python -m benchmarks.bench_tag_normalization --size 1000000
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks._data import make_records
+from src.task import task as task_module
+from src.todo_list.todo_list import TodoList
+
+
+def normalize_uncached(text: str) -> str:
+    return re.sub(r'\s{2,}', ' ', text).lower().strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1_000_000, help='Number of tasks in the store.')
+    parser.add_argument('--tags', type=int, default=5, help='Number of tags on every task.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per normalizer, the best one is reported.')
+    args = parser.parse_args()
+
+    records = make_records(args.size, tags_per_task=args.tags)
+    for number, record in enumerate(records):
+        if number % 2:
+            record['tags'] = [tag.upper() for tag in record['tags']]
+    data = {'tasks': records}
+    cached = task_module.normalize_tag
+
+    print(f'{args.size} tasks, {args.tags} tags each, half of them upper case')
+    print(f'{"normalizer":>11} {"best [s]":>10} {"tasks/s":>12} {"speedup":>8}')
+
+    baseline: float | None = None
+    for name, normalizer in [('uncached', normalize_uncached), ('cached', cached)]:
+        task_module.normalize_tag = normalizer
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            TodoList.from_dict(data)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        baseline = baseline or best
+        print(f'{name:>11} {best:>10.3f} {args.size / best:>12,.0f} {baseline / best:>7.2f}x')
+
+    task_module.normalize_tag = cached
+    print(f'cache: {task_module._normalize_cached.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
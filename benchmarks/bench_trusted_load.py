@@ -0,0 +1,40 @@
+"""Load throughput of ``TodoList.from_dict`` with and without the trusted path.
+
+Run from the project root::
+
+    python -m benchmarks.bench_trusted_load --size 200000
+"""
+
+import argparse
+import time
+
+from benchmarks._data import make_records
+from src.todo_list.todo_list import TodoList
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200_000, help='Number of tasks in the store.')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per mode, the best one is reported.')
+    args = parser.parse_args()
+
+    data = {'tasks': make_records(args.size)}
+
+    print(f'{args.size} tasks')
+    print(f'{"mode":>10} {"best [s]":>10} {"tasks/s":>12} {"speedup":>8}')
+
+    baseline: float | None = None
+    for mode, trusted in [('validated', False), ('trusted', True)]:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            TodoList.from_dict(data, trusted=trusted)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        baseline = baseline or best
+        print(f'{mode:>10} {best:>10.3f} {args.size / best:>12,.0f} {baseline / best:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""Benchmark suite over the Todo, TodoList and storage hot paths.
+
+Every case runs on generated stores of each requested size and reports the
+best and median time of several runs. Results can be saved as JSON and
+compared with a previous run; the comparison fails when a case got slower
+than the threshold allows, so it can guard a commit or a CI job.
+
+Run from the project root::
+
+    python -m benchmarks.suite --sizes 1000,100000 --output before.json
+    python -m benchmarks.suite --sizes 1000,100000 --output after.json --compare before.json --threshold 0.1
+    python -m benchmarks.suite --sizes 1000000 --cases todolist. --repeat 3
+"""
+
+import argparse
+import io
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from benchmarks._data import make_records
+from src.cli import state
+from src.cli.commands.list_tasks import DEFAULT_SORT, parse_sort_keys
+from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
+from src.todo_list.todo_list import TodoList
+from src.ui.output import write_csv, write_plain
+from src.ui.tables import build_tasks_table
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from src.schemas.todo_schema import TodoDict
+
+
+DEFAULT_SIZES = '1000,100000'
+
+LOOKUPS = 10_000
+
+
+class Dataset:
+    """Generated records and the tasks built from them, shared by all cases of one size."""
+
+    def __init__(self, size: int, directory: Path) -> None:
+        self.size = size
+        self.records: list[TodoDict] = make_records(size)
+        self.todo_list = TodoList.from_dict({'tasks': self.records})
+        self.raw = self.todo_list.to_json()
+        step = max(1, size // LOOKUPS)
+        self.sample = [task.idx for task in self.todo_list.tasks[::step]]
+        self.store_path = directory / f'store-{size}.json'
+        self.store_path.write_text(self.raw, encoding='utf-8')
+
+
+def _todo_init(data: Dataset) -> Callable[[], object]:
+    arguments = [
+        {
+            'description': task.description,
+            'priority': task.priority,
+            'created_at': task.created_at,
+            'deadline': task.deadline,
+            'tags': list(task.tags),
+            'status': task.status,
+        }
+        for task in data.todo_list
+    ]
+    return lambda: [Todo(**kwargs) for kwargs in arguments]
+
+
+def _todo_from_dict(data: Dataset) -> Callable[[], object]:
+    return lambda: [Todo.from_dict(record) for record in data.records]
+
+
+def _todo_to_dict(data: Dataset) -> Callable[[], object]:
+    return lambda: [task.to_dict() for task in data.todo_list]
+
+
+def _todolist_add(data: Dataset) -> Callable[[], object]:
+    todo_list = TodoList()
+
+    def run() -> None:
+        for task in data.todo_list:
+            todo_list.add(task)
+
+    return run
+
+
+def _todolist_get(data: Dataset) -> Callable[[], object]:
+    return lambda: [data.todo_list.get(idx) for idx in data.sample]
+
+
+def _todolist_remove(data: Dataset) -> Callable[[], object]:
+    todo_list = TodoList(data.todo_list.tasks)
+
+    def run() -> None:
+        for idx in data.sample:
+            todo_list.remove(idx)
+
+    return run
+
+
+def _todolist_filter_by(data: Dataset) -> Callable[[], object]:
+    return lambda: data.todo_list.filter_by(status=StatusEnum.TODO, tag='tag-1')
+
+
+def _todolist_sort_by_many(data: Dataset) -> Callable[[], object]:
+    keys = parse_sort_keys(DEFAULT_SORT)
+    return lambda: data.todo_list.sort_by_many(*keys)
+
+
+def _todolist_from_json(data: Dataset) -> Callable[[], object]:
+    return lambda: TodoList.from_json(data.raw)
+
+
+def _todolist_to_json(data: Dataset) -> Callable[[], object]:
+    return data.todo_list.to_json
+
+
+def _state_load(data: Dataset) -> Callable[[], object]:
+    os.environ['STORAGE_PATH_ENV'] = str(data.store_path)
+    return state.load_todo_list
+
+
+def _state_save(data: Dataset) -> Callable[[], object]:
+    os.environ['STORAGE_PATH_ENV'] = str(data.store_path)
+    state._todo_list = data.todo_list
+    return state.save_todo_list
+
+
+def _ui_tasks_table(data: Dataset) -> Callable[[], object]:
+    return lambda: build_tasks_table(data.todo_list)
+
+
+def _ui_write_plain(data: Dataset) -> Callable[[], object]:
+    return lambda: write_plain(io.StringIO(), data.todo_list)
+
+
+def _ui_write_csv(data: Dataset) -> Callable[[], object]:
+    return lambda: write_csv(io.StringIO(), data.todo_list)
+
+
+# Each case prepares a fresh run (untimed) and returns the timed callable.
+CASES: dict[str, Callable[[Dataset], Callable[[], object]]] = {
+    'todo.init': _todo_init,
+    'todo.from_dict': _todo_from_dict,
+    'todo.to_dict': _todo_to_dict,
+    'todolist.add': _todolist_add,
+    'todolist.get': _todolist_get,
+    'todolist.remove': _todolist_remove,
+    'todolist.filter_by': _todolist_filter_by,
+    'todolist.sort_by_many': _todolist_sort_by_many,
+    'todolist.from_json': _todolist_from_json,
+    'todolist.to_json': _todolist_to_json,
+    'state.load_todo_list': _state_load,
+    'state.save_todo_list': _state_save,
+    'ui.build_tasks_table': _ui_tasks_table,
+    'ui.write_plain': _ui_write_plain,
+    'ui.write_csv': _ui_write_csv,
+}
+
+
+def run_case(case: Callable[[Dataset], Callable[[], object]], data: Dataset, repeat: int) -> dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        func = case(data)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {'best': min(timings), 'median': statistics.median(timings)}
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> int:
+    """Print the change of every case present in both runs and count the regressions."""
+    regressions = 0
+    print(f'\n{"case":<36} {"baseline [s]":>13} {"current [s]":>12} {"change":>8}')
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]['best'], result['best']
+        change = after / before - 1
+        regressed = change > threshold
+        regressions += regressed
+        print(f'{name:<36} {before:>13.4f} {after:>12.4f} {change:>+7.1%}{"  REGRESSION" if regressed else ""}')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='Comma separated store sizes, e.g. 1000,100000,1000000.')
+    parser.add_argument('--cases', default='', help='Run only cases whose name contains this text.')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per case; best and median are reported.')
+    parser.add_argument('--output', type=Path, help='Write the results to this JSON file.')
+    parser.add_argument('--compare', type=Path, help='Compare with the results of a previous run.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown of the best time, 0.1 = 10%%.')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    cases = {name: case for name, case in CASES.items() if args.cases in name}
+    results: dict[str, dict[str, float]] = {}
+
+    print(f'{"case":<36} {"best [s]":>10} {"median [s]":>11}')
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            data = Dataset(size, Path(directory))
+            for name, case in cases.items():
+                key = f'{name}[{size}]'
+                result = results[key] = run_case(case, data, args.repeat)
+                print(f'{key:<36} {result["best"]:>10.4f} {result["median"]:>11.4f}')
+
+    if args.output:
+        report: dict[str, Any] = {
+            'python': sys.version,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'\n{regressions} case(s) slower than the {args.threshold:.0%} threshold.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
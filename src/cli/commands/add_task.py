@@ -1,24 +1,44 @@
+from typing import Annotated
+
 import typer
 
-from src.cli.state import get_todo_list, save_todo_list
+from src.cli.state import append_task
+from src.task.recurrence import parse_recurrence
 from src.task.task import Todo
 from src.ui.console import console
 from src.ui.prompts import prompt_deadline_graphical, prompt_description, prompt_priority, prompt_status, prompt_tags
 
 
-def add_task() -> None:
+def add_task(
+    repeat: Annotated[
+        str | None,
+        typer.Option('--repeat', help='Repeat the task: daily, weekly or "every N days".'),
+    ] = None,
+) -> None:
     """
     Create and persist a new task based on user input.
 
     The function interactively prompts the user for task details such as
     description, priority, status, deadline, and tags. It then creates a
-    Todo object, adds it to the current todo list, and saves the updated list.
+    Todo object and adds it to the store (see `append_task`).
+
+    With ``--repeat`` the task is recurring: its deadline (or creation date)
+    anchors the rule and later occurrences are shown by ``list-tasks``.
 
     If the deadline prompt is cancelled, the operation is aborted gracefully.
 
+    Args:
+        repeat (str | None): Recurrence rule of the task.
+
     Raises:
+        typer.BadParameter: If the recurrence rule is invalid.
         typer.Exit: If the user cancels the deadline input.
     """
+    try:
+        recurrence = None if repeat is None else parse_recurrence(repeat)
+    except ValueError as err:
+        raise typer.BadParameter(str(err), param_hint='--repeat') from err
+
     description = prompt_description()
 
     priority = prompt_priority()
@@ -32,10 +52,15 @@ def add_task() -> None:
 
     tags = prompt_tags()
 
-    task = Todo(description=description, priority=priority, status=status, deadline=deadline, tags=tags)
+    task = Todo(
+        description=description,
+        priority=priority,
+        status=status,
+        deadline=deadline,
+        tags=tags,
+        recurrence=recurrence,
+    )
 
-    todo_list = get_todo_list()
-    todo_list.add(task)
-    save_todo_list()
+    append_task(task)
 
     console.print(f'[green]Added: [/green] {task.description} (id={(str(task.idx)[:8])})')
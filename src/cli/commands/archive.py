@@ -0,0 +1,39 @@
+from typing import Annotated
+
+import typer
+
+from src.cli.state import archive_tasks, get_archive_after_days, get_todo_list, save_todo_list
+from src.ui.console import console
+
+
+DEFAULT_ARCHIVE_DAYS = 30
+
+
+def archive(
+    days: Annotated[
+        int | None,
+        typer.Option('--days', min=0, help='Archive completed tasks older than this many days.'),
+    ] = None,
+) -> None:
+    """Move old completed tasks to the compressed archive.
+
+    Completed tasks older than ``--days`` (default: ``ARCHIVE_AFTER_DAYS`` or
+    30 days) are appended to the archive and removed from the active list,
+    which is then saved. Archived tasks stay visible with
+    ``list-tasks --include-archived``.
+
+    Args:
+        days (int | None): Minimum age in days of archived tasks.
+    """
+    older_than_days = days if days is not None else get_archive_after_days()
+    if older_than_days is None:
+        older_than_days = DEFAULT_ARCHIVE_DAYS
+
+    archived = archive_tasks(get_todo_list(), older_than_days)
+
+    if not archived:
+        console.print('[yellow]No tasks to archive.[/yellow]')
+        return
+
+    save_todo_list()
+    console.print(f'[green]Archived:[/green] {len(archived)} completed task(s)')
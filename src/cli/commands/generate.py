@@ -0,0 +1,141 @@
+from enum import Enum
+from pathlib import Path  # noqa: TC003 - Typer reads the annotations at runtime
+from typing import Annotated
+
+import typer
+
+from src.cli.state import export_tasks
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.synthetic import DEFAULT_PRIORITY_WEIGHTS, DEFAULT_STATUS_WEIGHTS, generate_tasks
+from src.ui.console import console
+
+
+def parse_weights[E: Enum](text: str, enum: type[E], param_hint: str) -> dict[E, float]:
+    """
+    Parse relative frequencies of enum members.
+
+    Args:
+        text (str): Comma separated ``name=weight`` pairs, e.g. ``low=1,high=3``.
+            Names are case-insensitive, missing members get no weight.
+        enum (type[E]): Enum of the names.
+        param_hint (str): Option reported in the error.
+
+    Returns:
+        dict[E, float]: Weight of every listed member.
+
+    Raises:
+        typer.BadParameter: If a pair is malformed or names an unknown member.
+    """
+    weights: dict[E, float] = {}
+    for pair in text.split(','):
+        name, _, weight = pair.partition('=')
+        try:
+            weights[enum[name.strip().upper()]] = float(weight)
+        except (KeyError, ValueError) as err:
+            raise typer.BadParameter(f'Invalid weight {pair.strip()!r}.', param_hint=param_hint) from err
+    return weights
+
+
+def parse_word_range(text: str) -> tuple[int, int]:
+    """
+    Parse a description length range.
+
+    Args:
+        text (str): ``MIN-MAX`` or a single number of words.
+
+    Returns:
+        tuple[int, int]: Minimum and maximum number of words.
+
+    Raises:
+        typer.BadParameter: If the range is not made of integers.
+    """
+    low, _, high = text.partition('-')
+    try:
+        return int(low), int(high or low)
+    except ValueError as err:
+        raise typer.BadParameter(f'Invalid word range {text!r}.', param_hint='--words') from err
+
+
+def generate(
+    count: Annotated[int, typer.Argument(min=0, help='Number of tasks to generate.')],
+    output: Annotated[
+        Path,
+        typer.Argument(help='Store file to write: .json, .json.gz, .json.zst, .json.xz or .ndjson.'),
+    ],
+    *,
+    seed: Annotated[int, typer.Option('--seed', help='Random seed, equal seeds generate equal stores.')] = 0,
+    priorities: Annotated[
+        str | None,
+        typer.Option('--priorities', help='Priority weights, e.g. "low=3,medium=5,high=2".'),
+    ] = None,
+    statuses: Annotated[
+        str | None,
+        typer.Option('--statuses', help='Status weights, e.g. "todo=4,in_progress=2,completed=3,blocked=1".'),
+    ] = None,
+    tags: Annotated[int, typer.Option('--tags', min=1, help='Number of distinct tags.')] = 1000,
+    tag_skew: Annotated[float, typer.Option('--tag-skew', min=0, help='Zipf exponent of the tag popularity.')] = 1.1,
+    max_tags: Annotated[int, typer.Option('--max-tags', min=0, help='Maximum number of tags per task.')] = 3,
+    deadline_ratio: Annotated[
+        float,
+        typer.Option('--deadline-ratio', min=0, max=1, help='Share of tasks with a deadline.'),
+    ] = 0.8,
+    deadline_days: Annotated[
+        int,
+        typer.Option('--deadline-days', min=0, help='Maximum days between creation and deadline.'),
+    ] = 90,
+    words: Annotated[str, typer.Option('--words', help='Description length in words, MIN-MAX.')] = '3-12',
+    force: Annotated[bool, typer.Option('--force', help='Replace an existing file.')] = False,
+) -> None:
+    """
+    Generate a synthetic store for load testing.
+
+    ``COUNT`` random tasks are streamed to ``OUTPUT`` in the format given by
+    its name, in constant memory, so stores of millions of tasks can be
+    generated. Priorities and statuses follow the given weights, tags have
+    Zipfian popularity. The configured store is not touched.
+
+    Args:
+        count (int): Number of tasks to generate.
+        output (Path): Store file to write.
+        seed (int): Random seed.
+        priorities (str | None): Priority weights.
+        statuses (str | None): Status weights.
+        tags (int): Number of distinct tags.
+        tag_skew (float): Zipf exponent of the tag popularity.
+        max_tags (int): Maximum number of tags per task.
+        deadline_ratio (float): Share of tasks with a deadline.
+        deadline_days (int): Maximum days between creation and deadline.
+        words (str): Description length in words.
+        force (bool): Replace an existing file.
+
+    Raises:
+        typer.BadParameter: If an option is invalid or the output exists without ``--force``.
+    """
+    if output.exists() and not force:
+        raise typer.BadParameter(f'{output} already exists, use --force to replace it.', param_hint='OUTPUT')
+
+    priority_weights = (
+        DEFAULT_PRIORITY_WEIGHTS if priorities is None else parse_weights(priorities, PriorityEnum, '--priorities')
+    )
+    status_weights = DEFAULT_STATUS_WEIGHTS if statuses is None else parse_weights(statuses, StatusEnum, '--statuses')
+    description_words = parse_word_range(words)
+
+    try:
+        tasks = generate_tasks(
+            count,
+            seed=seed,
+            priority_weights=priority_weights,
+            status_weights=status_weights,
+            tag_count=tags,
+            tag_skew=tag_skew,
+            max_tags=max_tags,
+            deadline_ratio=deadline_ratio,
+            deadline_days=deadline_days,
+            description_words=description_words,
+        )
+        written = export_tasks(output, tasks)
+    except ValueError as err:
+        raise typer.BadParameter(str(err)) from err
+
+    console.print(f'[green]Generated:[/green] {written} task(s) in {output}')
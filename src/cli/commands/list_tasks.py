@@ -1,25 +1,174 @@
-from typing import TYPE_CHECKING
+from datetime import UTC, datetime, timedelta
+import sys
+from typing import TYPE_CHECKING, Annotated, Any
 
-from src.cli.state import get_todo_list
-from src.ui.console import console
+import typer
+
+from src.cli.profiling import phase
+from src.cli.state import get_todo_list, load_first_tasks, load_tasks_with_status, with_archived_tasks
+from src.enums.output_format_enum import OutputFormatEnum
+from src.enums.status_enum import StatusEnum
+from src.todo_list.todo_list import TodoList
+from src.ui.console import console, stdout_is_terminal
+from src.ui.output import WRITERS
 from src.ui.tables import build_tasks_table
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable  # pragma: no cover
+
     from rich.table import Table  # pragma: no cover
 
+    from src.task.task import Todo  # pragma: no cover
+
+
+SORT_KEYS: dict[str, Callable[[Todo], Any]] = {
+    'priority': lambda task: -task.priority,
+    'deadline': lambda task: (task.deadline is None, task.deadline),
+    'created': lambda task: task.created_at,
+    'description': lambda task: task.description.lower(),
+}
+
+DEFAULT_SORT = 'priority,deadline'
+
+DEFAULT_HORIZON_DAYS = 0
+
+
+def parse_sort_keys(spec: str) -> list[Callable[[Todo], Any]]:
+    """Translate a comma separated list of sort key names into key functions.
+
+    Keys are ordered by urgency: ``priority`` puts HIGH first and ``deadline``
+    puts the nearest date first with tasks without a deadline last.
+
+    Args:
+        spec (str): Comma separated key names, e.g. ``"priority,deadline"``.
+
+    Returns:
+        list[Callable[[Todo], Any]]: Key functions in the requested order.
+
+    Raises:
+        typer.BadParameter: If a key name is unknown.
+    """
+    names = [name.strip().lower() for name in spec.split(',') if name.strip()]
+
+    unknown = [name for name in names if name not in SORT_KEYS]
+    if unknown:
+        raise typer.BadParameter(f'Unknown sort key: {", ".join(unknown)}. Available: {", ".join(SORT_KEYS)}.')
+
+    return [SORT_KEYS[name] for name in names]
 
-def list_tasks() -> None:
+
+def stored_positions() -> dict[int, int]:
+    """Map every stored task to its 1-based position.
+
+    The positions are the task ids read by ``remove-task`` and
+    ``update-task``, so a reordered table shows them instead of row numbers.
+
+    Returns:
+        dict[int, int]: Position per task id (:attr:`~src.task.task.Todo.idx_int`).
+    """
+    return {task.idx_int: position for position, task in enumerate(get_todo_list(), 1)}
+
+
+def list_tasks(
+    *,
+    top: Annotated[int | None, typer.Option('--top', min=1, help='Show only the N most urgent tasks.')] = None,
+    by: Annotated[
+        str | None,
+        typer.Option('--by', help=f'Comma separated sort keys ({", ".join(SORT_KEYS)}).'),
+    ] = None,
+    status: Annotated[
+        list[StatusEnum] | None,
+        typer.Option('--status', help='Show only tasks with this status (repeatable).'),
+    ] = None,
+    include_archived: Annotated[
+        bool,
+        typer.Option('--include-archived', help='Also show tasks from the compressed archive.'),
+    ] = False,
+    horizon: Annotated[
+        int,
+        typer.Option('--horizon', min=0, help='Also show occurrences of recurring tasks due within this many days.'),
+    ] = DEFAULT_HORIZON_DAYS,
+    limit: Annotated[
+        int | None,
+        typer.Option('--limit', min=1, help='Show at most N tasks, in store order unless sorted.'),
+    ] = None,
+    output_format: Annotated[
+        OutputFormatEnum | None,
+        typer.Option('--format', help='Output format; a table on a terminal and plain lines otherwise.'),
+    ] = None,
+) -> None:
     """Display all tasks in a table format.
 
     Retrieves the current todo list and prints it as a formatted table.
     If no tasks are available, a warning message is displayed instead.
+
+    With ``--top N`` only the N first tasks by ``--by`` keys (default:
+    priority, then deadline) are selected using a partial heap selection.
+    ``--by`` alone sorts the whole list. ``--status`` limits the list to the
+    given statuses, reading only the needed shards of a sharded store unless
+    a table is shown, as its Id column needs the positions of all tasks.
+    The archive is read only with ``--include-archived``. With
+    ``--horizon N`` upcoming occurrences of recurring tasks within N days
+    are listed as ``todo`` tasks without being stored; they are hidden by
+    default, as the ``json`` and ``ndjson`` formats would emit them as
+    stored records.
+    ``--limit N`` shows at most N tasks; without other options
+    only the first N tasks of an NDJSON store are read. The Id column of
+    a sorted or filtered table shows the stored positions, so it always
+    holds the ids ``remove-task`` and ``update-task`` expect; archived
+    tasks and occurrences, which they cannot address, are shown with ``-``.
+
+    ``--format`` selects the output: ``table`` (Rich table), ``plain``
+    (aligned lines), ``tsv``, ``csv``, ``json`` (a TodoList) or ``ndjson``.
+    Every format but ``table`` streams rows straight to stdout without
+    measuring cells; without ``--format`` a table is shown on a terminal
+    and plain lines are written to a pipe or a file. Only the table
+    reports an empty list, the other formats write no rows.
+
+    Args:
+        top (int | None): Number of tasks to select.
+        by (str | None): Comma separated sort key names.
+        status (list[StatusEnum] | None): Statuses to show; all when omitted.
+        include_archived (bool): Whether archived tasks are listed too.
+        horizon (int): Number of days of recurring task occurrences to show.
+        limit (int | None): Maximum number of tasks to show.
+        output_format (OutputFormatEnum | None): Output format; detected from stdout when omitted.
     """
-    todo_list = get_todo_list()
-    if not len(todo_list):
+    if output_format is None:
+        output_format = OutputFormatEnum.TABLE if stdout_is_terminal() else OutputFormatEnum.PLAIN
+
+    derived = top is not None or by is not None or bool(status) or include_archived or bool(horizon)
+    positions = stored_positions() if derived and output_format is OutputFormatEnum.TABLE else None
+
+    if status:
+        todo_list = load_tasks_with_status(status)
+    elif limit is not None and top is None and by is None and not include_archived:
+        todo_list = load_first_tasks(limit)
+    else:
+        todo_list = get_todo_list()
+    if horizon and (not status or StatusEnum.TODO in status):
+        today = datetime.now(tz=UTC).date()
+        todo_list = todo_list.with_occurrences(today, today + timedelta(days=horizon))
+    if include_archived:
+        todo_list = with_archived_tasks(todo_list, status)
+    if not len(todo_list) and output_format is OutputFormatEnum.TABLE:
         console.print('[yellow]No tasks found.[/yellow]')
         return
 
-    table: Table = build_tasks_table(todo_list)
+    if top is not None:
+        todo_list = todo_list.top_k(top, *parse_sort_keys(by or DEFAULT_SORT))
+    elif by is not None:
+        todo_list = todo_list.sort_by_many(*parse_sort_keys(by))
+
+    if limit is not None:
+        todo_list = TodoList(todo_list.tasks[:limit])
+
+    with phase('render'):
+        if output_format is not OutputFormatEnum.TABLE:
+            WRITERS[output_format](sys.stdout, todo_list)
+            return
+
+        table: Table = build_tasks_table(todo_list, positions)
 
-    console.print(table)
+        console.print(table)
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime, timedelta
+from typing import Annotated
+
+import typer
+
+from src.cli.state import get_todo_list, save_todo_list
+from src.todo_list.filters import TaskFilter
+from src.ui.console import console
+
+
+def recur(
+    tag: Annotated[str, typer.Argument(help='Tag of the template tasks.')],
+    count: Annotated[int, typer.Option('--count', min=1, help='Number of instances per template.')] = 1,
+    every: Annotated[
+        int | None,
+        typer.Option('--every', min=1, help='Days between the deadlines of consecutive instances.'),
+    ] = None,
+) -> None:
+    """Create recurring instances of template tasks.
+
+    Every task tagged ``TAG`` is a template: it is cloned ``--count`` times
+    without the template tag, so the instances are not templates themselves.
+    With ``--every N`` the k-th instance is due N * k days from today,
+    otherwise instances keep the template's deadline. All instances are
+    created in one batch and saved once.
+
+    Args:
+        tag (str): Tag of the template tasks.
+        count (int): Number of instances per template.
+        every (int | None): Days between the deadlines of consecutive instances.
+    """
+    deadlines = None
+    if every is not None:
+        today = datetime.now(tz=UTC).date()
+        deadlines = [today + timedelta(days=every * k) for k in range(1, count + 1)]
+
+    instances = get_todo_list().clone_matching(TaskFilter(tag=tag), n=count, deadlines=deadlines, drop_tags=[tag])
+
+    if not len(instances):
+        console.print(f'[yellow]No tasks tagged {tag}.[/yellow]')
+        return
+
+    save_todo_list()
+    console.print(
+        f'[green]Created:[/green] {len(instances)} recurring task(s) from {len(instances) // count} template(s)'
+    )
@@ -0,0 +1,42 @@
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Annotated
+
+import typer
+
+from src.cli.state import get_todo_list
+from src.ui.console import console
+from src.ui.tables import build_counts_table
+
+
+def stats(
+    top_tags: Annotated[int, typer.Option('--top-tags', min=1, help='Number of most frequent tags to show.')] = 10,
+) -> None:
+    """Display summary statistics of all tasks.
+
+    Prints task counts per status, priority, the most frequent tags,
+    a per month deadline histogram and the overdue ratio. The numbers come
+    from the incrementally maintained counters of the todo list.
+
+    Args:
+        top_tags (int): Number of most frequent tags to show.
+    """
+    todo_list = get_todo_list()
+    if not len(todo_list):
+        console.print('[yellow]No tasks found.[/yellow]')
+        return
+
+    summary = todo_list.stats
+    today = datetime.now(tz=UTC).date()
+
+    status_counts = {status.value: count for status, count in summary.aggregate('status').items()}
+    priority_counts = {priority.name: count for priority, count in summary.aggregate('priority').items()}
+    tag_counts = dict(islice(summary.aggregate('tag').items(), top_tags))
+
+    console.print(build_counts_table('Status', status_counts, summary.total))
+    console.print(build_counts_table('Priority', priority_counts, summary.total))
+    console.print(build_counts_table('Tags', tag_counts, summary.total))
+    console.print(build_counts_table('Deadlines per month', summary.aggregate('month'), summary.total))
+
+    overdue = summary.overdue(today)
+    console.print(f'[bold]Overdue:[/bold] {overdue} of {summary.total} ({summary.overdue_ratio(today):.1%})')
@@ -0,0 +1,217 @@
+from contextlib import contextmanager
+import functools
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+
+from src.metrics import metrics
+from src.ui.console import err_console
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Generator
+    import cProfile
+
+
+PHASES = ('import', 'load', 'command', 'render', 'save')
+
+DEFAULT_PROFILE_PATH = Path('todo-app.pstats')
+
+DEFAULT_PROFILE_TOP = 20
+
+_timings: dict[str, float] | None = None
+
+_active: set[str] = set()
+
+
+@contextmanager
+def phase(name: str) -> Generator[None]:
+    """Add the time spent in the block to a phase of the ``--timings`` breakdown.
+
+    Does nothing unless timings are enabled (see :func:`start_timings`).
+    A phase entered again from inside itself, e.g. a load calling another
+    load, is counted once.
+
+    Args:
+        name: Phase name, one of :data:`PHASES`.
+    """
+    if _timings is None or name in _active:
+        yield
+        return
+
+    _active.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings[name] += time.perf_counter() - started
+        _active.discard(name)
+
+
+def timed[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so its calls count towards a phase, see :func:`phase`.
+
+    Args:
+        name: Phase name, one of :data:`PHASES`.
+
+    Returns:
+        Callable: Decorator returning a wrapper that only checks a global when timings are disabled.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _timings is None:
+                return func(*args, **kwargs)
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_timings(import_seconds: float) -> float:
+    """Enable the phase breakdown.
+
+    Args:
+        import_seconds: Time spent importing the application before the command started.
+
+    Returns:
+        float: Start time of the command, for :func:`stop_timings`.
+    """
+    global _timings  # noqa: PLW0603
+
+    _timings = dict.fromkeys(PHASES, 0.0)
+    _timings['import'] = import_seconds
+    return time.perf_counter()
+
+
+def stop_timings(started: float) -> dict[str, float]:
+    """Disable the phase breakdown and return it.
+
+    The ``command`` phase is the time of the command not spent in any
+    other phase.
+
+    Args:
+        started: Value returned by :func:`start_timings`.
+
+    Returns:
+        dict[str, float]: Seconds per phase of :data:`PHASES`, plus ``total``.
+    """
+    global _timings  # noqa: PLW0603
+
+    timings = _timings or dict.fromkeys(PHASES, 0.0)
+    _timings = None
+    elapsed = time.perf_counter() - started
+    timings['command'] = max(0.0, elapsed - timings['load'] - timings['render'] - timings['save'])
+    timings['total'] = timings['import'] + elapsed
+    return timings
+
+
+def format_timings(timings: dict[str, float]) -> str:
+    """Format a phase breakdown, one phase per line.
+
+    Args:
+        timings: Seconds per phase, see :func:`stop_timings`.
+
+    Returns:
+        str: Phase names with their time in milliseconds and share of the total.
+    """
+    total = timings['total'] or 1.0
+    return '\n'.join(
+        f'{name:<8} {seconds * 1000:>10.1f} ms {seconds / total:>6.1%}' for name, seconds in timings.items()
+    )
+
+
+def format_profile(profiler: cProfile.Profile, top: int) -> str:
+    """Format the hottest functions of a profile.
+
+    Args:
+        profiler: Stopped profiler.
+        top: Number of functions to list.
+
+    Returns:
+        str: The `top` functions with the highest cumulative time.
+    """
+    import io  # noqa: PLC0415
+    import pstats  # noqa: PLC0415
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue().strip()
+
+
+def profiling_callback(
+    ctx: typer.Context,
+    *,
+    profile: Annotated[bool, typer.Option('--profile', help='Profile the command with cProfile.')] = False,
+    profile_output: Annotated[
+        Path,
+        typer.Option('--profile-output', help='File receiving the profile, readable with pstats.'),
+    ] = DEFAULT_PROFILE_PATH,
+    profile_top: Annotated[
+        int,
+        typer.Option('--profile-top', min=1, help='Number of hot functions to print.'),
+    ] = DEFAULT_PROFILE_TOP,
+    timings: Annotated[
+        bool,
+        typer.Option('--timings', help='Print the time spent importing, loading, running, rendering and saving.'),
+    ] = False,
+    metrics_output: Annotated[
+        Path | None,
+        typer.Option(
+            '--metrics', help='Record hot path metrics into this file: JSON for .json, Prometheus text otherwise.'
+        ),
+    ] = None,
+) -> None:
+    """
+    Apply the global profiling options before any command runs.
+
+    With ``--profile`` the command runs under cProfile; afterwards the
+    profile is written to ``--profile-output`` and the ``--profile-top``
+    hottest functions are printed. With ``--timings`` a breakdown of the run
+    per phase (see :data:`PHASES`) is printed. Reports go to stderr, so the
+    command output is unchanged. With ``--metrics`` the counters and
+    histograms of :mod:`src.metrics.metrics` are recorded and exported when
+    the command ends.
+
+    Args:
+        ctx (typer.Context): Context of the running command. Its ``obj`` is
+            the ``perf_counter`` time at which the application started
+            importing, when known (see ``src.main``).
+        profile (bool): Whether to profile the command.
+        profile_output (Path): File receiving the profile.
+        profile_top (int): Number of hot functions to print.
+        timings (bool): Whether to print the phase breakdown.
+        metrics_output (Path | None): File receiving the metrics.
+    """
+    if metrics_output is not None:
+
+        def export_metrics() -> None:
+            metrics.disable()
+            metrics.export(metrics_output)
+
+        ctx.call_on_close(export_metrics)
+        metrics.enable()
+
+    if profile:
+        import cProfile  # noqa: PLC0415 - only profiled runs pay for the profiler modules
+
+        profiler = cProfile.Profile()
+
+        def report() -> None:
+            profiler.disable()
+            profiler.dump_stats(profile_output)
+            err_console.print(format_profile(profiler, profile_top), markup=False, highlight=False, soft_wrap=True)
+            err_console.print(f'Profile written to {profile_output}', markup=False, highlight=False, soft_wrap=True)
+
+        ctx.call_on_close(report)
+        profiler.enable()
+
+    if timings:
+        import_seconds = time.perf_counter() - ctx.obj if isinstance(ctx.obj, float) else 0.0
+        started = start_timings(import_seconds)
+        ctx.call_on_close(lambda: err_console.print(format_timings(stop_timings(started)), highlight=False))
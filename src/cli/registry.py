@@ -1,10 +1,14 @@
 from typing import TYPE_CHECKING
 
 from src.cli.commands.add_task import add_task
+from src.cli.commands.archive import archive
 from src.cli.commands.flow_update import update_task
+from src.cli.commands.generate import generate
 from src.cli.commands.interactive import interactive
 from src.cli.commands.list_tasks import list_tasks
+from src.cli.commands.recur import recur
 from src.cli.commands.remove_task import remove_task
+from src.cli.commands.stats import stats
 
 
 if TYPE_CHECKING:
@@ -26,3 +30,7 @@ def register_commands(app: Typer) -> None:
     app.command()(remove_task)
     app.command()(interactive)
     app.command()(update_task)
+    app.command()(stats)
+    app.command()(archive)
+    app.command()(recur)
+    app.command()(generate)
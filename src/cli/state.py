@@ -1,9 +1,26 @@
+from datetime import UTC, datetime
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from src.cli.profiling import timed
+from src.metrics import metrics
+from src.storage.archive import ArchiveStore, select_archivable
+from src.storage.atomic import replacing
+from src.storage.compressed import LEVEL_BOUNDS, codec_of, open_compressed, read_compressed, write_compressed
+from src.storage.ndjson import NDJSON_SUFFIX, NdjsonStore
+from src.storage.sharded import ShardedStore
+from src.todo_list.streaming import write_tasks
 from src.todo_list.todo_list import TodoList
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from src.enums.status_enum import StatusEnum
+    from src.task.task import Todo
+
+
 def get_storage_path() -> Path:
     """
     Retrieve the configured storage file path.
@@ -23,12 +40,111 @@ def get_storage_path() -> Path:
     return Path(configured_path).expanduser()
 
 
+def get_load_workers() -> int:
+    """
+    Retrieve the number of workers used to parse the storage file.
+
+    The value is read from the optional environment variable
+    `STORAGE_LOAD_WORKERS`. Parallel loading is opt-in and pays off only
+    for large stores, so a single worker is used by default.
+
+    Returns:
+        int: Number of workers, at least 1.
+
+    Raises:
+        ValueError: If the environment variable is not an integer.
+    """
+    configured: str | None = os.getenv('STORAGE_LOAD_WORKERS')
+    if not configured:
+        return 1
+
+    try:
+        return max(1, int(configured))
+    except ValueError as e:
+        raise ValueError('Load workers configuration is invalid.') from e
+
+
+def get_compression_level() -> int | None:
+    """
+    Retrieve the compression level of a compressed storage file.
+
+    The value is read from the optional environment variable
+    `STORAGE_COMPRESSION_LEVEL` and must fit the codec selected by the
+    storage file suffix (``.json.gz``, ``.json.zst`` or ``.json.xz``).
+
+    Returns:
+        int | None: Compression level, or None for the codec default.
+
+    Raises:
+        ValueError: If the value is not an integer or out of the codec range.
+    """
+    configured: str | None = os.getenv('STORAGE_COMPRESSION_LEVEL')
+    if not configured:
+        return None
+
+    try:
+        level = int(configured)
+    except ValueError as e:
+        raise ValueError('Compression level configuration is invalid.') from e
+
+    codec = codec_of(get_storage_path())
+    if codec is not None:
+        low, high = LEVEL_BOUNDS[codec]
+        if not low <= level <= high:
+            raise ValueError('Compression level configuration is invalid.')
+
+    return level
+
+
+_sharded_store: ShardedStore | None = None
+
+
+def get_sharded_store() -> ShardedStore:
+    """
+    Get the sharded store for a directory storage path.
+
+    When `STORAGE_PATH_ENV` points to a directory, tasks are kept in one file
+    per shard. The shard key is read from the optional environment variable
+    `STORAGE_SHARD_KEY` (``status`` by default, or ``hash``).
+
+    Returns:
+        ShardedStore: Store bound to the configured directory.
+
+    Raises:
+        ValueError: If the shard key is unknown.
+    """
+    global _sharded_store  # noqa: PLW0603
+
+    if _sharded_store is None:
+        _sharded_store = ShardedStore(get_storage_path(), os.getenv('STORAGE_SHARD_KEY') or 'status')
+
+    return _sharded_store
+
+
+def _load_shards(shards: Iterable[str] | None = None) -> TodoList:
+    try:
+        return get_sharded_store().load(shards)
+    except OSError as e:
+        raise ValueError('Data storage can not read.') from e
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid data storage.') from e
+
+
+@timed('load')
+@metrics.LOAD_SECONDS.timed
 def load_todo_list() -> TodoList:
     """
     Load the TodoList from the configured storage file.
 
     The function reads the file content, validates it, and deserializes
-    it into a TodoList object.
+    it into a TodoList object. A directory storage path is loaded as a
+    sharded store (see `get_sharded_store`), a ``.json.gz``,
+    ``.json.zst`` or ``.json.xz`` file is decompressed while reading and
+    a ``.ndjson`` file is read line by line (see `NdjsonStore`).
+    The store is written by this application, so tasks are built on the
+    trusted path that skips field validation and normalization. A plain
+    JSON file is decoded incrementally (see `TodoList.load_stream`); with
+    more than one load worker it is read as a whole and parsed in parallel.
 
     Returns:
         TodoList: Loaded todo list instance.
@@ -44,6 +160,35 @@ def load_todo_list() -> TodoList:
     if not storage_path.exists():
         raise ValueError('Data storage is not exists.')
 
+    if metrics.enabled:
+        metrics.LOAD_BYTES.inc(_store_bytes(storage_path))
+
+    if storage_path.is_dir():
+        return _load_shards()
+
+    if codec_of(storage_path) is not None:
+        return _load_compressed(storage_path)
+
+    if storage_path.suffix == NDJSON_SUFFIX:
+        return _load_ndjson(storage_path)
+
+    workers = get_load_workers()
+    if workers > 1:
+        return _load_parallel(storage_path, workers)
+
+    if not storage_path.stat().st_size:
+        raise ValueError('Data storage is invalid.')
+
+    try:
+        with storage_path.open(encoding='utf-8') as fp:
+            return TodoList.load_stream(fp, trusted=True)
+    except OSError as e:
+        raise ValueError('Data storage can not read.') from e
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid data storage.') from e
+
+
+def _load_parallel(storage_path: Path, workers: int) -> TodoList:
     try:
         raw = storage_path.read_text(encoding='utf-8')
     except OSError as e:
@@ -53,23 +198,112 @@ def load_todo_list() -> TodoList:
         raise ValueError('Data storage is invalid.')
 
     try:
-        return TodoList.from_json(raw)
+        return TodoList.from_json(raw, workers=workers, trusted=True)
 
     except (ValueError, TypeError) as e:
         raise ValueError('Invalid data storage.') from e
 
 
+def _load_ndjson(storage_path: Path, limit: int | None = None) -> TodoList:
+    try:
+        return NdjsonStore(storage_path).load(limit)
+    except OSError as e:
+        raise ValueError('Data storage can not read.') from e
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid data storage.') from e
+
+
+def _load_compressed(storage_path: Path) -> TodoList:
+    try:
+        return read_compressed(storage_path, workers=get_load_workers())
+    except OSError as e:
+        raise ValueError('Data storage can not read.') from e
+    except (ValueError, TypeError) as e:
+        raise ValueError('Invalid data storage.') from e
+
+
 _todo_list: TodoList | None = None
 
 
+@timed('save')
+@metrics.SAVE_SECONDS.timed
 def save_todo_list() -> None:
     """
     Persist the current TodoList to the storage file.
 
-    The data is serialized to JSON and written using UTF-8 encoding.
+    The data is streamed as compact JSON in UTF-8 encoding, chunk by chunk
+    (see `TodoList.dump`), into a temporary file that replaces the store
+    once complete, so an interrupted save leaves the previous store intact
+    (see `replacing`).
+    For a sharded store only the shards whose content changed are rewritten.
+    A compressed storage file is written minified and compressed with the
+    level from `get_compression_level`. A ``.ndjson`` file is rewritten
+    with one task per line together with its offset index.
+    When `ARCHIVE_AFTER_DAYS` is configured, old completed tasks are moved
+    to the archive first (see `archive_tasks`).
     """
+    archive_after_days = get_archive_after_days()
+    if archive_after_days is not None:
+        archive_tasks(get_todo_list(), archive_after_days)
+
     storage_path = get_storage_path()
-    storage_path.write_text(get_todo_list().to_json(indent=4), encoding='utf-8')
+
+    if storage_path.is_dir():
+        get_sharded_store().save(get_todo_list())
+    elif codec_of(storage_path) is not None:
+        write_compressed(storage_path, get_todo_list(), level=get_compression_level())
+    elif storage_path.suffix == NDJSON_SUFFIX:
+        NdjsonStore(storage_path).write(get_todo_list())
+    else:
+        with replacing(storage_path) as temp, temp.open('w', encoding='utf-8') as fp:
+            get_todo_list().dump(fp)
+
+    if metrics.enabled:
+        metrics.SAVE_BYTES.inc(_store_bytes(storage_path))
+
+
+def _store_bytes(storage_path: Path) -> int:
+    """Size of a storage file, or of all files of a sharded store."""
+    if storage_path.is_dir():
+        return sum(path.stat().st_size for path in storage_path.iterdir() if path.is_file())
+    return storage_path.stat().st_size
+
+
+def export_tasks(path: Path, tasks: Iterable[Todo]) -> int:
+    """
+    Stream tasks to a storage file without building a TodoList.
+
+    The format follows the file name as for the configured store: a
+    ``.json.gz``, ``.json.zst`` or ``.json.xz`` file is compressed with
+    the codec default level, a ``.ndjson`` file is written with its offset
+    index and any other file as plain JSON. Tasks are consumed one chunk
+    at a time, so any number of them is written in constant memory.
+    Existing files are replaced.
+
+    Args:
+        path (Path): Storage file to write.
+        tasks (Iterable[Todo]): Tasks to write, in order.
+
+    Returns:
+        int: Number of written tasks.
+
+    Raises:
+        ValueError: If the path is a directory; sharded stores are not supported.
+    """
+    if path.is_dir():
+        raise ValueError('Tasks can not be streamed to a sharded store.')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if codec_of(path) is not None:
+        with replacing(path) as temp, open_compressed(temp) as fp:
+            return write_tasks(fp, tasks)
+
+    if path.suffix == NDJSON_SUFFIX:
+        return NdjsonStore(path).write(tasks)
+
+    with replacing(path) as temp, temp.open('w', encoding='utf-8') as fp:
+        return write_tasks(fp, tasks)
 
 
 def get_todo_list() -> TodoList:
@@ -85,3 +319,188 @@ def get_todo_list() -> TodoList:
         _todo_list = load_todo_list()
 
     return _todo_list
+
+
+@timed('load')
+def load_tasks_with_status(statuses: Iterable[StatusEnum]) -> TodoList:
+    """
+    Get the tasks having one of the given statuses, for read-only use.
+
+    With a store sharded by status that has not been loaded yet, only the
+    matching shards are read, so e.g. listing active tasks never reads the
+    completed shard. Otherwise the full todo list is filtered.
+
+    Args:
+        statuses (Iterable[StatusEnum]): Accepted statuses.
+
+    Returns:
+        TodoList: New TodoList with the matching tasks.
+    """
+    wanted = set(statuses)
+
+    if _todo_list is None and get_storage_path().is_dir() and get_sharded_store().shard_key == 'status':
+        return _load_shards(sorted(status.value for status in wanted))
+
+    return TodoList(task for task in get_todo_list() if task.status in wanted)
+
+
+@timed('load')
+def load_first_tasks(limit: int) -> TodoList:
+    """
+    Get the first tasks of the store, for read-only use.
+
+    With an NDJSON store that has not been loaded yet, only the first
+    `limit` lines are read. Otherwise the full todo list is sliced.
+
+    Args:
+        limit (int): Maximum number of tasks.
+
+    Returns:
+        TodoList: New TodoList with at most `limit` tasks, in store order.
+    """
+    storage_path = get_storage_path()
+
+    if _todo_list is None and storage_path.suffix == NDJSON_SUFFIX and storage_path.is_file():
+        return _load_ndjson(storage_path, limit)
+
+    return TodoList(get_todo_list().tasks[:limit])
+
+
+def append_task(task: Todo) -> None:
+    """
+    Add a new task to the todo list and persist it.
+
+    With an NDJSON store that has not been loaded yet, the task is appended
+    to the file and its index without reading or rewriting the store.
+    Otherwise, and whenever `ARCHIVE_AFTER_DAYS` is configured (the policy
+    needs the whole list, see `save_todo_list`), the task is added to the
+    in-memory list, which is then saved.
+
+    Args:
+        task (Todo): The new task.
+
+    Raises:
+        ValueError: If the task's UUID already exists in the loaded list.
+    """
+    storage_path = get_storage_path()
+
+    if (
+        _todo_list is None
+        and storage_path.suffix == NDJSON_SUFFIX
+        and storage_path.is_file()
+        and get_archive_after_days() is None
+    ):
+        NdjsonStore(storage_path).append([task])
+        return
+
+    get_todo_list().add(task)
+    save_todo_list()
+
+
+def get_archive_path() -> Path:
+    """
+    Retrieve the archive file path.
+
+    The path is read from the optional environment variable
+    `STORAGE_ARCHIVE_PATH`. By default the archive sits next to the storage
+    file (``<name>.archive.ndjson.gz``) or inside the sharded store directory
+    (``archive.ndjson.gz``).
+
+    Returns:
+        Path: Path of the compressed archive.
+    """
+    configured_path: str | None = os.getenv('STORAGE_ARCHIVE_PATH')
+    if configured_path:
+        return Path(configured_path).expanduser()
+
+    storage_path = get_storage_path()
+    if storage_path.is_dir():
+        return storage_path / 'archive.ndjson.gz'
+
+    name = storage_path.name.removesuffix(storage_path.suffix) if codec_of(storage_path) else storage_path.name
+    return storage_path.with_name(f'{Path(name).stem}.archive.ndjson.gz')
+
+
+def get_archive_after_days() -> int | None:
+    """
+    Retrieve the automatic archiving policy.
+
+    The value is read from the optional environment variable `ARCHIVE_AFTER_DAYS`.
+
+    Returns:
+        int | None: Age in days after which completed tasks are archived on save,
+        or None when automatic archiving is disabled.
+
+    Raises:
+        ValueError: If the environment variable is not a non-negative integer.
+    """
+    configured: str | None = os.getenv('ARCHIVE_AFTER_DAYS')
+    if not configured:
+        return None
+
+    try:
+        days = int(configured)
+    except ValueError as e:
+        raise ValueError('Archive policy configuration is invalid.') from e
+
+    if days < 0:
+        raise ValueError('Archive policy configuration is invalid.')
+
+    return days
+
+
+def archive_tasks(todo_list: TodoList, older_than_days: int) -> list[Todo]:
+    """
+    Move old completed tasks from a todo list to the archive.
+
+    The tasks are appended to the archive before they are removed from the
+    list; the caller is responsible for saving the list afterwards.
+
+    Args:
+        todo_list (TodoList): Hot todo list to shrink.
+        older_than_days (int): Minimum age in days of archived tasks.
+
+    Returns:
+        list[Todo]: The archived tasks.
+    """
+    today = datetime.now(tz=UTC).date()
+    archived = select_archivable(todo_list, older_than_days=older_than_days, today=today)
+
+    if archived:
+        ArchiveStore(get_archive_path()).append(archived)
+        archived_ids = {task.idx_int for task in archived}
+        todo_list.tasks = [task for task in todo_list if task.idx_int not in archived_ids]
+
+    return archived
+
+
+def with_archived_tasks(todo_list: TodoList, statuses: Iterable[StatusEnum] | None = None) -> TodoList:
+    """
+    Extend a todo list with the archived tasks, for read-only use.
+
+    The archive is read only here. Archived tasks already present in the
+    list (e.g. after an interrupted archiving run) are skipped.
+
+    Args:
+        todo_list (TodoList): Hot tasks.
+        statuses (Iterable[StatusEnum] | None): Accepted statuses of archived tasks; all when omitted.
+
+    Returns:
+        TodoList: New TodoList with the hot tasks followed by the archived ones.
+
+    Raises:
+        ValueError: If the archive cannot be read or is invalid.
+    """
+    wanted = None if statuses is None else set(statuses)
+    known = {task.idx_int for task in todo_list}
+
+    try:
+        archived = [
+            task
+            for task in ArchiveStore(get_archive_path()).iter_tasks()
+            if task.idx_int not in known and (wanted is None or task.status in wanted)
+        ]
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        raise ValueError('Invalid archive storage.') from e
+
+    return TodoList([*todo_list, *archived])
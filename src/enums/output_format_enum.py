@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class OutputFormatEnum(StrEnum):
+    TABLE = 'table'
+    PLAIN = 'plain'
+    TSV = 'tsv'
+    CSV = 'csv'
+    JSON = 'json'
+    NDJSON = 'ndjson'
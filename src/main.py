@@ -1,11 +1,18 @@
-import typer
+from time import perf_counter
 
-from src.cli.registry import register_commands
+
+IMPORT_STARTED = perf_counter()
+
+import typer  # noqa: E402
+
+from src.cli.profiling import profiling_callback  # noqa: E402
+from src.cli.registry import register_commands  # noqa: E402
 
 
 app = typer.Typer(name='todo-app', help='A professional Todo CLI application')
 
+app.callback()(profiling_callback)
 register_commands(app)
 
 if __name__ == '__main__':
-    app()
+    app(obj=IMPORT_STARTED)
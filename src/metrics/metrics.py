@@ -0,0 +1,210 @@
+from bisect import bisect_left
+import functools
+import json
+import time
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+enabled = False
+
+_instruments: dict[str, Counter | Histogram] = {}
+
+
+class Counter:
+    """Monotonic total, e.g. of bytes read or rows scanned."""
+
+    __slots__ = ('help', 'name', 'value')
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str) -> None:
+        """Create the counter and register it for export.
+
+        Args:
+            name: Prometheus metric name, ending in ``_total`` by convention.
+            help_text: One line description.
+
+        Raises:
+            ValueError: If a metric with this name already exists.
+        """
+        _register(name, self)
+        self.name = name
+        self.help = help_text
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Add `amount` to the total."""
+        self.value += amount
+
+    def reset(self) -> None:
+        self.value = 0
+
+    def snapshot(self) -> float:
+        return self.value
+
+    def prometheus_lines(self) -> list[str]:
+        return [f'{self.name} {self.value}']
+
+
+class Histogram:
+    """Distribution of observed values, e.g. durations in seconds, over fixed buckets."""
+
+    __slots__ = ('buckets', 'count', 'counts', 'help', 'name', 'sum')
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Create the histogram and register it for export.
+
+        Args:
+            name: Prometheus metric name.
+            help_text: One line description.
+            buckets: Sorted upper bounds of the buckets, ``+Inf`` is implied.
+
+        Raises:
+            ValueError: If a metric with this name already exists.
+        """
+        _register(name, self)
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def timed[**P, R](self, func: Callable[P, R]) -> Callable[P, R]:
+        """Decorate a function to observe the duration of its calls while metrics are enabled.
+
+        Args:
+            func: Function to time.
+
+        Returns:
+            Callable: Wrapper that only checks :data:`enabled` when metrics are disabled.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(time.perf_counter() - started)
+
+        return wrapper
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def _cumulative_counts(self) -> list[tuple[str, int]]:
+        counts, cumulative = [], 0
+        for bound, count in zip((*self.buckets, None), self.counts, strict=True):
+            cumulative += count
+            counts.append(('+Inf' if bound is None else f'{bound:g}', cumulative))
+        return counts
+
+    def snapshot(self) -> dict[str, object]:
+        return {'count': self.count, 'sum': self.sum, 'buckets': dict(self._cumulative_counts())}
+
+    def prometheus_lines(self) -> list[str]:
+        lines = [f'{self.name}_bucket{{le="{bound}"}} {count}' for bound, count in self._cumulative_counts()]
+        lines.extend((f'{self.name}_sum {self.sum}', f'{self.name}_count {self.count}'))
+        return lines
+
+
+def _register(name: str, instrument: Counter | Histogram) -> None:
+    if name in _instruments:
+        raise ValueError(f'Metric {name} is already registered.')
+    _instruments[name] = instrument
+
+
+def enable() -> None:
+    """Start recording; instrumented code checks :data:`enabled` before doing any work."""
+    global enabled  # noqa: PLW0603
+
+    enabled = True
+
+
+def disable() -> None:
+    """Stop recording, the recorded values are kept until :func:`reset`."""
+    global enabled  # noqa: PLW0603
+
+    enabled = False
+
+
+def reset() -> None:
+    """Clear the recorded values of all metrics."""
+    for instrument in _instruments.values():
+        instrument.reset()
+
+
+def snapshot() -> dict[str, object]:
+    """Current values of all metrics.
+
+    Returns:
+        dict[str, object]: Counter totals, and count, sum and cumulative bucket
+        counts of histograms, keyed by metric name.
+    """
+    return {name: instrument.snapshot() for name, instrument in _instruments.items()}
+
+
+def to_prometheus() -> str:
+    """Render all metrics in the Prometheus text exposition format.
+
+    Returns:
+        str: Text suitable for a node exporter textfile collector.
+    """
+    lines: list[str] = []
+    for instrument in _instruments.values():
+        lines.extend((f'# HELP {instrument.name} {instrument.help}', f'# TYPE {instrument.name} {instrument.kind}'))
+        lines.extend(instrument.prometheus_lines())
+    return '\n'.join(lines) + '\n'
+
+
+def export(path: Path) -> None:
+    """Write all metrics to a file, as a JSON snapshot for ``.json`` files and as Prometheus text otherwise.
+
+    Args:
+        path: Destination file, e.g. ``todo.prom`` or ``metrics.json``.
+    """
+    if path.suffix == '.json':
+        path.write_text(json.dumps(snapshot(), indent=2), encoding='utf-8')
+    else:
+        path.write_text(to_prometheus(), encoding='utf-8')
+
+
+LOAD_SECONDS = Histogram('todo_load_seconds', 'Duration of loading the store.')
+
+LOAD_BYTES = Counter('todo_load_bytes_total', 'Size of the store files at each load.')
+
+SAVE_SECONDS = Histogram('todo_save_seconds', 'Duration of saving the store, archive policy included.')
+
+SAVE_BYTES = Counter('todo_save_bytes_total', 'Size of the store files after each save.')
+
+DECODE_SECONDS = Histogram('todolist_decode_seconds', 'Duration of TodoList.from_json and TodoList.load_stream.')
+
+DECODED_RECORDS = Counter('todolist_decoded_records_total', 'Tasks built by TodoList.from_json and load_stream.')
+
+UNIQUE_IDS_CALLS = Counter('todolist_unique_ids_calls_total', 'Calls of the TodoList uniqueness check.')
+
+UNIQUE_IDS_TASKS = Counter('todolist_unique_ids_tasks_total', 'Tasks indexed by the TodoList uniqueness check.')
+
+FILTER_SCANNED = Counter('todolist_filter_scanned_total', 'Tasks scanned by TodoList.filter_by.')
+
+FILTER_RETURNED = Counter('todolist_filter_returned_total', 'Tasks returned by TodoList.filter_by.')
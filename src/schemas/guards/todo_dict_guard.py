@@ -21,11 +21,16 @@ def is_todo_dict(obj: object) -> TypeGuard[TodoDict]:
         'idx': str,
     }
 
-    if set(required_keys) != set(obj):
+    optional_keys: dict[str, type[object]] = {
+        'recurrence': str,
+    }
+
+    keys = set(obj)
+    if not set(required_keys) <= keys <= set(required_keys) | set(optional_keys):
         return False
 
-    for key, expected_type in required_keys.items():
-        if not isinstance(data[key], expected_type):
+    for key, expected_type in (required_keys | optional_keys).items():
+        if key in data and not isinstance(data[key], expected_type):
             return False
 
     tags = data['tags']
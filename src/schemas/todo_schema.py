@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class TodoDict(TypedDict):
@@ -9,3 +9,4 @@ class TodoDict(TypedDict):
     tags: list[str]
     status: str
     idx: str
+    recurrence: NotRequired[str]
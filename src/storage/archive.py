@@ -0,0 +1,86 @@
+from compression import gzip
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from datetime import date
+    from pathlib import Path
+
+
+class ArchiveStore:
+    """Cold storage for archived tasks.
+
+    The archive is a gzip compressed file with one serialized task per line.
+    Every archiving run appends a new gzip member instead of rewriting the
+    file, so archiving costs time proportional to the archived tasks only.
+    The archive is read only on demand.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the archive.
+
+        Args:
+            path: Path of the archive file. It is created on first append.
+        """
+        self.path = path
+
+    def append(self, tasks: Iterable[Todo]) -> int:
+        """Append tasks to the archive.
+
+        Args:
+            tasks: Tasks to archive.
+
+        Returns:
+            int: Number of archived tasks.
+        """
+        count = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, 'at', encoding='utf-8') as fp:
+            for task in tasks:
+                task.write_json(fp)
+                fp.write('\n')
+                count += 1
+
+        return count
+
+    def iter_tasks(self) -> Iterator[Todo]:
+        """Stream archived tasks in archiving order.
+
+        Yields:
+            Todo: Archived tasks. Nothing when the archive does not exist.
+
+        Raises:
+            TypeError: If a line is not a valid serialized task.
+        """
+        if not self.path.exists():
+            return
+
+        with gzip.open(self.path, 'rt', encoding='utf-8') as fp:
+            for line in fp:
+                if line.strip():
+                    yield Todo.from_json(line, trusted=True)
+
+
+def select_archivable(tasks: Iterable[Todo], *, older_than_days: int, today: date) -> list[Todo]:
+    """Select completed tasks that are old enough to be archived.
+
+    Tasks carry no completion timestamp, so their age is measured from
+    `created_at`.
+
+    Args:
+        tasks: Candidate tasks.
+        older_than_days: Minimum age in days.
+        today: Reference date.
+
+    Returns:
+        list[Todo]: Completed tasks created more than `older_than_days` days before `today`.
+    """
+    cutoff = today - timedelta(days=older_than_days)
+
+    return [task for task in tasks if task.status == StatusEnum.COMPLETED and task.created_at.date() < cutoff]
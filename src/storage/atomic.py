@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Generator
+
+
+TEMP_PREFIX = '.tmp-'
+
+
+def _new_file_mode() -> int:
+    # mkstemp creates the file private to the user; a replaced store keeps
+    # its mode and a new one gets the mode open() would have given it.
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextmanager
+def replacing(path: Path) -> Generator[Path]:
+    """Write a file through a temporary sibling that replaces it at the end.
+
+    The block writes to the yielded path, a hidden file next to `path`
+    whose name ends with the name of `path`, so suffix based formats (e.g.
+    ``.json.gz``) are kept. When the block completes, the temporary file
+    atomically replaces `path`; when it raises, including on
+    ``KeyboardInterrupt``, the temporary file is removed and `path` keeps
+    its previous content. The file keeps its permissions.
+
+    Args:
+        path: File to replace.
+
+    Yields:
+        Path: Temporary file to write.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX, suffix=f'-{path.name}')
+    os.close(fd)
+    temp = Path(name)
+    try:
+        temp.chmod(path.stat().st_mode if path.exists() else _new_file_mode())
+        yield temp
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+    temp.replace(path)
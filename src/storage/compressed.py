@@ -0,0 +1,131 @@
+from compression import gzip, lzma, zstd
+import json
+from typing import TYPE_CHECKING
+
+from src.storage.atomic import replacing
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import TextIO
+
+
+LEVEL_BOUNDS: dict[str, tuple[int, int]] = {
+    '.gz': (0, 9),
+    '.xz': (0, 9),
+    '.zst': zstd.CompressionParameter.compression_level.bounds(),
+}
+
+DEFAULT_LEVELS: dict[str, int] = {
+    '.gz': 6,
+    '.xz': 6,
+    '.zst': zstd.COMPRESSION_LEVEL_DEFAULT,
+}
+
+
+def codec_of(path: Path) -> str | None:
+    """Detect the compression codec of a JSON store from its file name.
+
+    Args:
+        path: Storage file path.
+
+    Returns:
+        str | None: ``.gz``, ``.zst`` or ``.xz`` for ``*.json.gz``, ``*.json.zst``
+        and ``*.json.xz`` files, None for anything else.
+    """
+    suffixes = path.suffixes
+    if len(suffixes) >= 2 and suffixes[-2] == '.json' and suffixes[-1] in LEVEL_BOUNDS:
+        return suffixes[-1]
+    return None
+
+
+def read_compressed(path: Path, *, workers: int = 1) -> TodoList:
+    """Load a compressed JSON store.
+
+    Args:
+        path: Storage file path with a compressed suffix.
+        workers: Number of workers parsing the tasks, see :meth:`TodoList.from_dict`.
+
+    Returns:
+        TodoList: The loaded tasks.
+
+    Raises:
+        ValueError: If the file is not a compressed store.
+        ValueError: If the file is corrupted or its content is not valid.
+        TypeError: If the content has an invalid structure.
+    """
+    match codec_of(path):
+        case '.gz':
+            fp = gzip.open(path, 'rt', encoding='utf-8')
+        case '.xz':
+            fp = lzma.open(path, 'rt', encoding='utf-8')
+        case '.zst':
+            fp = zstd.open(path, 'rt', encoding='utf-8')
+        case _:
+            raise ValueError(f'Not a compressed store: {path.name}.')
+
+    try:
+        with fp:
+            if workers > 1:
+                return TodoList.from_json(fp.read(), workers=workers, trusted=True)
+            return TodoList.load_stream(fp, trusted=True)
+    except (gzip.BadGzipFile, lzma.LZMAError, zstd.ZstdError, EOFError) as e:
+        raise ValueError(f'Corrupted compressed store: {path.name}.') from e
+
+
+def _require_codec(path: Path) -> str:
+    codec = codec_of(path)
+    if codec is None:
+        raise ValueError(f'Not a compressed store: {path.name}.')
+    return codec
+
+
+def open_compressed(path: Path, *, level: int | None = None) -> TextIO:
+    """Open a compressed JSON store for writing text.
+
+    Args:
+        path: Storage file path with a compressed suffix.
+        level: Compression level, see :data:`LEVEL_BOUNDS`. Defaults to :data:`DEFAULT_LEVELS`.
+
+    Returns:
+        TextIO: Writable text stream compressing into `path`.
+
+    Raises:
+        ValueError: If the file is not a compressed store.
+    """
+    codec = _require_codec(path)
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    match codec:
+        case '.gz':
+            return gzip.open(path, 'wt', compresslevel=level, encoding='utf-8')
+        case '.xz':
+            return lzma.open(path, 'wt', preset=level, encoding='utf-8')
+        case _:
+            return zstd.open(path, 'wt', level=level, encoding='utf-8')
+
+
+def write_compressed(path: Path, todo_list: TodoList, *, level: int | None = None, indent: int | None = None) -> None:
+    """Save tasks to a compressed JSON store.
+
+    The JSON is encoded and compressed chunk by chunk, so the uncompressed
+    document is never held in memory as a whole. The file is replaced only
+    once it is complete (see :func:`~src.storage.atomic.replacing`).
+    Compressed stores are written minified by default, indentation only adds
+    redundant bytes.
+
+    Args:
+        path: Storage file path with a compressed suffix.
+        todo_list: Tasks to save.
+        level: Compression level, see :data:`LEVEL_BOUNDS`. Defaults to :data:`DEFAULT_LEVELS`.
+        indent: JSON indentation, None for minified output.
+
+    Raises:
+        ValueError: If the file is not a compressed store.
+    """
+    _require_codec(path)
+    with replacing(path) as temp, open_compressed(temp, level=level) as fp:
+        if indent is None:
+            todo_list.dump(fp)
+        else:
+            json.dump(todo_list.to_dict(), fp, ensure_ascii=False, indent=indent)
@@ -0,0 +1,226 @@
+from itertools import islice
+import struct
+from typing import TYPE_CHECKING
+
+from src.storage.atomic import replacing
+from src.task.task import Todo
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from typing import BinaryIO
+    from uuid import UUID
+
+
+NDJSON_SUFFIX = '.ndjson'
+
+INDEX_SUFFIX = '.idx'
+
+_HEADER = struct.Struct('<Q')
+
+_ENTRY = struct.Struct('<16sQ')
+
+
+class NdjsonStore:
+    """Newline-delimited JSON store with a sidecar offset index.
+
+    Every line of the data file holds one serialized task, so tasks can be
+    read one by one and new tasks are appended without rewriting the file.
+    The sidecar index (``<name>.ndjson.idx``) holds one fixed-size entry per
+    line, the task id and the byte offset of the line, after a header with
+    the size of the data file it describes. Lookups by position or id read a
+    single index entry or scan the index bytes, then seek straight to one
+    line. An index that does not match the data file, e.g. after the file
+    was edited by hand, is rebuilt from the data file on first use.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            path: Path of the data file. It is created on first write or append.
+        """
+        self.path = path
+        self.index_path = path.with_name(f'{path.name}{INDEX_SUFFIX}')
+
+    def iter_tasks(self, limit: int | None = None) -> Iterator[Todo]:
+        """Stream tasks in file order.
+
+        Args:
+            limit: Maximum number of lines to read, all lines when None.
+
+        Yields:
+            Todo: Stored tasks.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+            TypeError: If a line is not a serialized task.
+        """
+        with self.path.open('rb') as fp:
+            for line in islice(fp, limit):
+                if line.strip():
+                    yield Todo.from_json(line.decode('utf-8'), trusted=True)
+
+    def load(self, limit: int | None = None) -> TodoList:
+        """Load the stored tasks.
+
+        Args:
+            limit: Maximum number of lines to read, all lines when None.
+
+        Returns:
+            TodoList: The tasks, in file order.
+
+        Raises:
+            ValueError: If a line is invalid or duplicate Todo UUIDs are found.
+            TypeError: If a line is not a serialized task.
+        """
+        return TodoList(self.iter_tasks(limit))
+
+    def write(self, tasks: Iterable[Todo]) -> int:
+        """Replace the stored tasks and rebuild the index.
+
+        Tasks are consumed lazily and both files are written as they come,
+        so an iterator of any length is written in constant memory. They are
+        written to temporary files that replace the store once complete.
+
+        Args:
+            tasks: Tasks to store.
+
+        Returns:
+            int: Number of stored tasks.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The data file replaces the old one before the index does: an index
+        # left behind describes another data size and is rebuilt on use.
+        with (
+            replacing(self.index_path) as index_temp,
+            replacing(self.path) as data_temp,
+            data_temp.open('wb') as data,
+            index_temp.open('wb') as index,
+        ):
+            index.write(_HEADER.pack(0))
+            count = self._write_lines(data, index, tasks)
+            index.seek(0)
+            index.write(_HEADER.pack(data.tell()))
+
+        return count
+
+    def append(self, tasks: Iterable[Todo]) -> int:
+        """Append tasks to the end of the store.
+
+        Costs time proportional to the appended tasks only: the data file
+        and the index are extended, never rewritten.
+
+        Args:
+            tasks: Tasks to append.
+
+        Returns:
+            int: Number of appended tasks.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_index()
+        with self.path.open('ab') as data, self.index_path.open('r+b') as index:
+            index.seek(0, 2)
+            count = self._write_lines(data, index, tasks)
+            index.seek(0)
+            index.write(_HEADER.pack(data.tell()))
+
+        return count
+
+    def __len__(self) -> int:
+        self._ensure_index()
+        return (self.index_path.stat().st_size - _HEADER.size) // _ENTRY.size
+
+    def __getitem__(self, position: int) -> Todo:
+        """Read the task at a position without reading the other lines.
+
+        Args:
+            position: Position of the task, negative values count from the end.
+
+        Returns:
+            Todo: The task.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        size = len(self)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError('Task position out of range.')
+
+        with self.index_path.open('rb') as fp:
+            fp.seek(_HEADER.size + position * _ENTRY.size)
+            _, offset = _ENTRY.unpack(fp.read(_ENTRY.size))
+
+        return self._read_line(offset)
+
+    def get(self, idx: UUID) -> Todo:
+        """Read the task with the given id without reading the other lines.
+
+        Args:
+            idx: Id of the task.
+
+        Returns:
+            Todo: The task.
+
+        Raises:
+            ValueError: If no task with the given UUID exists.
+        """
+        self._ensure_index()
+        entries = self.index_path.read_bytes()[_HEADER.size :]
+        key = idx.int.to_bytes(16)
+
+        start = entries.find(key)
+        while start != -1 and start % _ENTRY.size:
+            start = entries.find(key, start + 1)
+        if start == -1:
+            raise ValueError(f'Task with idx: {idx} not found.')
+
+        _, offset = _ENTRY.unpack_from(entries, start)
+        return self._read_line(offset)
+
+    def _read_line(self, offset: int) -> Todo:
+        with self.path.open('rb') as fp:
+            fp.seek(offset)
+            return Todo.from_json(fp.readline().decode('utf-8'), trusted=True)
+
+    @staticmethod
+    def _write_lines(data: BinaryIO, index: BinaryIO, tasks: Iterable[Todo]) -> int:
+        """Write one line per task and its index entry; the index header is left to the caller."""
+        offset = data.tell()
+        count = 0
+        for task in tasks:
+            line = f'{task.to_json()}\n'.encode()
+            index.write(_ENTRY.pack(task.idx_int.to_bytes(16), offset))
+            data.write(line)
+            offset += len(line)
+            count += 1
+        return count
+
+    def _write_index(self, size: int, entries: list[bytes]) -> None:
+        with self.index_path.open('wb') as fp:
+            fp.write(_HEADER.pack(size))
+            fp.write(b''.join(entries))
+
+    def _ensure_index(self) -> None:
+        """Rebuild the index when it is missing or describes another version of the data file."""
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self.index_path.exists():
+            with self.index_path.open('rb') as fp:
+                header = fp.read(_HEADER.size)
+            if len(header) == _HEADER.size and _HEADER.unpack(header)[0] == size:
+                return
+
+        entries = []
+        if size:
+            offset = 0
+            with self.path.open('rb') as fp:
+                for line in fp:
+                    if line.strip():
+                        task = Todo.from_json(line.decode('utf-8'), trusted=True)
+                        entries.append(_ENTRY.pack(task.idx_int.to_bytes(16), offset))
+                    offset += len(line)
+        self._write_index(size, entries)
@@ -0,0 +1,174 @@
+from typing import TYPE_CHECKING
+
+from src.storage.atomic import TEMP_PREFIX, replacing
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from src.task.task import Todo
+
+
+SHARD_KEYS: dict[str, Callable[[Todo], str]] = {
+    'status': lambda task: task.status.value,
+    'hash': lambda task: task.idx_str[0],
+}
+
+SHARD_SUFFIX = '.json'
+
+
+class ShardedStore:
+    """Todo storage split into several JSON files (shards) in one directory.
+
+    Every task belongs to exactly one shard chosen by a shard key:
+
+    * ``status`` - one shard per status (``todo.json``, ``completed.json``, ...),
+      so completed tasks sit apart from active work;
+    * ``hash`` - sixteen shards by the first hex digit of the task UUID.
+
+    The store remembers which task ids every loaded shard contained and
+    follows changes of the loaded tasks, so :meth:`save` rewrites only the
+    shards whose content changed. Shards can be loaded selectively; saving
+    into a shard that was not loaded merges with its content on disk, which
+    is then repeated on every save until the shard is loaded.
+    """
+
+    def __init__(self, directory: Path, shard_key: str = 'status') -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the shard files.
+            shard_key: Name of the shard key, see :data:`SHARD_KEYS`.
+
+        Raises:
+            ValueError: If the shard key is unknown.
+        """
+        if shard_key not in SHARD_KEYS:
+            raise ValueError(f'Unknown shard key: {shard_key}. Available: {", ".join(SHARD_KEYS)}.')
+
+        self.directory = directory
+        self.shard_key = shard_key
+        self._key = SHARD_KEYS[shard_key]
+        self._loaded: dict[str, set[int]] = {}
+        self._dirty: set[str] = set()
+
+    def shard_of(self, task: Todo) -> str:
+        """Get the name of the shard a task belongs to.
+
+        Args:
+            task: The task.
+
+        Returns:
+            str: Shard name.
+        """
+        return self._key(task)
+
+    def shard_path(self, name: str) -> Path:
+        """Get the file path of a shard.
+
+        Args:
+            name: Shard name.
+
+        Returns:
+            Path: Path of the shard file.
+        """
+        return self.directory / f'{name}{SHARD_SUFFIX}'
+
+    def shard_names(self) -> list[str]:
+        """List shards present on disk.
+
+        Returns:
+            list[str]: Sorted shard names.
+        """
+        return sorted(
+            path.name.removesuffix(SHARD_SUFFIX)
+            for path in self.directory.glob(f'*{SHARD_SUFFIX}')
+            if not path.name.startswith(TEMP_PREFIX)
+        )
+
+    def _read_shard(self, name: str) -> TodoList:
+        path = self.shard_path(name)
+        if not path.exists():
+            return TodoList()
+        with path.open(encoding='utf-8') as fp:
+            return TodoList.load_stream(fp, trusted=True)
+
+    def load(self, shards: Iterable[str] | None = None) -> TodoList:
+        """Load tasks from the selected shards.
+
+        Args:
+            shards: Names of the shards to read. Defaults to all shards on disk.
+
+        Returns:
+            TodoList: Tasks of the selected shards, shard by shard.
+
+        Raises:
+            ValueError: If duplicate Todo UUIDs are found across shards.
+        """
+        tasks: list[Todo] = []
+
+        for name in self.shard_names() if shards is None else shards:
+            shard = self._read_shard(name)
+            self._loaded[name] = {task.idx_int for task in shard}
+            self._dirty.discard(name)
+            for task in shard:
+                task.subscribe(self)
+            tasks.extend(shard)
+
+        return TodoList(tasks)
+
+    def task_changed(self, task: Todo, field: str, old: object, new: object) -> None:  # noqa: ARG002
+        """Mark the shard of a changed task as dirty.
+
+        Args:
+            task: The changed task.
+            field: Name of the changed field (unused).
+            old: Previous value (unused).
+            new: New value (unused).
+        """
+        self._dirty.add(self.shard_of(task))
+
+    def save(self, todo_list: TodoList) -> list[str]:
+        """Write the shards whose content changed since they were loaded or saved.
+
+        A shard is dirty when one of its tasks changed, or when the set of
+        tasks belonging to it differs from the last load or save (tasks added,
+        removed or moved to another shard). Every shard is written to a
+        temporary file that replaces it once complete.
+
+        Args:
+            todo_list: Tasks to persist.
+
+        Returns:
+            list[str]: Sorted names of the rewritten shards.
+        """
+        groups: dict[str, list[Todo]] = {}
+        for task in todo_list:
+            groups.setdefault(self.shard_of(task), []).append(task)
+
+        members = {name: {task.idx_int for task in tasks} for name, tasks in groups.items()}
+        dirty = self._dirty | {
+            name
+            for name in members.keys() | self._loaded.keys()
+            if members.get(name, set()) != self._loaded.get(name, set())
+        }
+
+        in_memory = {task.idx_int for task in todo_list}
+        for name in sorted(dirty):
+            tasks = groups.get(name, [])
+            if name in self._loaded:
+                self._loaded[name] = members.get(name, set())
+            else:
+                tasks = [task for task in self._read_shard(name) if task.idx_int not in in_memory] + tasks
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with replacing(self.shard_path(name)) as temp, temp.open('w', encoding='utf-8') as fp:
+                TodoList(tasks).dump(fp)
+
+            for task in groups.get(name, []):
+                task.subscribe(self)
+
+        self._dirty.clear()
+        return sorted(dirty)
@@ -0,0 +1,64 @@
+from datetime import date
+from functools import lru_cache
+import re
+
+
+DATE_CACHE_SIZE = 4096
+
+# Time part of ``datetime.isoformat()``: ``THH:MM:SS``, optional microseconds and UTC offset.
+_ISO_TIME = re.compile(r'T([01]\d|2[0-3]):[0-5]\d:[0-5]\d(\.\d{6})?([+-]([01]\d|2[0-3]):[0-5]\d(:[0-5]\d)?)?')
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(text: str) -> date:
+    """Parse an ISO 8601 date, memoised.
+
+    Deadlines cluster on a few hundred distinct days, so parsing goes through
+    a bounded LRU cache and tasks with the same deadline share one
+    :class:`~datetime.date` object.
+
+    Args:
+        text: Date in ``YYYY-MM-DD`` form.
+
+    Returns:
+        date: The parsed date.
+
+    Raises:
+        ValueError: If `text` is not a valid ISO date.
+    """
+    return date.fromisoformat(text)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def format_date(value: date) -> str:
+    """Format a date as ISO 8601, memoised.
+
+    Args:
+        value: The date.
+
+    Returns:
+        str: Date in ``YYYY-MM-DD`` form.
+    """
+    return value.isoformat()
+
+
+def check_datetime(text: str) -> str:
+    """Check that a string is a timestamp written by ``datetime.isoformat()``, without building it.
+
+    The date goes through the memoised :func:`parse_date` and the time of day
+    is matched against its fixed layout, so a string that passes is accepted
+    by ``datetime.fromisoformat`` later on.
+
+    Args:
+        text: Timestamp in ``YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM]`` form.
+
+    Returns:
+        str: `text` unchanged.
+
+    Raises:
+        ValueError: If `text` is not such a timestamp.
+    """
+    parse_date(text[:10])
+    if _ISO_TIME.fullmatch(text, 10) is None:
+        raise ValueError(f'Invalid isoformat string: {text!r}')
+    return text
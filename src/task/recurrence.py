@@ -0,0 +1,109 @@
+from datetime import timedelta
+from functools import lru_cache
+import re
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from datetime import date
+
+
+_NAMED_INTERVALS = {'daily': 1, 'weekly': 7}
+
+_EVERY_N_DAYS = re.compile(r'every\s+(\d+)\s+days?')
+
+
+class Recurrence:
+    """Rule repeating a task every fixed number of days.
+
+    A recurring task is stored once; its deadline (or creation date when it
+    has none) anchors the rule and later occurrences are computed on demand,
+    see :meth:`dates`. The rule is immutable and serialized as its text
+    form: ``daily``, ``weekly`` or ``every N days``.
+    """
+
+    __slots__ = ('interval_days',)
+
+    interval_days: int
+
+    def __init__(self, interval_days: int) -> None:
+        """Initialize the rule.
+
+        Args:
+            interval_days: Days between consecutive occurrences.
+
+        Raises:
+            ValueError: If `interval_days` is lower than 1.
+        """
+        if interval_days < 1:
+            raise ValueError(f'Recurrence interval {interval_days} is invalid, it should be at least 1 day.')
+        object.__setattr__(self, 'interval_days', interval_days)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def __reduce__(self) -> tuple[type[Recurrence], tuple[int]]:
+        return type(self), (self.interval_days,)
+
+    def dates(self, anchor: date, start: date, end: date) -> Iterator[tuple[int, date]]:
+        """Generate the occurrences following `anchor` within a window.
+
+        Only the dates inside the window are computed, however far the window
+        is from the anchor.
+
+        Args:
+            anchor: Date of the stored occurrence, number 0.
+            start: First date of the window (inclusive).
+            end: Last date of the window (inclusive).
+
+        Yields:
+            tuple[int, date]: Occurrence number (from 1) and date, in date order.
+        """
+        step = self.interval_days
+        number = max(1, -((anchor - start).days // step))
+        current = anchor + timedelta(days=number * step)
+        while current <= end:
+            yield number, current
+            number += 1
+            current += timedelta(days=step)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Recurrence):
+            return self.interval_days == other.interval_days
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.interval_days)
+
+    def __str__(self) -> str:
+        for name, days in _NAMED_INTERVALS.items():
+            if days == self.interval_days:
+                return name
+        return f'every {self.interval_days} days'
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(interval_days={self.interval_days})'
+
+
+@lru_cache(maxsize=128)
+def parse_recurrence(text: str) -> Recurrence:
+    """Parse the text form of a recurrence rule, memoised.
+
+    Args:
+        text: ``daily``, ``weekly`` or ``every N days``, case-insensitive.
+
+    Returns:
+        Recurrence: The rule. Equal texts share one instance.
+
+    Raises:
+        ValueError: If `text` is not a recurrence rule.
+    """
+    spec = text.strip().lower()
+    if spec in _NAMED_INTERVALS:
+        return Recurrence(_NAMED_INTERVALS[spec])
+
+    match = _EVERY_N_DAYS.fullmatch(spec)
+    if match is None:
+        raise ValueError(f'Recurrence {text!r} is invalid, expected daily, weekly or "every N days".')
+    return Recurrence(int(match.group(1)))
@@ -0,0 +1,171 @@
+from bisect import bisect
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+import random
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Mapping
+
+
+DEFAULT_START = datetime(2025, 1, 1, tzinfo=UTC)
+
+DEFAULT_PRIORITY_WEIGHTS: dict[PriorityEnum, float] = {
+    PriorityEnum.LOW: 0.3,
+    PriorityEnum.MEDIUM: 0.5,
+    PriorityEnum.HIGH: 0.2,
+}
+
+DEFAULT_STATUS_WEIGHTS: dict[StatusEnum, float] = {
+    StatusEnum.TODO: 0.4,
+    StatusEnum.IN_PROGRESS: 0.2,
+    StatusEnum.COMPLETED: 0.3,
+    StatusEnum.BLOCKED: 0.1,
+}
+
+WORDS = (
+    'review', 'update', 'fix', 'write', 'plan', 'call', 'check', 'prepare', 'send', 'clean',
+    'report', 'invoice', 'meeting', 'release', 'backup', 'budget', 'design', 'draft', 'notes', 'tests',
+    'server', 'client', 'garden', 'kitchen', 'doctor', 'groceries', 'tickets', 'slides', 'contract', 'docs',
+    'the', 'for', 'with', 'before', 'after', 'weekly', 'monthly', 'urgent', 'new', 'old',
+)  # fmt: skip
+
+
+def _cumulative[K](weights: Mapping[K, float], name: str) -> list[float]:
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError(f'{name} weights must be non-negative with a positive sum.')
+    return list(accumulate(weights.values()))
+
+
+def zipf_weights(size: int, skew: float) -> list[float]:
+    """Cumulative weights of ranks 1 to `size` under Zipf's law.
+
+    Args:
+        size: Number of ranks.
+        skew: Exponent of the law, higher values concentrate the weight on the first ranks.
+
+    Returns:
+        list[float]: Cumulative weights, usable as ``cum_weights`` of :meth:`random.Random.choices`.
+    """
+    return list(accumulate(rank**-skew for rank in range(1, size + 1)))
+
+
+def generate_tasks(
+    count: int,
+    *,
+    seed: int = 0,
+    priority_weights: Mapping[PriorityEnum, float] = DEFAULT_PRIORITY_WEIGHTS,
+    status_weights: Mapping[StatusEnum, float] = DEFAULT_STATUS_WEIGHTS,
+    tag_count: int = 1000,
+    tag_skew: float = 1.1,
+    max_tags: int = 3,
+    deadline_ratio: float = 0.8,
+    deadline_days: int = 90,
+    description_words: tuple[int, int] = (3, 12),
+    start: datetime = DEFAULT_START,
+    period_days: int = 365,
+) -> Iterator[Todo]:
+    """Generate synthetic tasks shaped like a real store.
+
+    Tasks are generated lazily, one at a time, so any number of them can be
+    streamed to a store in constant memory. The output only depends on the arguments:
+    the same seed always yields the same tasks, ids included.
+
+    Tags are drawn from ``tag-1`` to ``tag-<tag_count>`` with Zipfian
+    popularity, so a few tags are on most tasks and most tags are rare, as
+    in real stores.
+
+    Args:
+        count: Number of tasks.
+        seed: Random seed.
+        priority_weights: Relative frequency of each priority, missing priorities are never drawn.
+        status_weights: Relative frequency of each status, missing statuses are never drawn.
+        tag_count: Number of distinct tags.
+        tag_skew: Zipf exponent of the tag popularity, see :func:`zipf_weights`.
+        max_tags: Maximum number of tags per task, the number is uniform from 0.
+        deadline_ratio: Share of tasks with a deadline.
+        deadline_days: Maximum number of days between creation and deadline.
+        description_words: Minimum and maximum number of words of a description.
+        start: Earliest creation time.
+        period_days: Creation times are uniform over this many days from `start`.
+
+    Returns:
+        Iterator[Todo]: Generated tasks. The arguments are checked before the
+        first task is generated.
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+    min_words, max_words = description_words
+    if count < 0 or tag_count < 1 or max_tags < 0 or deadline_days < 0 or period_days < 1:
+        raise ValueError('Counts, days and tag numbers must not be negative.')
+    if not 1 <= min_words <= max_words:
+        raise ValueError('Description length must be a range of at least one word.')
+    if not 0 <= deadline_ratio <= 1:
+        raise ValueError('Deadline ratio must be between 0 and 1.')
+
+    return _generate(
+        count,
+        seed=seed,
+        priorities=list(priority_weights),
+        priority_cum=_cumulative(priority_weights, 'Priority'),
+        statuses=list(status_weights),
+        status_cum=_cumulative(status_weights, 'Status'),
+        tag_cum=zipf_weights(tag_count, tag_skew),
+        max_tags=max_tags,
+        deadline_ratio=deadline_ratio,
+        deadline_days=deadline_days,
+        description_words=description_words,
+        start=start,
+        period_seconds=period_days * 86_400,
+    )
+
+
+def _generate(
+    count: int,
+    *,
+    seed: int,
+    priorities: list[PriorityEnum],
+    priority_cum: list[float],
+    statuses: list[StatusEnum],
+    status_cum: list[float],
+    tag_cum: list[float],
+    max_tags: int,
+    deadline_ratio: float,
+    deadline_days: int,
+    description_words: tuple[int, int],
+    start: datetime,
+    period_seconds: int,
+) -> Iterator[Todo]:
+    tags = [f'tag-{rank}' for rank in range(1, len(tag_cum) + 1)]
+    priority_total, status_total, tag_total = priority_cum[-1], status_cum[-1], tag_cum[-1]
+    min_words, max_words = description_words
+    word_spread, tag_spread = max_words - min_words + 1, max_tags + 1
+
+    # Draws go through random() and bisect rather than randint() and choices():
+    # their argument checks cost more than the draw itself at millions of tasks.
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data, not security
+    draw = rng.random
+    for _ in range(count):
+        created_at = start + timedelta(seconds=int(draw() * period_seconds))
+        deadline = None
+        if draw() < deadline_ratio:
+            deadline = created_at.date() + timedelta(days=int(draw() * (deadline_days + 1)))
+        words = [WORDS[int(draw() * len(WORDS))] for _ in range(min_words + int(draw() * word_spread))]
+        task_tags = [tags[bisect(tag_cum, draw() * tag_total)] for _ in range(int(draw() * tag_spread))]
+
+        yield Todo._from_trusted(
+            description=' '.join(words).capitalize(),
+            priority=priorities[bisect(priority_cum, draw() * priority_total)],
+            created_at=created_at,
+            deadline=deadline,
+            tags=dict.fromkeys(task_tags),
+            status=statuses[bisect(status_cum, draw() * status_total)],
+            idx=UUID(int=rng.getrandbits(128), version=4).int,
+        )
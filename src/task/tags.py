@@ -0,0 +1,164 @@
+from collections.abc import Sequence
+from threading import Lock
+from typing import TYPE_CHECKING, overload
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, KeysView
+
+
+class TagRegistry:
+    """Process-wide dictionary encoding of tags as small integers.
+
+    Every distinct normalized tag is stored once and gets the next free id.
+    Tasks keep only the ids, so equal tags share one string object and tag
+    comparisons are integer comparisons. Ids are never reused or removed and
+    are meaningful only inside the current process; serialized tasks always
+    carry tag strings.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = Lock()
+
+    def intern(self, tag: str) -> int:
+        """Get the id of a tag, registering the tag when it is new.
+
+        Args:
+            tag: Normalized tag.
+
+        Returns:
+            int: Id of the tag.
+        """
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            with self._lock:
+                tag_id = self._ids.get(tag)
+                if tag_id is None:
+                    tag_id = len(self._names)
+                    self._names.append(tag)
+                    self._ids[tag] = tag_id
+        return tag_id
+
+    def id_of(self, tag: str) -> int | None:
+        """Look up the id of a tag without registering it.
+
+        Args:
+            tag: Normalized tag.
+
+        Returns:
+            int | None: Id of the tag, or None if no task ever had this tag.
+        """
+        return self._ids.get(tag)
+
+    def name(self, tag_id: int) -> str:
+        """Get the tag of an id.
+
+        Args:
+            tag_id: Id returned by :meth:`intern`.
+
+        Returns:
+            str: The tag.
+        """
+        return self._names[tag_id]
+
+    def names(self, tag_ids: Iterable[int]) -> list[str]:
+        """Decode several ids at once.
+
+        Args:
+            tag_ids: Ids returned by :meth:`intern`.
+
+        Returns:
+            list[str]: The tags, in the order of `tag_ids`.
+        """
+        names = self._names
+        return [names[tag_id] for tag_id in tag_ids]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+TAG_REGISTRY = TagRegistry()
+
+
+class TagsView(Sequence[str]):
+    """Read-only, ordered view of the tags of a task.
+
+    The tags are stored as :data:`TAG_REGISTRY` ids in the keys of a dict,
+    which keeps insertion order and gives O(1) membership tests, insertion
+    and removal. The view decodes the ids back to strings and reflects later
+    changes of the task's tags. It compares equal to any sequence holding
+    the same tags in the same order, e.g. a list.
+    """
+
+    __slots__ = ('_tag_ids',)
+
+    def __init__(self, tag_ids: dict[int, None]) -> None:
+        """Initialize the view.
+
+        Args:
+            tag_ids: Tag storage, tag ids are the keys.
+        """
+        self._tag_ids = tag_ids
+
+    @property
+    def ids(self) -> KeysView[int]:
+        """Get the registry ids of the tags, for integer based comparisons.
+
+        Returns:
+            KeysView[int]: Live, ordered view of the tag ids.
+        """
+        return self._tag_ids.keys()
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...  # pragma: no cover
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Get a tag by position, or a list of tags by slice.
+
+        Args:
+            index: Position or slice.
+
+        Returns:
+            str | list[str]: The selected tag or tags.
+        """
+        if isinstance(index, slice):
+            return TAG_REGISTRY.names(list(self._tag_ids)[index])
+        return TAG_REGISTRY.name(list(self._tag_ids)[index])
+
+    def __len__(self) -> int:
+        return len(self._tag_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TAG_REGISTRY.names(self._tag_ids))
+
+    def __reversed__(self) -> Iterator[str]:
+        return iter(TAG_REGISTRY.names(reversed(self._tag_ids)))
+
+    def __contains__(self, tag: object) -> bool:
+        return isinstance(tag, str) and TAG_REGISTRY.id_of(tag) in self._tag_ids
+
+    def __eq__(self, other: object) -> bool:
+        """Compare tags with another sequence, order included.
+
+        Args:
+            other: Object to compare with.
+
+        Returns:
+            bool: True if `other` is a sequence of the same tags in the same order.
+        """
+        if isinstance(other, TagsView):
+            return list(self._tag_ids) == list(other._tag_ids)
+        if isinstance(other, (list, tuple)):
+            return TAG_REGISTRY.names(self._tag_ids) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(TAG_REGISTRY.names(self._tag_ids))
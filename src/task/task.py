@@ -1,21 +1,108 @@
 from datetime import UTC, date, datetime
+from functools import lru_cache
 import json
+from json.encoder import encode_basestring
+import os
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol, cast
 from uuid import UUID, uuid4
+import weakref
 
 from src.enums.priority_enum import PriorityEnum
 from src.enums.status_enum import StatusEnum
 from src.schemas.guards.todo_dict_guard import is_todo_dict
+from src.task.dates import check_datetime, format_date, parse_date
+from src.task.recurrence import parse_recurrence
+from src.task.tags import TAG_REGISTRY, TagsView
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Sequence
+    from typing import TextIO
 
     from src.schemas.todo_schema import TodoDict
+    from src.task.recurrence import Recurrence
 
 
-class Todo:
+TAG_CACHE_SIZE = 4096
+
+_WHITESPACE_RUN = re.compile(r'\s{2,}')
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _normalize_cached(text: str) -> str:
+    return _WHITESPACE_RUN.sub(' ', text).lower().strip()
+
+
+def normalize_tag(text: str) -> str:
+    """Normalize text for consistent tag formatting.
+
+    Runs of two or more whitespace characters are replaced with a single space,
+    the text is lowercased and stripped. Lowercase alphanumeric tags are
+    already normalized and returned as they are; other results are kept in
+    a bounded LRU cache, since the same tags repeat across many tasks.
+
+    Args:
+        text: The tag string to normalize.
+
+    Returns:
+        str: A normalized lowercase string with single spaces.
+    """
+    if text.isalnum() and text.islower():
+        return text
+    return _normalize_cached(text)
+
+
+_UUID_VERSION_MASK = (0xC000 << 48) | (0xF000 << 64)
+
+_UUID_VERSION_4 = (0x8000 << 48) | (4 << 76)
+
+# Strictly hex digits: int(..., 16) alone would also accept a 0x prefix or underscores.
+_CANONICAL_UUID = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+def parse_uuid4(value: str) -> int:
+    """Parse a UUID string into its 128-bit integer, forced to version 4.
+
+    Gives the same result as ``UUID(value, version=4).int``. The canonical
+    ``8-4-4-4-12`` hex form is parsed directly, without building a
+    :class:`~uuid.UUID` object; other accepted forms (braces, ``urn:uuid:``
+    prefix, no dashes) fall back to :class:`~uuid.UUID`.
+
+    Args:
+        value: UUID string.
+
+    Returns:
+        int: The UUID as an integer, with version 4 and RFC 4122 variant bits set.
+
+    Raises:
+        ValueError: If `value` is not a valid UUID string.
+    """
+    if _CANONICAL_UUID.fullmatch(value):
+        return (int(value.replace('-', ''), 16) & ~_UUID_VERSION_MASK) | _UUID_VERSION_4
+    return UUID(value, version=4).int
+
+
+def _is_canonical_uuid4(value: str) -> bool:
+    return (
+        _CANONICAL_UUID.fullmatch(value) is not None
+        and value[14] == '4'
+        and value[19] in '89ab'
+        and value == value.lower()
+    )
+
+
+class TodoObserver(Protocol):
+    """Receiver of change notifications emitted by :class:`Todo` setters."""
+
+    def task_changed(self, task: Todo, field: str, old: object, new: object) -> None:
+        """Handle a change of a single task field.
+
+        For the ``tags`` field `old` holds the removed tags and `new` the added ones.
+        """
+
+
+class Todo:  # noqa: PLR0904 - the domain model carries its own (de)serialization
     """Represents a single to-do item with metadata such as description, priority, status, and deadlines.
 
     This class encapsulates both data and validation logic for creating and managing tasks.
@@ -27,20 +114,32 @@ class Todo:
         priority (PriorityEnum): The priority level of the task (default: MEDIUM).
         created_at (datetime): The UTC timestamp when the task was created.
         deadline (date | None): The due date for the task. Must be after `created_at`.
-        tags (list[str]): Optional list of tag strings categorizing the task.
+        tags (TagsView): Read-only, ordered view of the tag strings categorizing the task.
         status (StatusEnum): The current workflow status (e.g., TODO, IN_PROGRESS, DONE).
-        idx (UUID): A unique identifier for the task.
+        idx (UUID): A unique identifier for the task, kept as a 128-bit integer
+            (`idx_int`) with a cached canonical string (`idx_str`).
+        recurrence (Recurrence | None): Rule repeating the task, see :meth:`occurrences`.
+
+    Observers registered with :meth:`subscribe` are notified about changes of
+    ``description``, ``priority``, ``status``, ``deadline``, ``tags`` and ``recurrence``. They are held through weak
+    references, so a subscription never keeps the observer alive. Every change
+    of the editable fields also increments :attr:`version`.
     """
 
+    _observers: tuple[weakref.ref[TodoObserver], ...] = ()
+    _recurrence: Recurrence | None = None
+    _version = 0
+
     def __init__(
         self,
         description: str,
         priority: PriorityEnum = PriorityEnum.MEDIUM,
         created_at: datetime | None = None,
         deadline: date | None = None,
-        tags: list[str] | None = None,
+        tags: Iterable[str] | None = None,
         status: StatusEnum = StatusEnum.TODO,
         idx: UUID | str | None = None,
+        recurrence: Recurrence | None = None,
     ) -> None:
         """Initialize a new :class:`Todo` instance.
 
@@ -49,9 +148,10 @@ class Todo:
             priority: The task's priority level.
             created_at: The datetime when the task was created. Defaults to current UTC time if not provided.
             deadline: The date when the task is due. Must be later than `created_at`.
-            tags: An optional list of tag strings.
+            tags: Optional tag strings.
             status: The initial workflow status of the task.
             idx: An optional unique identifier (UUID or UUID string). A new UUIDv4 is generated if omitted.
+            recurrence: An optional rule repeating the task.
 
         Raises:
             ValueError: If the `description` length is less than 3 characters.
@@ -65,6 +165,7 @@ class Todo:
         self.tags = tags
         self.status = status
         self.idx = idx
+        self.recurrence = recurrence
 
     @property
     def description(self) -> str:
@@ -77,7 +178,7 @@ class Todo:
 
     @description.setter
     def description(self, value: str) -> None:
-        """Set the textual description of the task.
+        """Set the textual description of the task and notify observers.
 
         The description must contain at least three non-whitespace characters.
 
@@ -89,16 +190,67 @@ class Todo:
         """
         if len(value.strip()) < 3:
             raise ValueError(f'Description {value} must be at least 3 characters.')
+        old = self.__dict__.get('_description')
         self._description = value.strip()
+        self._version += 1
+        self._notify('description', old, self._description)
+
+    @property
+    def priority(self) -> PriorityEnum:
+        """Get the priority level of the task.
+
+        Returns:
+            The task priority.
+        """
+        return self._priority
+
+    @priority.setter
+    def priority(self, value: PriorityEnum) -> None:
+        """Set the priority level of the task and notify observers.
+
+        Args:
+            value: The new task priority.
+        """
+        old = self.__dict__.get('_priority')
+        self._priority = value
+        self._version += 1
+        self._notify('priority', old, value)
+
+    @property
+    def status(self) -> StatusEnum:
+        """Get the workflow status of the task.
+
+        Returns:
+            The task status.
+        """
+        return self._status
+
+    @status.setter
+    def status(self, value: StatusEnum) -> None:
+        """Set the workflow status of the task and notify observers.
+
+        Args:
+            value: The new task status.
+        """
+        old = self.__dict__.get('_status')
+        self._status = value
+        self._version += 1
+        self._notify('status', old, value)
 
     @property
     def idx(self) -> UUID:
         """Get the unique identifier (UUID) of the task.
 
+        The canonical id is kept as an integer (see :attr:`idx_int`); the
+        :class:`~uuid.UUID` object is created on first access.
+
         Returns:
             The UUID associated with this task instance.
         """
-        return self._idx
+        uuid = self._idx
+        if uuid is None:
+            uuid = self._idx = UUID(int=self._idx_int)
+        return uuid
 
     @idx.setter
     def idx(self, value: UUID | str | None) -> None:
@@ -110,12 +262,71 @@ class Todo:
         Raises:
             ValueError: If the string cannot be parsed into a valid UUID.
         """
+        uuid: UUID | None = None
+        text: str | None = None
+
         if value is None:
-            self._idx = uuid4()
+            uuid = uuid4()
+            number = uuid.int
         elif isinstance(value, str):
-            self._idx = UUID(value, version=4)
+            number = parse_uuid4(value)
+            text = value if _is_canonical_uuid4(value) else None
         else:
-            self._idx = value
+            uuid = value
+            number = value.int
+
+        self._idx_int = number
+        self._idx_str = text
+        self._idx = uuid
+
+    @property
+    def idx_int(self) -> int:
+        """Get the unique identifier as a 128-bit integer.
+
+        Returns:
+            The integer value of :attr:`idx`, used for hashing and comparisons.
+        """
+        return self._idx_int
+
+    @property
+    def idx_str(self) -> str:
+        """Get the canonical string form of the unique identifier.
+
+        The string is computed once and cached; ids parsed from canonical
+        strings reuse the parsed string.
+
+        Returns:
+            The lowercase ``8-4-4-4-12`` hex representation of :attr:`idx`.
+        """
+        text = self._idx_str
+        if text is None:
+            text = self._idx_str = str(self.idx)
+        return text
+
+    @property
+    def created_at(self) -> datetime:
+        """Get the creation timestamp of the task.
+
+        Tasks loaded on the trusted path keep the serialized ISO string and
+        parse it on first access only.
+
+        Returns:
+            The datetime when the task was created.
+        """
+        value = self._created_at
+        if value is None:
+            value = self._created_at = datetime.fromisoformat(cast('str', self._created_at_iso))
+        return value
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        """Set the creation timestamp of the task.
+
+        Args:
+            value: The datetime when the task was created.
+        """
+        self._created_at: datetime | None = value
+        self._created_at_iso: str | None = None
 
     @property
     def deadline(self) -> date | None:
@@ -138,34 +349,86 @@ class Todo:
         Raises:
             ValueError: If `value` is earlier than to `created_at.date()`.
         """
-        if value is None:
-            self._deadline = None
-        elif value < self.created_at.date():
+        if value is not None and value < self.created_at.date():
             raise ValueError(f'Deadline {value} is invalid, date should be from the future.')
+
+        old = self.__dict__.get('_deadline')
         self._deadline = value
+        self._version += 1
+        self._notify('deadline', old, value)
 
     @property
-    def tags(self) -> list[str]:
-        """Get the list of tags assigned to the task.
+    def recurrence(self) -> Recurrence | None:
+        """Get the rule repeating the task.
 
         Returns:
-            A list of normalized tag strings associated with the task.
+            The recurrence rule, or None for a one-off task.
+        """
+        return self._recurrence
+
+    @recurrence.setter
+    def recurrence(self, value: Recurrence | None) -> None:
+        """Set or remove the rule repeating the task and notify observers.
+
+        Args:
+            value: The recurrence rule, or None for a one-off task.
         """
-        return self._tags
+        old = self._recurrence
+        self._recurrence = value
+        self._version += 1
+        self._notify('recurrence', old, value)
+
+    @property
+    def version(self) -> int:
+        """Get the change counter of the task.
+
+        The counter grows with every change of the description, priority,
+        status, deadline, tags or recurrence, so a value derived from these
+        fields can be cached together with the version it was built from.
+        Tasks loaded or cloned on the trusted path start at 0.
+
+        Returns:
+            The number of changes since the task was built.
+        """
+        return self._version
+
+    @property
+    def tags(self) -> TagsView:
+        """Get the tags assigned to the task.
+
+        Tags are kept in insertion order in a set-like storage of
+        :data:`~src.task.tags.TAG_REGISTRY` ids. The returned view is
+        read-only; use :meth:`add_tag`, :meth:`remove_tag` or assign a new
+        iterable to change the tags.
+
+        Returns:
+            A read-only view of the normalized tag strings associated with the task.
+        """
+        return self._tags_view
 
     @tags.setter
-    def tags(self, value: list[str] | None) -> None:
-        """Set or update the list of tags for the task.
+    def tags(self, value: Iterable[str] | None) -> None:
+        """Set or update the tags for the task.
 
         Tags are automatically normalized (lowercased, stripped, and deduplicated).
 
         Args:
-            value: A list of tag strings or None to clear all tags.
+            value: Tag strings or None to clear all tags.
         """
-        if value is None:
-            self._tags = []
-        else:
-            self._tags = self._unique_values([self._normalize(tag) for tag in value])
+        if '_tag_ids' not in self.__dict__:
+            self._tag_ids: dict[int, None] = {}
+            self._tags_view = TagsView(self._tag_ids)
+
+        intern = TAG_REGISTRY.intern
+        new = {} if value is None else dict.fromkeys(intern(normalize_tag(tag)) for tag in value)
+        old = tuple(self._tags_view) if self._observers else ()
+
+        self._tag_ids.clear()
+        self._tag_ids.update(new)
+        self._version += 1
+
+        if self._observers:
+            self._notify('tags', old, tuple(self._tags_view))
 
     @staticmethod
     def _normalize(text: str) -> str:
@@ -176,32 +439,15 @@ class Todo:
           * Replaces multiple spaces, tabs, or newlines with a single space,
           * Strips leading and trailing whitespace.
 
+        See :func:`normalize_tag`.
+
         Args:
             text: The tag string to normalize.
 
         Returns:
             A normalized lowercase string with single spaces.
         """
-        return re.sub(r'\s{2,}', ' ', text).lower().strip()
-
-    @staticmethod
-    def _unique_values(values: Iterable[str]) -> list[str]:
-        """Remove duplicates from an iterable while preserving order.
-
-        Args:
-            values: An iterable of strings.
-
-        Returns:
-            A list containing unique values in their original order.
-        """
-        seen: set[str] = set()
-        out: list[str] = []
-
-        for value in values:
-            if value not in seen:
-                seen.add(value)
-                out.append(value)
-        return out
+        return normalize_tag(text)
 
     def add_tag(self, tag: str) -> None:
         """Add a single tag to the task.
@@ -212,9 +458,12 @@ class Todo:
         Args:
             tag: The tag string to add.
         """
-        tag_ = self._normalize(tag)
-        if tag_ not in self.tags:
-            self.tags.append(tag_)
+        tag_ = normalize_tag(tag)
+        tag_id = TAG_REGISTRY.intern(tag_)
+        if tag_id not in self._tag_ids:
+            self._tag_ids[tag_id] = None
+            self._version += 1
+            self._notify('tags', (), (tag_,))
 
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from the task if it exists.
@@ -224,15 +473,85 @@ class Todo:
         Args:
             tag: The tag string to remove. If it does not exist, no action is taken.
         """
-        tag_ = self._normalize(tag)
-        if tag_ in self.tags:
-            self.tags.remove(tag_)
+        tag_ = normalize_tag(tag)
+        tag_id = TAG_REGISTRY.id_of(tag_)
+        if tag_id in self._tag_ids:
+            del self._tag_ids[tag_id]
+            self._version += 1
+            self._notify('tags', (tag_,), ())
+
+    def subscribe(self, observer: TodoObserver) -> None:
+        """Register an observer notified about field changes of this task.
+
+        Subscribing the same observer again has no effect. Dead references,
+        e.g. of discarded stats over the same task, are dropped at the same time.
+
+        Args:
+            observer: Object implementing ``task_changed``. It is stored as a weak reference.
+        """
+        live = tuple(ref for ref in self._observers if ref() is not None)
+        if not any(ref() is observer for ref in live):
+            live = (*live, weakref.ref(observer))
+        self._observers = live
+
+    def unsubscribe(self, observer: TodoObserver) -> None:
+        """Unregister a previously subscribed observer.
+
+        Dead references are dropped at the same time. Unknown observers are ignored.
+
+        Args:
+            observer: The observer to remove.
+        """
+        self._observers = tuple(ref for ref in self._observers if (live := ref()) is not None and live is not observer)
+
+    def __getstate__(self) -> dict[str, object]:
+        """Return the picklable state of the task, without observer references.
+
+        Tag ids are valid only in the current process, so tags are pickled as strings.
+
+        Returns:
+            dict[str, object]: Instance attributes except subscriptions.
+        """
+        state = self.__dict__.copy()
+        state.pop('_observers', None)
+        state.pop('_tags_view', None)
+        state['_tag_ids'] = TAG_REGISTRY.names(self._tag_ids)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled task, registering its tags in this process.
+
+        Args:
+            state: State returned by :meth:`__getstate__`.
+        """
+        tags = state.pop('_tag_ids')
+        self.__dict__.update(state)
+        self._tag_ids = dict.fromkeys(TAG_REGISTRY.intern(tag) for tag in tags)
+        self._tags_view = TagsView(self._tag_ids)
+
+    def _notify(self, field: str, old: object, new: object) -> None:
+        """Forward a field change to all live observers and drop the dead references.
+
+        Args:
+            field: Name of the changed field.
+            old: Previous value (removed tags for ``tags``).
+            new: New value (added tags for ``tags``).
+        """
+        dead = False
+        for ref in self._observers:
+            observer = ref()
+            if observer is None:
+                dead = True
+            else:
+                observer.task_changed(self, field, old, new)
+        if dead:
+            self._observers = tuple(ref for ref in self._observers if ref() is not None)
 
     def clone(self) -> Todo:
         """Create a new copy of the current Todo instance with updated timestamps.
 
         This method performs a deep clone of the task while preserving all
-        user-defined attributes (description, priority, status, and tags).
+        user-defined attributes (description, priority, status, tags and recurrence).
         The `created_at` field is refreshed to the current UTC time, while
         the `deadline` is carried over only if it is not in the past.
         A new unique UUID is automatically generated for the cloned task.
@@ -250,34 +569,221 @@ class Todo:
             >>> cloned.created_at > todo.created_at
             True
         """
+        return self.clone_many(1)[0]
+
+    def clone_many(
+        self,
+        n: int,
+        *,
+        deadlines: Sequence[date | None] | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> list[Todo]:
+        """Create `n` copies of the task in one batch.
+
+        All clones share a single `created_at` timestamp, their deadlines are
+        validated in one pass and their UUIDs are drawn from one block of
+        random bytes. The fields of the template are already valid, so the
+        clones are assembled without running the property setters.
+
+        Args:
+            n: Number of clones.
+            deadlines: One deadline per clone. Defaults to the template's
+                deadline, dropped when it is already in the past.
+            tags: Tags of the clones. Defaults to the template's tags.
+
+        Returns:
+            list[Todo]: The clones, in the order of `deadlines`.
+
+        Raises:
+            ValueError: If the number of deadlines differs from `n`.
+            ValueError: If a deadline is earlier than the creation date of the clones.
+        """
         created_at = datetime.now(tz=UTC)
-        deadline = None if self.deadline and self.deadline < created_at.date() else self.deadline
-
-        return Todo(
-            description=self.description,
-            priority=self.priority,
-            created_at=created_at,
-            deadline=deadline,
-            tags=self.tags.copy(),
-            status=self.status,
-        )
+        today = created_at.date()
+
+        if deadlines is None:
+            deadline = None if self.deadline and self.deadline < today else self.deadline
+            deadlines = [deadline] * n
+        elif len(deadlines) != n:
+            raise ValueError(f'Expected {n} deadlines, got {len(deadlines)}.')
+        else:
+            earliest = min((deadline for deadline in deadlines if deadline is not None), default=None)
+            if earliest is not None and earliest < today:
+                raise ValueError(f'Deadline {earliest} is invalid, date should be from the future.')
+
+        tags = list(self.tags) if tags is None else [normalize_tag(tag) for tag in tags]
+        random = os.urandom(16 * n)
+
+        return [
+            Todo._from_trusted(
+                description=self.description,
+                priority=self.priority,
+                created_at=created_at,
+                deadline=deadline,
+                tags=tags,
+                status=self.status,
+                idx=(int.from_bytes(random[offset : offset + 16]) & ~_UUID_VERSION_MASK) | _UUID_VERSION_4,
+                recurrence=self._recurrence,
+            )
+            for offset, deadline in zip(range(0, 16 * n, 16), deadlines, strict=True)
+        ]
+
+    def occurrences(self, start: date, end: date) -> Iterator[Todo]:
+        """Generate the virtual instances of a recurring task due within a window.
+
+        The stored task is the first occurrence; the following ones exist
+        only while iterated and are never stored. They copy the task with the
+        ``TODO`` status, the occurrence date as deadline and no recurrence.
+        Their ids are derived from the task id and the occurrence number, so
+        the same occurrence always gets the same id.
+
+        Args:
+            start: First deadline of the window (inclusive).
+            end: Last deadline of the window (inclusive).
+
+        Yields:
+            Todo: Virtual instances in deadline order. Nothing for a one-off task.
+        """
+        if self._recurrence is None:
+            return
+
+        import hashlib  # noqa: PLC0415 - loads OpenSSL, needed only by recurring tasks
+
+        anchor = self.deadline or self.created_at.date()
+        tags = TAG_REGISTRY.names(self._tag_ids)
+        key = self._idx_int.to_bytes(16)
+
+        for number, deadline in self._recurrence.dates(anchor, start, end):
+            digest = hashlib.blake2b(key + number.to_bytes(8), digest_size=16).digest()
+            yield Todo._from_trusted(
+                description=self.description,
+                priority=self.priority,
+                created_at=self.created_at,
+                deadline=deadline,
+                tags=tags,
+                status=StatusEnum.TODO,
+                idx=(int.from_bytes(digest) & ~_UUID_VERSION_MASK) | _UUID_VERSION_4,
+            )
+
+    def _created_at_text(self) -> str:
+        created_at = self._created_at_iso
+        if created_at is None:
+            created_at = self._created_at_iso = self.created_at.isoformat()
+        return created_at
 
     def to_dict(self) -> TodoDict:
-        return {
+        """Serialize the task to plain data.
+
+        The result shares nothing mutable with the task: the tags are a new
+        list and all other values are immutable, so changing the dict never
+        affects the task.
+
+        Returns:
+            TodoDict: Serialized task.
+        """
+        data: TodoDict = {
             'description': self.description,
             'priority': self.priority.value,
-            'created_at': self.created_at.isoformat(),
-            'deadline': self.deadline.isoformat() if self.deadline else None,
-            'tags': self.tags,
+            'created_at': self._created_at_text(),
+            'deadline': format_date(self.deadline) if self.deadline else None,
+            'tags': TAG_REGISTRY.names(self._tag_ids),
             'status': self.status.value,
-            'idx': str(self.idx),
+            'idx': self.idx_str,
         }
+        if self._recurrence is not None:
+            data['recurrence'] = str(self._recurrence)
+        return data
 
     @classmethod
-    def from_dict(cls, data: TodoDict) -> Todo:
-        created_at_dt: datetime = datetime.fromisoformat(data['created_at'])
+    def _from_trusted(
+        cls,
+        description: str,
+        priority: PriorityEnum,
+        created_at: datetime | str,
+        deadline: date | None,
+        tags: Iterable[str],
+        status: StatusEnum,
+        idx: str | int,
+        recurrence: Recurrence | None = None,
+    ) -> Todo:
+        """Build a task from already validated and normalized fields.
+
+        The property setters are bypassed: the description is not stripped or
+        checked, the deadline is not compared with `created_at`, tags are
+        registered but not normalized or deduplicated, and no observer is
+        notified. The id is still parsed (see :func:`parse_uuid4`), but no
+        :class:`~uuid.UUID` object is created. A `created_at` string is
+        checked (see :func:`~src.task.dates.check_datetime`) and kept as it
+        is, reused by :meth:`to_dict` and parsed on first access. Use only
+        for data written by :meth:`to_dict`.
+
+        Args:
+            description: Stripped description.
+            priority: Task priority.
+            created_at: Creation timestamp, or its ISO string written by :meth:`to_dict`.
+            deadline: Deadline, not before `created_at`.
+            tags: Normalized, unique tags.
+            status: Task status.
+            idx: UUID string, or the UUID as a 128-bit integer.
+            recurrence: Rule repeating the task.
+
+        Returns:
+            Todo: The new task.
+
+        Raises:
+            ValueError: If the id or the `created_at` string is invalid.
+        """
+        task = cls.__new__(cls)
+        tag_ids = dict.fromkeys(map(TAG_REGISTRY.intern, tags))
+        task.__dict__.update({
+            '_description': description,
+            '_priority': priority,
+            '_created_at': None if isinstance(created_at, str) else created_at,
+            '_created_at_iso': check_datetime(created_at) if isinstance(created_at, str) else None,
+            '_deadline': deadline,
+            '_tag_ids': tag_ids,
+            '_tags_view': TagsView(tag_ids),
+            '_status': status,
+            '_idx_int': idx if isinstance(idx, int) else parse_uuid4(idx),
+            '_idx_str': idx if isinstance(idx, str) and _is_canonical_uuid4(idx) else None,
+            '_idx': None,
+            '_recurrence': recurrence,
+        })
+        return task
 
-        deadline_d: date | None = None if data['deadline'] is None else date.fromisoformat(data['deadline'])
+    @classmethod
+    def from_dict(cls, data: TodoDict, *, trusted: bool = False) -> Todo:
+        """Build a task from its serialized form.
+
+        Args:
+            data: Serialized task.
+            trusted: Skip the validation and normalization of the fields (see
+                :meth:`_from_trusted`). Only for records written by :meth:`to_dict`,
+                e.g. loaded from the application's own store.
+
+        Returns:
+            Todo: Deserialized task.
+
+        Raises:
+            ValueError: If the recurrence rule is invalid.
+        """
+        deadline_d: date | None = None if data['deadline'] is None else parse_date(data['deadline'])
+        recurrence = data.get('recurrence')
+        recurrence_r = None if recurrence is None else parse_recurrence(recurrence)
+
+        if trusted:
+            return cls._from_trusted(
+                description=data['description'],
+                priority=PriorityEnum(data['priority']),
+                created_at=data['created_at'],
+                deadline=deadline_d,
+                tags=data['tags'],
+                status=StatusEnum(data['status']),
+                idx=data['idx'],
+                recurrence=recurrence_r,
+            )
+
+        created_at_dt: datetime = datetime.fromisoformat(data['created_at'])
 
         return cls(
             description=data['description'],
@@ -287,19 +793,55 @@ class Todo:
             tags=data['tags'],
             status=StatusEnum(data['status']),
             idx=data['idx'],
+            recurrence=recurrence_r,
         )
 
     def to_json(self, *, indent: int | None = None) -> str:
+        if indent is None:
+            return self._compact_json()
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
 
+    def _compact_json(self) -> str:
+        """Encode the task as compact JSON straight from its fields.
+
+        Produces the same text as ``json.dumps(self.to_dict(), ensure_ascii=False)``
+        without building the dict and the tag list first.
+
+        Returns:
+            str: The task as a single line of JSON.
+        """
+        deadline = 'null' if self._deadline is None else f'"{format_date(self._deadline)}"'
+        tags = ', '.join(map(encode_basestring, TAG_REGISTRY.names(self._tag_ids)))
+        recurrence = '' if self._recurrence is None else f', "recurrence": "{self._recurrence}"'
+        return (
+            f'{{"description": {encode_basestring(self._description)}, '
+            f'"priority": {self._priority.value}, '
+            f'"created_at": {encode_basestring(self._created_at_text())}, '
+            f'"deadline": {deadline}, '
+            f'"tags": [{tags}], '
+            f'"status": "{self._status.value}", '
+            f'"idx": "{self.idx_str}"{recurrence}}}'
+        )
+
+    def write_json(self, fp: TextIO) -> None:
+        """Write the task as compact JSON to a text stream.
+
+        The text is encoded directly from the fields, without an intermediate
+        dict; it equals :meth:`to_json` without indentation.
+
+        Args:
+            fp: Writable text stream.
+        """
+        fp.write(self._compact_json())
+
     @classmethod
-    def from_json(cls, raw: str) -> Todo:
+    def from_json(cls, raw: str, *, trusted: bool = False) -> Todo:
         payload: Any = json.loads(raw)
 
         if not is_todo_dict(payload):
             raise TypeError('Invalid Todo JSON structure.')
 
-        return cls.from_dict(payload)
+        return cls.from_dict(payload, trusted=trusted)
 
     def __repr__(self) -> str:
         """Return an unambiguous, fully reconstructible string representation of the Todo object.
@@ -317,7 +859,9 @@ class Todo:
                 - tags (repr of the list)
                 - status (StatusEnum("value"))
                 - idx (UUID repr)
+                - recurrence (Recurrence repr), only for recurring tasks
         """
+        recurrence = '' if self._recurrence is None else f', recurrence={self._recurrence!r}'
         return (
             f'{type(self).__name__}('
             f'description={self.description!r}, '
@@ -327,7 +871,7 @@ class Todo:
             f'tags={self.tags!r}, '
             f'status={type(self.status).__name__}("{self.status.value}"), '
             f'idx={self.idx!r}'
-            f')'
+            f'{recurrence})'
         )
 
     def __str__(self) -> str:
@@ -0,0 +1,106 @@
+from typing import TYPE_CHECKING
+
+from src.task.tags import TAG_REGISTRY
+from src.task.task import normalize_tag
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from datetime import date
+
+    from src.enums.priority_enum import PriorityEnum
+    from src.enums.status_enum import StatusEnum
+    from src.task.task import Todo
+
+
+class TaskFilter:
+    """Picklable predicate matching tasks against a set of criteria.
+
+    Unset criteria (None) match every task. Criteria are checked from the
+    cheapest to the most expensive and evaluation stops at the first
+    mismatch, so `custom_filter` runs only for tasks passing all others.
+    Instances can be sent to worker processes as long as `custom_filter`
+    is picklable (e.g. a module level function). The tag is compared by
+    its :data:`~src.task.tags.TAG_REGISTRY` id; a tag no task has is not
+    registered and matches nothing until a task gets it.
+    """
+
+    def __init__(
+        self,
+        *,
+        priority: PriorityEnum | None = None,
+        status: StatusEnum | None = None,
+        tag: str | None = None,
+        deadline_before: date | None = None,
+        deadline_after: date | None = None,
+        custom_filter: Callable[[Todo], bool] | None = None,
+    ) -> None:
+        """Initialize the filter criteria.
+
+        Args:
+            priority: Required priority.
+            status: Required status.
+            tag: Required tag membership. Normalized like task tags.
+            deadline_before: Maximum acceptable deadline (inclusive).
+            deadline_after: Minimum acceptable deadline (inclusive).
+            custom_filter: Additional predicate applied to each task.
+        """
+        self.priority = priority
+        self.status = status
+        self.tag = None if tag is None else normalize_tag(tag)
+        self._tag_id = self._resolve_tag_id()
+        self.deadline_before = deadline_before
+        self.deadline_after = deadline_after
+        self.custom_filter = custom_filter
+
+    def _resolve_tag_id(self) -> int | None:
+        return None if self.tag is None else TAG_REGISTRY.id_of(self.tag)
+
+    def _has_tag(self, task: Todo) -> bool:
+        if self._tag_id is None:
+            # Unknown when the filter was built; the tag may have been registered since.
+            self._tag_id = self._resolve_tag_id()
+        return self._tag_id is not None and self._tag_id in task.tags.ids
+
+    def __getstate__(self) -> dict[str, object]:
+        """Return the picklable state of the filter.
+
+        Tag ids are valid only in the current process and are resolved again on unpickling.
+
+        Returns:
+            dict[str, object]: Filter criteria.
+        """
+        state = self.__dict__.copy()
+        del state['_tag_id']
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore a pickled filter and resolve its tag id in this process.
+
+        Args:
+            state: State returned by :meth:`__getstate__`.
+        """
+        self.__dict__.update(state)
+        self._tag_id = self._resolve_tag_id()
+
+    def __call__(self, task: Todo) -> bool:
+        """Check whether a task satisfies all criteria.
+
+        Args:
+            task: The task to check.
+
+        Returns:
+            bool: True if the task matches.
+        """
+        if self.priority is not None and task.priority != self.priority:
+            return False
+        if self.status is not None and task.status != self.status:
+            return False
+        if self.tag is not None and not self._has_tag(task):
+            return False
+        if self.deadline_before is not None and (task.deadline is None or task.deadline > self.deadline_before):
+            return False
+        if self.deadline_after is not None and (task.deadline is None or task.deadline < self.deadline_after):
+            return False
+
+        return self.custom_filter is None or self.custom_filter(task)
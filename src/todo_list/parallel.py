@@ -0,0 +1,130 @@
+from concurrent import futures
+from itertools import chain, compress, repeat
+from math import ceil
+import sys
+from typing import TYPE_CHECKING
+
+from src.task.task import Todo
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
+    from src.schemas.todo_schema import TodoDict
+
+
+CHUNKS_PER_WORKER = 4
+
+PARALLEL_FILTER_THRESHOLD = 20_000
+
+
+def is_free_threaded() -> bool:
+    """Check whether the interpreter runs without the global interpreter lock.
+
+    Returns:
+        bool: True on free-threaded builds with the GIL disabled.
+    """
+    return not sys._is_gil_enabled()
+
+
+def make_executor(workers: int) -> Executor:
+    """Create the pool used for CPU-bound work.
+
+    Threads run Python code in parallel only on free-threaded interpreters;
+    elsewhere a process pool is used and work items are pickled to the workers.
+
+    The pool classes are looked up on use: ``concurrent.futures`` loads them
+    lazily and the process pool would pull ``multiprocessing`` into every
+    start of the CLI.
+
+    Args:
+        workers: Maximum number of workers.
+
+    Returns:
+        Executor: A thread pool on free-threaded builds, a process pool otherwise.
+    """
+    if is_free_threaded():
+        return futures.ThreadPoolExecutor(max_workers=workers)
+    return futures.ProcessPoolExecutor(max_workers=workers)
+
+
+def split_chunks[T](items: Sequence[T], workers: int, chunk_size: int | None = None) -> list[Sequence[T]]:
+    """Split a sequence into contiguous chunks.
+
+    Args:
+        items: Sequence to split.
+        workers: Number of workers the chunks are meant for.
+        chunk_size: Explicit chunk length. Defaults to a few chunks per worker.
+
+    Returns:
+        list[Sequence[T]]: Chunks in the original order.
+    """
+    size = chunk_size or max(1, ceil(len(items) / (workers * CHUNKS_PER_WORKER)))
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _parse_chunk(records: Sequence[TodoDict], trusted: bool) -> list[Todo]:  # noqa: FBT001
+    return [Todo.from_dict(record, trusted=trusted) for record in records]
+
+
+def parse_parallel(
+    records: Sequence[TodoDict],
+    *,
+    workers: int,
+    chunk_size: int | None = None,
+    trusted: bool = False,
+) -> list[Todo]:
+    """Build Todo objects from serialized records using a worker pool.
+
+    The records are split into chunks that are parsed and validated
+    independently; results are merged back in the original order.
+    Duplicate ids are not checked here, that is left to :class:`TodoList`.
+
+    Args:
+        records: Serialized tasks.
+        workers: Number of workers.
+        chunk_size: Number of records per work item. Defaults to a few chunks per worker.
+        trusted: Skip field validation, see :meth:`Todo.from_dict`.
+
+    Returns:
+        list[Todo]: Parsed tasks in the order of `records`.
+    """
+    chunks = split_chunks(records, workers, chunk_size)
+
+    with make_executor(workers) as executor:
+        return [task for chunk in executor.map(_parse_chunk, chunks, repeat(trusted)) for task in chunk]
+
+
+def _mask_chunk(tasks: Sequence[Todo], predicate: Callable[[Todo], bool]) -> list[bool]:
+    return [predicate(task) for task in tasks]
+
+
+def filter_parallel(
+    tasks: Sequence[Todo],
+    predicate: Callable[[Todo], bool],
+    *,
+    workers: int,
+    chunk_size: int | None = None,
+) -> list[Todo]:
+    """Select tasks matching a predicate, evaluating it with a worker pool.
+
+    Every worker returns only a boolean mask for its chunk, which is applied
+    to the original tasks, so the result keeps the original order and holds
+    the very same objects. With a process pool the tasks and the predicate
+    are pickled, so the predicate must be picklable.
+
+    Args:
+        tasks: Tasks to filter.
+        predicate: Callable returning True for tasks to keep.
+        workers: Number of workers.
+        chunk_size: Number of tasks per work item. Defaults to a few chunks per worker.
+
+    Returns:
+        list[Todo]: Matching tasks in their original order.
+    """
+    chunks = split_chunks(tasks, workers, chunk_size)
+
+    with make_executor(workers) as executor:
+        masks = executor.map(_mask_chunk, chunks, repeat(predicate))
+        return list(compress(tasks, chain.from_iterable(masks)))
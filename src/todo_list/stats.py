@@ -0,0 +1,192 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Any, cast
+
+from src.enums.status_enum import StatusEnum
+from src.task.tags import TAG_REGISTRY
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable, Iterable
+    from datetime import date
+
+    from src.enums.priority_enum import PriorityEnum
+    from src.task.task import Todo
+
+
+GROUP_BY_FIELDS = ('status', 'priority', 'tag', 'deadline', 'month')
+
+
+def _bump(counter: Counter[Any], key: Hashable, delta: int) -> None:
+    """Add `delta` to a counter entry, dropping entries that reach zero.
+
+    Args:
+        counter: Counter to update.
+        key: Entry to update.
+        delta: Value added to the entry.
+    """
+    value = counter[key] + delta
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+class TodoStats:
+    """Grouped counters over a collection of tasks, maintained incrementally.
+
+    The counters are built in a single pass over the tasks and then kept up to
+    date through :meth:`add`, :meth:`discard` and the change notifications that
+    every counted :class:`Todo` sends to its observers, so reading a summary
+    never rescans the collection.
+
+    Attributes:
+        total (int): Number of counted tasks.
+        status (Counter[StatusEnum]): Task count per status.
+        priority (Counter[PriorityEnum]): Task count per priority.
+        tag_ids (Counter[int]): Task count per tag id, see :data:`~src.task.tags.TAG_REGISTRY`.
+        deadlines (Counter[date]): Task count per deadline date (tasks without deadline are skipped).
+        open_deadlines (Counter[date]): Like `deadlines`, restricted to tasks that are not completed.
+    """
+
+    def __init__(self, tasks: Iterable[Todo] = ()) -> None:
+        """Count the given tasks and subscribe to their changes.
+
+        Args:
+            tasks: Tasks to count.
+        """
+        self.total = 0
+        self.status: Counter[StatusEnum] = Counter()
+        self.priority: Counter[PriorityEnum] = Counter()
+        self.tag_ids: Counter[int] = Counter()
+        self.deadlines: Counter[date] = Counter()
+        self.open_deadlines: Counter[date] = Counter()
+
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Todo) -> None:
+        """Count a task and start following its changes.
+
+        Args:
+            task: The task to count.
+        """
+        task.subscribe(self)
+        self._count(task, 1)
+
+    def discard(self, task: Todo) -> None:
+        """Stop counting a task and following its changes.
+
+        Args:
+            task: The task to remove from the counters.
+        """
+        task.unsubscribe(self)
+        self._count(task, -1)
+
+    def _count(self, task: Todo, delta: int) -> None:
+        self.total += delta
+        _bump(self.status, task.status, delta)
+        _bump(self.priority, task.priority, delta)
+
+        for tag_id in task.tags.ids:
+            _bump(self.tag_ids, tag_id, delta)
+
+        if task.deadline is not None:
+            _bump(self.deadlines, task.deadline, delta)
+            if task.status != StatusEnum.COMPLETED:
+                _bump(self.open_deadlines, task.deadline, delta)
+
+    def task_changed(self, task: Todo, field: str, old: object, new: object) -> None:
+        """Apply a single field change of a counted task to the counters.
+
+        Args:
+            task: The changed task (already holding the new value).
+            field: Name of the changed field.
+            old: Previous value, or the removed tags for ``tags``.
+            new: New value, or the added tags for ``tags``.
+        """
+        if field == 'priority':
+            _bump(self.priority, old, -1)
+            _bump(self.priority, new, 1)
+        elif field == 'status':
+            _bump(self.status, old, -1)
+            _bump(self.status, new, 1)
+            if task.deadline is not None and (old == StatusEnum.COMPLETED) != (new == StatusEnum.COMPLETED):
+                _bump(self.open_deadlines, task.deadline, 1 if old == StatusEnum.COMPLETED else -1)
+        elif field == 'deadline':
+            self._move_deadline(task, old, new)
+        elif field == 'tags':
+            for tag in cast('Iterable[str]', old):
+                _bump(self.tag_ids, TAG_REGISTRY.intern(tag), -1)
+            for tag in cast('Iterable[str]', new):
+                _bump(self.tag_ids, TAG_REGISTRY.intern(tag), 1)
+
+    @property
+    def tags(self) -> Counter[str]:
+        """Task count per tag, decoded from :attr:`tag_ids`.
+
+        Returns:
+            Counter[str]: Task count per tag.
+        """
+        return Counter({TAG_REGISTRY.name(tag_id): count for tag_id, count in self.tag_ids.items()})
+
+    def _move_deadline(self, task: Todo, old: object, new: object) -> None:
+        counters = [self.deadlines]
+        if task.status != StatusEnum.COMPLETED:
+            counters.append(self.open_deadlines)
+
+        for counter in counters:
+            if old is not None:
+                _bump(counter, old, -1)
+            if new is not None:
+                _bump(counter, new, 1)
+
+    def aggregate(self, group_by: str) -> dict[Any, int]:
+        """Return task counts grouped by a single field.
+
+        Args:
+            group_by: One of ``status``, ``priority``, ``tag``, ``deadline``
+                (per day histogram) or ``month`` (per ``YYYY-MM`` histogram).
+
+        Returns:
+            dict[Any, int]: Counts per group. Tags are ordered by frequency, dates chronologically.
+
+        Raises:
+            ValueError: If `group_by` is not supported.
+        """
+        if group_by == 'status':
+            return dict(self.status)
+        if group_by == 'priority':
+            return dict(self.priority)
+        if group_by == 'tag':
+            return dict(self.tags.most_common())
+        if group_by == 'deadline':
+            return dict(sorted(self.deadlines.items()))
+        if group_by == 'month':
+            months: Counter[str] = Counter()
+            for deadline, count in self.deadlines.items():
+                months[deadline.strftime('%Y-%m')] += count
+            return dict(sorted(months.items()))
+
+        raise ValueError(f'Unsupported group_by: {group_by}. Available: {", ".join(GROUP_BY_FIELDS)}.')
+
+    def overdue(self, today: date) -> int:
+        """Count tasks that are not completed and whose deadline is before `today`.
+
+        Args:
+            today: Reference date.
+
+        Returns:
+            int: Number of overdue tasks.
+        """
+        return sum(count for deadline, count in self.open_deadlines.items() if deadline < today)
+
+    def overdue_ratio(self, today: date) -> float:
+        """Share of overdue tasks among all counted tasks.
+
+        Args:
+            today: Reference date.
+
+        Returns:
+            float: Ratio in range ``[0, 1]``; ``0.0`` for an empty collection.
+        """
+        return self.overdue(today) / self.total if self.total else 0.0
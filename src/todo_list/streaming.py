@@ -0,0 +1,140 @@
+from itertools import batched
+import json
+import re
+from typing import TYPE_CHECKING, cast
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
+    from src.task.task import Todo
+
+
+READ_BUFFER_SIZE = 1 << 16
+
+DUMP_CHUNK_SIZE = 1000
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _StreamBuffer:
+    """Sliding window over a text stream for incremental JSON decoding."""
+
+    def __init__(self, fp: TextIO, buffer_size: int) -> None:
+        self._fp = fp
+        self._buffer_size = buffer_size
+        self._decoder = json.JSONDecoder()
+        self._text = ''
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self._fp.read(self._buffer_size)
+        if not chunk:
+            return False
+        self._text = self._text[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, '' at the end of the stream."""
+        while True:
+            # The pattern also matches the empty string, so there always is a match.
+            self._pos = cast('re.Match[str]', _WHITESPACE.match(self._text, self._pos)).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill():
+                return ''
+
+    def take(self, token: str) -> None:
+        """Consume `token` after optional whitespace.
+
+        Raises:
+            ValueError: If the stream does not continue with `token`.
+        """
+        self.peek()
+        while len(self._text) - self._pos < len(token) and self._fill():
+            pass
+        if not self._text.startswith(token, self._pos):
+            raise ValueError(f'Expected {token!r} in the TodoList JSON stream.')
+        self._pos += len(token)
+
+    def decode(self) -> object:
+        """Decode the next JSON value, reading more of the stream while it is incomplete.
+
+        Raises:
+            ValueError: If the value is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, self._pos = self._decoder.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+            else:
+                return value
+
+
+def iter_task_records(fp: TextIO, *, buffer_size: int = READ_BUFFER_SIZE) -> Iterator[object]:
+    """Decode the task records of a serialized TodoList one at a time.
+
+    The stream is read in blocks of `buffer_size` characters and each task
+    is decoded as soon as it is complete, so memory use depends on the
+    largest task, not on the size of the list. Any whitespace layout of
+    ``{"tasks": [...]}`` is accepted.
+
+    Args:
+        fp: Readable text stream with a serialized TodoList.
+        buffer_size: Number of characters read at a time.
+
+    Yields:
+        object: Decoded task records, not validated.
+
+    Raises:
+        ValueError: If the stream is not valid JSON or not a ``{"tasks": [...]}`` object.
+    """
+    stream = _StreamBuffer(fp, buffer_size)
+
+    for token in ('{', '"tasks"', ':', '['):
+        stream.take(token)
+
+    if stream.peek() == ']':
+        stream.take(']')
+    else:
+        while True:
+            yield stream.decode()
+            if stream.peek() != ',':
+                stream.take(']')
+                break
+            stream.take(',')
+
+    stream.take('}')
+    if stream.peek():
+        raise ValueError('Extra data after the TodoList JSON stream.')
+
+
+def write_tasks(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write tasks as a compact serialized TodoList to a text stream.
+
+    Tasks are consumed lazily and encoded `chunk_size` at a time, so an
+    iterator of any length is written in constant memory. The text equals
+    ``TodoList.to_json()`` of the same tasks.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of tasks encoded per write.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    count = 0
+    fp.write('{"tasks": [')
+    for chunk in batched(tasks, chunk_size, strict=False):
+        if count:
+            fp.write(', ')
+        fp.write(', '.join([task.to_json() for task in chunk]))
+        count += len(chunk)
+    fp.write(']}')
+    return count
@@ -1,22 +1,32 @@
 from collections import Counter
+import heapq
+import io
 import json
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
+from src.metrics import metrics
+from src.schemas.guards.todo_dict_guard import is_todo_dict
 from src.schemas.guards.todo_list_dict_guard import is_todolist_dict
-from src.task.task import Todo
+from src.task.task import Todo, normalize_tag
+from src.todo_list.filters import TaskFilter
+from src.todo_list.parallel import PARALLEL_FILTER_THRESHOLD, filter_parallel, parse_parallel
+from src.todo_list.stats import TodoStats
+from src.todo_list.streaming import DUMP_CHUNK_SIZE, READ_BUFFER_SIZE, iter_task_records, write_tasks
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Callable, Iterable, Iterator
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from datetime import date
-    from uuid import UUID
+    from typing import TextIO
 
     from src.enums.priority_enum import PriorityEnum
     from src.enums.status_enum import StatusEnum
     from src.schemas.todolist_schema import TodoListDict
 
 
-class TodoList:
+class TodoList:  # noqa: PLR0904 - the collection API of the domain model
     """Container class for managing a collection of unique `Todo` objects.
 
     This class accepts any iterable of `Todo` instances and constructs an
@@ -47,7 +57,15 @@ class TodoList:
     ----------
     tasks : list[Todo]
         A new list containing unique tasks in their original order. This list
-        is always a fresh shallow copy—modifying it does not affect the input.
+        is always a fresh shallow copy—modifying it does not affect the input
+        nor the TodoList; use `add`, `remove` or assign `tasks` instead.
+    stats : TodoStats
+        Grouped counters over the tasks, built lazily on first access and then
+        maintained incrementally by `add`, `remove` and task setters.
+
+    Tasks are also indexed by the integer form of their id (`Todo.idx_int`),
+    so `get`, `remove` and membership tests do not scan the list. The index
+    follows `add`, `remove` and assignments to `tasks`.
     """
 
     def __init__(self, tasks: Iterable[Todo] | None = None) -> None:
@@ -64,12 +82,15 @@ class TodoList:
 
     @property
     def tasks(self) -> list[Todo]:
-        """Get the list of tasks.
+        """Get a copy of the list of tasks.
+
+        The id index and the stats follow `add`, `remove` and assignments to
+        `tasks` only, so the internal list is never handed out.
 
         Returns:
-            A list of Todo objects managed by this TodoList.
+            A new list of the Todo objects managed by this TodoList.
         """
-        return self._tasks
+        return list(self._tasks)
 
     @tasks.setter
     def tasks(self, value: Iterable[Todo] | None) -> None:
@@ -83,28 +104,53 @@ class TodoList:
         """
         if value is None:
             self._tasks = []
+            self._index: dict[int, Todo] = {}
         else:
             items = list(value)
-            self._unique_ids(items)
+            self._index = self._unique_ids(items)
             self._tasks = items
 
+        self._stats: TodoStats | None = None
+
+    @property
+    def stats(self) -> TodoStats:
+        """Get the grouped counters over the tasks.
+
+        The counters are computed in a single pass on first access and kept
+        up to date afterwards, so repeated summaries cost O(1) per group.
+
+        Returns:
+            TodoStats: Live counters for this list.
+        """
+        if self._stats is None:
+            self._stats = TodoStats(self._tasks)
+        return self._stats
+
     @staticmethod
-    def _unique_ids(tasks: Iterable[Todo]) -> None:
-        """Validate that all tasks have unique UUIDs.
+    def _unique_ids(tasks: Sequence[Todo]) -> dict[int, Todo]:
+        """Validate that all tasks have unique UUIDs and index them.
 
         Args:
-            tasks: An iterable of Todo objects to validate.
+            tasks: Todo objects to validate.
+
+        Returns:
+            dict[int, Todo]: Tasks keyed by the integer form of their UUID.
 
         Raises:
             ValueError: If duplicate UUIDs are found, with details of the duplicates.
         """
-        ids = [str(task.idx) for task in tasks]
-        counter = Counter(ids)
-        duplicates = [idx for idx, count in counter.items() if count > 1]
-
-        if duplicates:
+        index = {task.idx_int: task for task in tasks}
+        if metrics.enabled:
+            metrics.UNIQUE_IDS_CALLS.inc()
+            metrics.UNIQUE_IDS_TASKS.inc(len(tasks))
+
+        if len(index) != len(tasks):
+            counter = Counter(task.idx_str for task in tasks)
+            duplicates = [idx for idx, count in counter.items() if count > 1]
             raise ValueError(f'Duplicate Todo index values detected: {", ".join(duplicates)}.')
 
+        return index
+
     def add(self, task: Todo) -> None:
         """Add a new task to the list.
 
@@ -114,8 +160,14 @@ class TodoList:
         Raises:
             ValueError: If the task's UUID already exists in the list.
         """
-        self._unique_ids([*self.tasks, task])
-        self.tasks.append(task)
+        if task.idx_int in self._index:
+            raise ValueError(f'Duplicate Todo index values detected: {task.idx_str}.')
+
+        self._index[task.idx_int] = task
+        self._tasks.append(task)
+
+        if self._stats is not None:
+            self._stats.add(task)
 
     def remove(self, idx: UUID) -> None:
         """Remove a task from the list by its UUID.
@@ -126,12 +178,12 @@ class TodoList:
         Raises:
             ValueError: If no task with the given UUID exists.
         """
-        tasks_len = len(self.tasks)
+        task = self.get(idx)
+        del self._index[task.idx_int]
+        self._tasks.remove(task)
 
-        self.tasks = [task for task in self.tasks if task.idx != idx]
-
-        if len(self.tasks) == tasks_len:
-            raise ValueError(f'Task with idx: {idx} not found.')
+        if self._stats is not None:
+            self._stats.discard(task)
 
     def get(self, idx: UUID) -> Todo:
         """Retrieve a task by its UUID.
@@ -145,11 +197,65 @@ class TodoList:
         Raises:
             ValueError: If no task with the given UUID exists.
         """
-        for task in self.tasks:
-            if task.idx == idx:
-                return task
+        task = self._index.get(idx.int)
+        if task is None:
+            raise ValueError(f'Task with idx: {idx} not found.')
+
+        return task
+
+    def clone_matching(
+        self,
+        matches: Callable[[Todo], bool],
+        *,
+        n: int = 1,
+        deadlines: Sequence[date | None] | None = None,
+        drop_tags: Iterable[str] = (),
+    ) -> TodoList:
+        """Clone every matching task `n` times and add the clones to the list.
 
-        raise ValueError(f'Task with idx: {idx} not found.')
+        Each matching task is cloned with :meth:`Todo.clone_many`; all clones
+        are validated against the list in one pass and inserted at once, at
+        the end of the list.
+
+        Args:
+            matches: Predicate selecting the template tasks, e.g. a :class:`TaskFilter`.
+            n: Number of clones per template.
+            deadlines: One deadline per clone, the same for every template.
+                Defaults to the template's deadline, see :meth:`Todo.clone_many`.
+            drop_tags: Tags of the templates that the clones do not inherit.
+
+        Returns:
+            TodoList: New TodoList with the clones, grouped by template.
+
+        Raises:
+            ValueError: If the deadlines are invalid, see :meth:`Todo.clone_many`.
+            ValueError: If a clone's UUID already exists in the list.
+        """
+        dropped = {normalize_tag(tag) for tag in drop_tags}
+        clones = [
+            clone
+            for task in self._tasks
+            if matches(task)
+            for clone in task.clone_many(
+                n,
+                deadlines=deadlines,
+                tags=[tag for tag in task.tags if tag not in dropped] if dropped else None,
+            )
+        ]
+
+        index = self._unique_ids(clones)
+        duplicates = [clone.idx_str for clone in clones if clone.idx_int in self._index]
+        if duplicates:
+            raise ValueError(f'Duplicate Todo index values detected: {", ".join(duplicates)}.')
+
+        self._index.update(index)
+        self._tasks.extend(clones)
+
+        if self._stats is not None:
+            for clone in clones:
+                self._stats.add(clone)
+
+        return TodoList(clones)
 
     def filter_by(
         self,
@@ -160,66 +266,219 @@ class TodoList:
         deadline_before: date | None = None,
         deadline_after: date | None = None,
         custom_filter: Callable[[Todo], bool] | None = None,
+        workers: int = 1,
+        parallel_threshold: int = PARALLEL_FILTER_THRESHOLD,
     ) -> TodoList:
         """Filter tasks using multiple criteria.
 
+        With ``workers > 1`` and at least `parallel_threshold` tasks, the tasks
+        are split into chunks evaluated by a worker pool (see
+        :func:`src.todo_list.parallel.filter_parallel`); smaller lists are
+        always filtered serially because the pool overhead would dominate.
+
         Args:
             priority: Required priority.
             status: Required status.
             tag: Required tag membership.
             deadline_before: Maximum acceptable deadline (inclusive).
             deadline_after: Minimum acceptable deadline (inclusive).
-            custom_filter: Additional predicate applied to each task.
+            custom_filter: Additional predicate applied to each task. Must be
+                picklable when filtering in a process pool.
+            workers: Number of workers for the parallel mode.
+            parallel_threshold: Minimum number of tasks for the parallel mode.
 
         Returns:
             TaskList: New TaskList containing only tasks satisfying all criteria.
         """
+        matches = TaskFilter(
+            priority=priority,
+            status=status,
+            tag=tag,
+            deadline_before=deadline_before,
+            deadline_after=deadline_after,
+            custom_filter=custom_filter,
+        )
+
+        if workers > 1 and len(self._tasks) >= parallel_threshold:
+            result = TodoList(filter_parallel(self._tasks, matches, workers=workers))
+        else:
+            result = TodoList([task for task in self._tasks if matches(task)])
 
-        def matches(t: Todo) -> bool:
-            priority_ok = priority is None or t.priority == priority
-            status_ok = status is None or t.status == status
-            tag_ok = tag is None or tag in t.tags
+        if metrics.enabled:
+            metrics.FILTER_SCANNED.inc(len(self._tasks))
+            metrics.FILTER_RETURNED.inc(len(result))
+        return result
 
-            deadline_before_ok = deadline_before is None or (t.deadline is not None and t.deadline <= deadline_before)
-            deadline_after_ok = deadline_after is None or (t.deadline is not None and t.deadline >= deadline_after)
+    def aggregate(self, group_by: str) -> dict[Any, int]:
+        """Count tasks grouped by a single field.
 
-            custom_ok = custom_filter is None or custom_filter(t)
+        Args:
+            group_by: One of ``status``, ``priority``, ``tag``, ``deadline`` or ``month``.
 
-            return all((
-                priority_ok,
-                status_ok,
-                tag_ok,
-                deadline_before_ok,
-                deadline_after_ok,
-                custom_ok,
-            ))
+        Returns:
+            dict[Any, int]: Counts per group, see :meth:`TodoStats.aggregate`.
 
-        return TodoList([task for task in self.tasks if matches(task)])
+        Raises:
+            ValueError: If `group_by` is not supported.
+        """
+        return self.stats.aggregate(group_by)
 
     def sort_by(self, *, key: Callable[[Todo], Any], reverse: bool = False) -> TodoList:
-        return TodoList(sorted(self.tasks, key=key, reverse=reverse))
+        return TodoList(sorted(self._tasks, key=key, reverse=reverse))
 
     def sort_by_many(self, *keys: Callable[[Todo], Any], reverse: bool = False) -> TodoList:
-        return TodoList(sorted(self.tasks, key=lambda t: tuple(k(t) for k in keys), reverse=reverse))
+        return TodoList(sorted(self._tasks, key=lambda t: tuple(k(t) for k in keys), reverse=reverse))
+
+    def top_k(self, k: int, *keys: Callable[[Todo], Any], reverse: bool = False) -> TodoList:
+        """Select the first `k` tasks ordered by the given keys.
+
+        Equivalent to ``sort_by_many(*keys, reverse=reverse)`` followed by slicing
+        the first `k` tasks, but uses a bounded heap instead of sorting the whole
+        list, so it costs O(n log k) time and keeps only `k` entries in memory.
+        Ties preserve the original order, exactly like the stable full sort.
+
+        Args:
+            k: Maximum number of tasks to select.
+            keys: Key functions compared in order, as in ``sort_by_many``.
+            reverse: Select the largest keys instead of the smallest.
+
+        Returns:
+            TodoList: New TodoList with at most `k` tasks in sorted order.
+        """
+        if k <= 0:
+            return TodoList()
+
+        select = heapq.nlargest if reverse else heapq.nsmallest
+
+        return TodoList(select(k, self._tasks, key=lambda t: tuple(key(t) for key in keys)))
+
+    def occurrences(self, start: date, end: date) -> Iterator[Todo]:
+        """Generate the virtual instances of all recurring tasks due within a window.
+
+        The per-task generators of :meth:`Todo.occurrences` are merged lazily,
+        so the instances are produced one at a time in deadline order and only
+        while the iterator is consumed. Nothing is added to the list.
+
+        Args:
+            start: First deadline of the window (inclusive).
+            end: Last deadline of the window (inclusive).
+
+        Returns:
+            Iterator[Todo]: Virtual instances ordered by deadline.
+        """
+        recurring = [task.occurrences(start, end) for task in self._tasks if task.recurrence is not None]
+        return heapq.merge(*recurring, key=attrgetter('deadline'))
+
+    def with_occurrences(self, start: date, end: date) -> TodoList:
+        """Extend the tasks with the virtual instances due within a window.
+
+        The result is a new TodoList, so sorting, filtering and deadline
+        queries treat the virtual instances like stored tasks while this list
+        and its store are left unchanged.
+
+        Args:
+            start: First deadline of the window (inclusive).
+            end: Last deadline of the window (inclusive).
+
+        Returns:
+            TodoList: New TodoList with the tasks followed by the virtual instances.
+        """
+        return TodoList([*self._tasks, *self.occurrences(start, end)])
 
     def to_dict(self) -> TodoListDict:
         return {'tasks': [task.to_dict() for task in self]}
 
     @classmethod
-    def from_dict(cls, data: TodoListDict) -> TodoList:
-        return cls(tasks=[Todo.from_dict(todo) for todo in data['tasks']])
+    def from_dict(cls, data: TodoListDict, *, workers: int = 1, trusted: bool = False) -> TodoList:
+        """Build a TodoList from its serialized form.
+
+        Args:
+            data: Serialized todo list.
+            workers: Number of workers parsing the tasks. With more than one worker
+                the tasks are parsed in chunks by a worker pool, keeping their order.
+            trusted: Build the tasks without validating and normalizing their
+                fields, see :meth:`Todo.from_dict`. Ids are still checked for duplicates.
+
+        Returns:
+            TodoList: Deserialized todo list.
+
+        Raises:
+            ValueError: If duplicate Todo UUIDs are detected.
+        """
+        if workers > 1:
+            return cls(tasks=parse_parallel(data['tasks'], workers=workers, trusted=trusted))
+
+        return cls(tasks=[Todo.from_dict(todo, trusted=trusted) for todo in data['tasks']])
 
     def to_json(self, *, indent: int | None = None) -> str:
+        if indent is None:
+            buffer = io.StringIO()
+            self.dump(buffer)
+            return buffer.getvalue()
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
 
+    def dump(self, fp: TextIO, *, chunk_size: int = DUMP_CHUNK_SIZE) -> None:
+        """Write the list as compact JSON to a text stream.
+
+        Tasks are encoded straight from their fields (see :meth:`Todo.write_json`)
+        and written `chunk_size` tasks at a time, so the memory overhead is
+        bounded by one chunk whatever the size of the list. The text equals
+        :meth:`to_json` without indentation.
+
+        Args:
+            fp: Writable text stream.
+            chunk_size: Number of tasks encoded per write.
+        """
+        write_tasks(fp, self._tasks, chunk_size=chunk_size)
+
+    @classmethod
+    @metrics.DECODE_SECONDS.timed
+    def load_stream(cls, fp: TextIO, *, trusted: bool = False, buffer_size: int = READ_BUFFER_SIZE) -> TodoList:
+        """Read a list written by :meth:`dump` or :meth:`to_json` from a text stream.
+
+        The stream is decoded incrementally (see
+        :func:`~src.todo_list.streaming.iter_task_records`) and every task
+        is built as soon as its record is complete, so the whole document is
+        never held in memory.
+
+        Args:
+            fp: Readable text stream.
+            trusted: Build the tasks without validating and normalizing their
+                fields, see :meth:`Todo.from_dict`.
+            buffer_size: Number of characters read at a time.
+
+        Returns:
+            TodoList: Deserialized todo list.
+
+        Raises:
+            ValueError: If the stream is not valid JSON or not a serialized TodoList.
+            ValueError: If duplicate Todo UUIDs are detected.
+            TypeError: If a task record has an invalid structure.
+        """
+        todo_list = cls(tasks=cls._iter_stream_tasks(fp, trusted=trusted, buffer_size=buffer_size))
+        if metrics.enabled:
+            metrics.DECODED_RECORDS.inc(len(todo_list))
+        return todo_list
+
+    @staticmethod
+    def _iter_stream_tasks(fp: TextIO, *, trusted: bool, buffer_size: int) -> Iterator[Todo]:
+        for record in iter_task_records(fp, buffer_size=buffer_size):
+            if not is_todo_dict(record):
+                raise TypeError('Invalid TodoList JSON structure.')
+            yield Todo.from_dict(record, trusted=trusted)
+
     @classmethod
-    def from_json(cls, raw: str) -> TodoList:
+    @metrics.DECODE_SECONDS.timed
+    def from_json(cls, raw: str, *, workers: int = 1, trusted: bool = False) -> TodoList:
         payload: Any = json.loads(raw)
 
         if not is_todolist_dict(payload):
             raise TypeError('Invalid TodoList JSON structure.')
 
-        return cls.from_dict(payload)
+        todo_list = cls.from_dict(payload, workers=workers, trusted=trusted)
+        if metrics.enabled:
+            metrics.DECODED_RECORDS.inc(len(todo_list))
+        return todo_list
 
     def __len__(self) -> int:
         return len(self._tasks)
@@ -227,8 +486,8 @@ class TodoList:
     def __iter__(self) -> Iterator[Todo]:
         return iter(self._tasks)
 
-    def __contains__(self, idx: UUID) -> bool:
-        return any(task.idx == idx for task in self.tasks)
+    def __contains__(self, idx: object) -> bool:
+        return isinstance(idx, UUID) and idx.int in self._index
 
     def __getitem__(self, index: int) -> Todo:
-        return self.tasks[index]
+        return self._tasks[index]
@@ -2,3 +2,14 @@ from rich.console import Console
 
 
 console = Console()
+
+err_console = Console(stderr=True)
+
+
+def stdout_is_terminal() -> bool:
+    """Tell whether the standard output is an interactive terminal rather than a pipe or a file.
+
+    Returns:
+        bool: ``True`` when output goes to a terminal, as detected by Rich.
+    """
+    return console.is_terminal
@@ -0,0 +1,187 @@
+import csv
+from itertools import batched
+from typing import TYPE_CHECKING
+
+from src.enums.output_format_enum import OutputFormatEnum
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.dates import format_date
+from src.task.tags import TAG_REGISTRY
+from src.todo_list.streaming import DUMP_CHUNK_SIZE, write_tasks
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+    from typing import TextIO
+
+    from src.task.task import Todo
+
+
+COLUMNS = ('id', 'status', 'priority', 'description', 'deadline', 'tags')
+
+# Fixed width prefixes of the plain format, so no cell has to be measured.
+_PLAIN_STATUS = {status: f'{status.value:<11}' for status in StatusEnum}
+
+_PLAIN_PRIORITY = {priority: f'{priority.name:<6}' for priority in PriorityEnum}
+
+_PLAIN_NO_DEADLINE = f'{"-":<10}'
+
+_ROW_PRIORITY = {priority: priority.name.lower() for priority in PriorityEnum}
+
+
+class _CsvDialect(csv.excel):
+    lineterminator = '\n'
+
+
+class _TsvDialect(csv.excel_tab):
+    # Fields are escaped by _tsv_row, so the writer has nothing left to quote or escape.
+    quoting = csv.QUOTE_NONE
+    quotechar = None
+    escapechar = None
+    lineterminator = '\n'
+
+
+_TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _plain_line(task: Todo) -> str:
+    deadline = task.deadline
+    tags = task.tags
+    return (
+        f'{_PLAIN_STATUS[task.status]} {_PLAIN_PRIORITY[task.priority]} '
+        f'{_PLAIN_NO_DEADLINE if deadline is None else format_date(deadline)} {task.description}'
+        f'{f" [{', '.join(tags)}]" if tags else ""}\n'
+    )
+
+
+def _row(task: Todo) -> tuple[str, ...]:
+    # Statuses are str enums, written as their value. Tags are decoded from
+    # their ids directly, which is cheaper than iterating the tags view.
+    deadline = task.deadline
+    return (
+        task.idx_str,
+        task.status,
+        _ROW_PRIORITY[task.priority],
+        task.description,
+        '' if deadline is None else format_date(deadline),
+        ','.join(TAG_REGISTRY.names(task.tags.ids)),
+    )
+
+
+def _tsv_row(task: Todo) -> tuple[str, ...]:
+    return tuple(field.translate(_TSV_ESCAPES) for field in _row(task))
+
+
+def write_plain(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write one aligned, human readable line per task.
+
+    Status, priority and deadline have a fixed width, followed by the
+    description and the tags in brackets. Unlike the Rich table nothing is
+    measured or wrapped, so lines are written as fast as they are formatted.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of lines formatted per write.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    count = 0
+    for chunk in batched(tasks, chunk_size, strict=False):
+        fp.write(''.join(map(_plain_line, chunk)))
+        count += len(chunk)
+    return count
+
+
+def _write_rows(
+    fp: TextIO,
+    tasks: Iterable[Todo],
+    chunk_size: int,
+    dialect: type[csv.Dialect],
+    row: Callable[[Todo], tuple[str, ...]],
+) -> int:
+    rows = csv.writer(fp, dialect)
+    rows.writerow(COLUMNS)
+    count = 0
+    for chunk in batched(tasks, chunk_size, strict=False):
+        rows.writerows(map(row, chunk))
+        count += len(chunk)
+    return count
+
+
+def write_csv(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write the tasks as CSV with a header row of :data:`COLUMNS`.
+
+    Tags are joined with commas into one field; fields are quoted when needed.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of rows encoded per call of the CSV writer.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    return _write_rows(fp, tasks, chunk_size, _CsvDialect, _row)
+
+
+def write_tsv(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write the tasks as tab separated values with a header row of :data:`COLUMNS`.
+
+    Fields are never quoted; tabs, line breaks and backslashes inside them
+    are written as ``\\t``, ``\\n``, ``\\r`` and ``\\\\``, so every task is
+    exactly one line.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of rows encoded per call of the CSV writer.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    return _write_rows(fp, tasks, chunk_size, _TsvDialect, _tsv_row)
+
+
+def write_ndjson(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write one compact JSON record per line, as stored in an NDJSON store.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of tasks encoded per write.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    count = 0
+    for chunk in batched(tasks, chunk_size, strict=False):
+        fp.write(''.join([f'{task.to_json()}\n' for task in chunk]))
+        count += len(chunk)
+    return count
+
+
+def write_json(fp: TextIO, tasks: Iterable[Todo], *, chunk_size: int = DUMP_CHUNK_SIZE) -> int:
+    """Write the tasks as a serialized TodoList, readable by ``TodoList.from_json``.
+
+    Args:
+        fp: Writable text stream.
+        tasks: Tasks to write, in order.
+        chunk_size: Number of tasks encoded per write.
+
+    Returns:
+        int: Number of written tasks.
+    """
+    count = write_tasks(fp, tasks, chunk_size=chunk_size)
+    fp.write('\n')
+    return count
+
+
+WRITERS: dict[OutputFormatEnum, Callable[[TextIO, Iterable[Todo]], int]] = {
+    OutputFormatEnum.PLAIN: write_plain,
+    OutputFormatEnum.TSV: write_tsv,
+    OutputFormatEnum.CSV: write_csv,
+    OutputFormatEnum.JSON: write_json,
+    OutputFormatEnum.NDJSON: write_ndjson,
+}
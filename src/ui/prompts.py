@@ -1,8 +1,6 @@
 from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING
 
-import questionary
-from questionary import Style
 import typer
 
 from src.enums.priority_enum import PriorityEnum
@@ -11,14 +9,33 @@ from src.ui.console import console
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable  # pragma: no cover
+    from collections.abc import Iterable, Sequence  # pragma: no cover
 
-style = Style([
+STYLE_RULES = [
     ('highlighted', 'fg:#ffffff bg:#44475a bold'),
     ('pointer', 'fg:#50fa7b bold'),
     ('selected', 'fg:#50fa7b'),
     ('question', 'bold'),
-])
+]
+
+
+def _select(message: str, choices: Sequence[str]) -> str | None:
+    """Show a selection menu.
+
+    questionary, and prompt_toolkit under it, take longer to import than the
+    rest of the CLI together and only the interactive prompts need them, so
+    they are imported on the first menu instead of at start-up.
+
+    Args:
+        message: Question shown above the menu.
+        choices: Menu entries.
+
+    Returns:
+        str | None: Selected entry, None if the user cancelled.
+    """
+    import questionary  # noqa: PLC0415
+
+    return questionary.select(message, choices=choices, style=questionary.Style(STYLE_RULES)).ask()
 
 
 def prompt_description() -> str:
@@ -50,7 +67,7 @@ def prompt_priority() -> PriorityEnum:
     """
     options = [p.name.title() for p in PriorityEnum]
 
-    answer = questionary.select('Choose priority: ', choices=options, style=style).ask()
+    answer = _select('Choose priority: ', options)
 
     if answer is None:
         raise typer.Abort()
@@ -70,7 +87,7 @@ def prompt_status() -> StatusEnum:
         typer.Abort: If the user cancels the selection.
     """
     options = [s.value.title().replace('_', ' ') for s in StatusEnum]
-    answer = questionary.select('Choose status: ', choices=options, style=style).ask()
+    answer = _select('Choose status: ', options)
 
     if answer is None:
         raise typer.Abort()
@@ -101,7 +118,7 @@ def prompt_deadline_graphical() -> date | None:
         'Pick exact date (YYYY-MM-DD)',
     ]
 
-    answer = questionary.select('Choose deadline: ', choices=options, style=style).ask()
+    answer = _select('Choose deadline: ', options)
     if answer is None:
         raise typer.Abort()
 
@@ -161,4 +178,8 @@ def prompt_menu(choices: Iterable[str]) -> str:
     Raises:
         typer.Abort: If the user cancels the selection.
     """
-    return questionary.select('Menu', choices=list(choices), style=style).ask()
+    answer = _select('Menu', list(choices))
+    if answer is None:
+        raise typer.Abort()
+
+    return answer
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from rich import box
 from rich.table import Table
@@ -7,18 +8,70 @@ from src.enums.priority_enum import PriorityEnum
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping  # pragma: no cover
+
+    from src.task.task import Todo  # pragma: no cover
     from src.todo_list.todo_list import TodoList  # pragma: no cover
 
 
-def build_tasks_table(tasks: TodoList) -> Table:
+PRIORITY_COLORS: dict[PriorityEnum, str] = {
+    PriorityEnum.HIGH: 'red',
+    PriorityEnum.MEDIUM: 'yellow',
+    PriorityEnum.LOW: 'green',
+}
+
+# Cells of the last rendered row of each task, with the task version they were built from.
+_row_cells: WeakKeyDictionary[Todo, tuple[int, tuple[str, ...]]] = WeakKeyDictionary()
+
+
+def task_row_cells(task: Todo) -> tuple[str, ...]:
+    """Get the status, priority, description, deadline and tags cells of a task row.
+
+    The cells are memoised per task and rebuilt only when the task
+    :attr:`~src.task.task.Todo.version` changed since they were built, so
+    rendering the same tasks again, e.g. in the interactive loop, prepares
+    only the rows of changed tasks. Entries are dropped with their task.
+
+    Args:
+        task (Todo): Task of the row.
+
+    Returns:
+        tuple[str, ...]: Cells of the row, without the row number.
+    """
+    cached = _row_cells.get(task)
+    if cached is not None and cached[0] == task.version:
+        return cached[1]
+
+    priority_color = PRIORITY_COLORS.get(task.priority, 'white')
+    cells = (
+        task.status.value.center(6),
+        f'[{priority_color}]{task.priority.name}[/{priority_color}]',
+        task.description,
+        str(task.deadline),
+        ', '.join(task.tags) if task.tags else '-',
+    )
+    _row_cells[task] = (task.version, cells)
+    return cells
+
+
+def build_tasks_table(tasks: TodoList, positions: Mapping[int, int] | None = None) -> Table:
     """Build a formatted table representation of tasks.
 
     Creates a rich table displaying task attributes such as status,
     priority, description, deadline, and tags. Priority values are
-    color-coded for better readability.
+    color-coded for better readability. Row cells are reused from earlier
+    tables while their task is unchanged, see :func:`task_row_cells`.
+
+    Rows are numbered 1 to n, the task ids read by ``remove-task`` and
+    ``update-task``, when `tasks` is the stored list in its order. A
+    sorted or filtered view passes the stored positions instead; tasks
+    without one are shown with ``-``.
 
     Args:
         tasks (TodoList): Collection of tasks to display.
+        positions (Mapping[int, int] | None): 1-based stored position per
+            task id (:attr:`~src.task.task.Todo.idx_int`); rows are numbered
+            in order when omitted.
 
     Returns:
         Table: Renderable rich table with task data.
@@ -32,26 +85,36 @@ def build_tasks_table(tasks: TodoList) -> Table:
     table.add_column('Deadline', justify='center')
     table.add_column('Tags', style='blue')
 
-    priority_colors: dict[PriorityEnum, str] = {
-        PriorityEnum.HIGH: 'red',
-        PriorityEnum.MEDIUM: 'yellow',
-        PriorityEnum.LOW: 'green',
-    }
-
-    for idx, task in enumerate(tasks, 1):
-        status_icon = task.status.value
-        priority_color = priority_colors.get(task.priority, 'white')
-        priority_text = f'[{priority_color}]{task.priority.name}[/{priority_color}]'
-
-        tags = ', '.join(task.tags) if task.tags else '-'
-
-        table.add_row(
-            str(idx),
-            status_icon.center(6),
-            priority_text,
-            task.description,
-            str(task.deadline),
-            tags,
-        )
+    if positions is None:
+        for idx, task in enumerate(tasks, 1):
+            table.add_row(str(idx), *task_row_cells(task))
+    else:
+        for task in tasks:
+            position = positions.get(task.idx_int)
+            table.add_row('-' if position is None else str(position), *task_row_cells(task))
+
+    return table
+
+
+def build_counts_table(title: str, counts: Mapping[object, int], total: int) -> Table:
+    """Build a two column table with counts and their share of the total.
+
+    Args:
+        title (str): Table title.
+        counts (Mapping[object, int]): Count per group, rendered in the given order.
+        total (int): Number used as the base for the share column.
+
+    Returns:
+        Table: Renderable rich table with one row per group.
+    """
+    table = Table(title=title, show_header=True, header_style='bold magenta', box=box.SIMPLE)
+
+    table.add_column('Group', style='cyan')
+    table.add_column('Count', justify='right')
+    table.add_column('Share', justify='right', style='dim')
+
+    for group, count in counts.items():
+        share = count / total if total else 0.0
+        table.add_row(str(group), str(count), f'{share:.1%}')
 
     return table
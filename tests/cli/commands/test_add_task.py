@@ -6,6 +6,7 @@ import typer
 from src.cli.commands.add_task import add_task
 from src.enums.priority_enum import PriorityEnum
 from src.enums.status_enum import StatusEnum
+from src.task.recurrence import Recurrence
 
 
 if TYPE_CHECKING:
@@ -56,22 +57,13 @@ def test_add_task_happy_path(monkeypatch: pytest.MonkeyPatch, dummy_todo_list: D
     def fake_prompt_tags() -> list[str]:
         return ['python']
 
-    def fake_get_todo_list() -> DummyTodoList:
-        return dummy_todo_list
-
-    saved: dict[str, bool] = {'called': False}
-
-    def fake_save() -> None:
-        saved['called'] = True
-
     monkeypatch.setattr('src.cli.commands.add_task.console.print', fake_print)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_description', fake_prompt_description)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_priority', fake_prompt_priority)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_status', fake_prompt_status)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_deadline_graphical', fake_prompt_deadline)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_tags', fake_prompt_tags)
-    monkeypatch.setattr('src.cli.commands.add_task.get_todo_list', fake_get_todo_list)
-    monkeypatch.setattr('src.cli.commands.add_task.save_todo_list', fake_save)
+    monkeypatch.setattr('src.cli.commands.add_task.append_task', dummy_todo_list.add)
 
     add_task()
 
@@ -83,8 +75,7 @@ def test_add_task_happy_path(monkeypatch: pytest.MonkeyPatch, dummy_todo_list: D
     assert task.status == StatusEnum.TODO
     assert task.deadline is None
     assert task.tags == ['python']
-
-    assert saved['called'] is True
+    assert task.recurrence is None
 
     assert any('Added:' in str(call) for call in printed)
 
@@ -115,3 +106,27 @@ def test_add_task_abort_on_deadline(
 
     with pytest.raises(typer.Exit):
         add_task()
+
+
+def test_add_task_with_repeat(monkeypatch: pytest.MonkeyPatch, dummy_todo_list: DummyTodoList) -> None:
+    monkeypatch.setattr('src.cli.commands.add_task.console.print', lambda *_: None)
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_description', lambda: 'Weekly review')
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_priority', lambda: PriorityEnum.MEDIUM)
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_status', lambda: StatusEnum.TODO)
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_deadline_graphical', lambda: None)
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_tags', list)
+    monkeypatch.setattr('src.cli.commands.add_task.append_task', dummy_todo_list.add)
+
+    add_task(repeat='weekly')
+
+    assert dummy_todo_list.tasks[0].recurrence == Recurrence(7)
+
+
+def test_add_task_rejects_invalid_repeat_before_prompting(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail() -> str:
+        raise AssertionError
+
+    monkeypatch.setattr('src.cli.commands.add_task.prompt_description', fail)
+
+    with pytest.raises(typer.BadParameter, match='Recurrence'):
+        add_task(repeat='monthly')
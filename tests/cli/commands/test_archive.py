@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING
+
+from src.cli.commands.archive import archive
+
+
+if TYPE_CHECKING:
+    import pytest
+
+    from src.task.task import Todo
+    from src.todo_list.todo_list import TodoList
+
+
+def test_archive_saves_after_moving_tasks(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList, todo_completed: Todo
+) -> None:
+    """
+    Should archive with the given age and save the shrunk list.
+    """
+    printed: list[str] = []
+    calls: dict[str, object] = {}
+
+    def fake_archive_tasks(todo_list: TodoList, days: int) -> list[Todo]:
+        calls['archive'] = (todo_list, days)
+        return [todo_completed]
+
+    monkeypatch.setattr('src.cli.commands.archive.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.archive.archive_tasks', fake_archive_tasks)
+    monkeypatch.setattr('src.cli.commands.archive.save_todo_list', lambda: calls.setdefault('saved', True))
+    monkeypatch.setattr('src.cli.commands.archive.console.print', printed.append)
+
+    archive(days=7)
+
+    assert calls == {'archive': (mixed_todo_list, 7), 'saved': True}
+    assert printed == ['[green]Archived:[/green] 1 completed task(s)']
+
+
+def test_archive_uses_policy_or_default_age(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should fall back to ARCHIVE_AFTER_DAYS and then to 30 days, without saving when nothing moved.
+    """
+    printed: list[str] = []
+    ages: list[int] = []
+
+    def fake_archive_tasks(_: TodoList, days: int) -> list[Todo]:
+        ages.append(days)
+        return []
+
+    def fail() -> None:
+        raise AssertionError
+
+    monkeypatch.setattr('src.cli.commands.archive.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.archive.archive_tasks', fake_archive_tasks)
+    monkeypatch.setattr('src.cli.commands.archive.save_todo_list', fail)
+    monkeypatch.setattr('src.cli.commands.archive.console.print', printed.append)
+
+    monkeypatch.setenv('ARCHIVE_AFTER_DAYS', '90')
+    archive()
+    monkeypatch.delenv('ARCHIVE_AFTER_DAYS')
+    archive()
+
+    assert ages == [90, 30]
+    assert printed == ['[yellow]No tasks to archive.[/yellow]'] * 2
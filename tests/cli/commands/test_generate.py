@@ -0,0 +1,110 @@
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+import typer
+
+from src.cli.commands.generate import generate, parse_weights, parse_word_range
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.storage.ndjson import NdjsonStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_generate_streams_tasks_to_the_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Should write the requested number of tasks in the format of the output name.
+    """
+    printed: list[str] = []
+    output = tmp_path / 'load.ndjson'
+    monkeypatch.setattr('src.cli.commands.generate.console.print', printed.append)
+
+    generate(25, output, seed=3, priorities='high=1', statuses='todo=1', words='2-2', max_tags=0)
+
+    tasks = NdjsonStore(output).load()
+    assert len(tasks) == 25
+    assert {task.priority for task in tasks} == {PriorityEnum.HIGH}
+    assert {task.status for task in tasks} == {StatusEnum.TODO}
+    assert all(len(task.description.split()) == 2 and not task.tags for task in tasks)
+    assert printed == [f'[green]Generated:[/green] 25 task(s) in {output}']
+
+
+def test_generate_is_reproducible(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Should generate equal stores for equal seeds.
+    """
+    monkeypatch.setattr('src.cli.commands.generate.console.print', lambda _: None)
+
+    generate(10, tmp_path / 'a.json', seed=5)
+    generate(10, tmp_path / 'b.json', seed=5)
+
+    first = json.loads((tmp_path / 'a.json').read_text(encoding='utf-8'))
+    assert first == json.loads((tmp_path / 'b.json').read_text(encoding='utf-8'))
+    assert len(first['tasks']) == 10
+
+
+def test_generate_refuses_to_replace_without_force(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Should keep an existing file unless --force is given.
+    """
+    output = tmp_path / 'store.json'
+    output.write_text('keep', encoding='utf-8')
+    monkeypatch.setattr('src.cli.commands.generate.console.print', lambda _: None)
+
+    with pytest.raises(typer.BadParameter, match='already exists'):
+        generate(1, output)
+    assert output.read_text(encoding='utf-8') == 'keep'
+
+    generate(1, output, force=True)
+    assert len(json.loads(output.read_text(encoding='utf-8'))['tasks']) == 1
+
+
+@pytest.mark.parametrize(
+    ('options', 'message'),
+    [
+        ({'words': '5-2'}, 'Description length'),
+        ({'priorities': 'low=0'}, 'Priority weights'),
+    ],
+)
+def test_generate_reports_invalid_options(tmp_path: Path, options: dict[str, str], message: str) -> None:
+    """
+    Should turn invalid generator settings into a usage error before writing.
+    """
+    output = tmp_path / 'store.json'
+
+    with pytest.raises(typer.BadParameter, match=message):
+        generate(1, output, **options)  # type: ignore[arg-type]
+    assert not output.exists()
+
+
+def test_generate_rejects_a_directory(tmp_path: Path) -> None:
+    """
+    Should refuse to stream into a sharded store.
+    """
+    with pytest.raises(typer.BadParameter, match='sharded store'):
+        generate(1, tmp_path, force=True)
+
+
+def test_parse_weights() -> None:
+    assert parse_weights('todo=2, In_Progress=0.5', StatusEnum, '--statuses') == {
+        StatusEnum.TODO: 2,
+        StatusEnum.IN_PROGRESS: 0.5,
+    }
+
+    with pytest.raises(typer.BadParameter, match="Invalid weight 'urgent=1'"):
+        parse_weights('urgent=1', PriorityEnum, '--priorities')
+    with pytest.raises(typer.BadParameter, match="Invalid weight 'low'"):
+        parse_weights('low', PriorityEnum, '--priorities')
+
+
+@pytest.mark.parametrize(('text', 'expected'), [('3-12', (3, 12)), ('4', (4, 4))])
+def test_parse_word_range(text: str, expected: tuple[int, int]) -> None:
+    assert parse_word_range(text) == expected
+
+
+def test_parse_word_range_invalid() -> None:
+    with pytest.raises(typer.BadParameter, match='Invalid word range'):
+        parse_word_range('few')
@@ -1,12 +1,21 @@
-from typing import TYPE_CHECKING
-
+import pytest
 from rich.table import Table
+import typer
 
-from src.cli.commands.list_tasks import list_tasks
+import src.cli.commands.list_tasks as list_tasks_module
+from src.cli.commands.list_tasks import list_tasks, parse_sort_keys
+from src.enums.output_format_enum import OutputFormatEnum
+from src.enums.status_enum import StatusEnum
+from src.task.recurrence import Recurrence
+from src.task.task import Todo
+from src.todo_list.todo_list import TodoList
+from tests.conftest import _FixedDateTime
 
 
-if TYPE_CHECKING:
-    import pytest
+@pytest.fixture(autouse=True)
+def terminal_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let list_tasks render tables by default, as on a terminal."""
+    monkeypatch.setattr('src.cli.commands.list_tasks.stdout_is_terminal', lambda: True)
 
 
 class DummyTodoList:
@@ -18,6 +27,9 @@ class DummyTodoList:
     def __len__(self) -> int:
         return self._size
 
+    def with_occurrences(self, *_: object) -> DummyTodoList:
+        return self
+
 
 def test_list_tasks_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
     """
@@ -55,7 +67,7 @@ def test_list_tasks_when_tasks_exist(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_get_todo_list() -> DummyTodoList:
         return DummyTodoList(3)
 
-    def fake_build_tasks_table(todo_list: DummyTodoList) -> Table:
+    def fake_build_tasks_table(todo_list: DummyTodoList, _: object = None) -> Table:
         return Table(title='Tasks')
 
     monkeypatch.setattr('src.cli.commands.list_tasks.console.print', fake_print)
@@ -71,3 +83,252 @@ def test_list_tasks_when_tasks_exist(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert isinstance(table, Table)
     assert table.title == 'Tasks'
+
+
+def test_list_tasks_top_uses_top_k(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should select the N most urgent tasks with the default priority/deadline keys.
+    """
+
+    captured: dict[str, object] = {}
+
+    def fake_build_tasks_table(todo_list: TodoList, positions: dict[int, int] | None = None) -> Table:
+        captured['tasks'] = todo_list
+        captured['positions'] = positions
+        return Table(title='Tasks')
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fake_build_tasks_table)
+
+    list_tasks(top=2)
+
+    assert [t.description for t in captured['tasks']] == ['Learn FastAPI', 'Learn Java']  # type: ignore[union-attr]
+    assert captured['positions'] == {task.idx_int: n for n, task in enumerate(mixed_todo_list, 1)}
+
+
+def test_list_tasks_by_sorts_whole_list(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should sort all tasks when only sort keys are given.
+    """
+
+    captured: dict[str, TodoList] = {}
+
+    def fake_build_tasks_table(todo_list: TodoList, _: object = None) -> Table:
+        captured['tasks'] = todo_list
+        return Table(title='Tasks')
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fake_build_tasks_table)
+
+    list_tasks(by='deadline, description')
+
+    assert [t.description for t in captured['tasks']] == [
+        'Learn FastAPI',
+        'Learn Java',
+        'Learn MongoDB',
+        'Task without deadline',
+    ]
+
+
+def test_parse_sort_keys_rejects_unknown_key() -> None:
+    with pytest.raises(typer.BadParameter, match='Unknown sort key: urgency'):
+        parse_sort_keys('priority,urgency')
+
+
+def test_parse_sort_keys_created_order(todo_1: Todo) -> None:
+    keys = parse_sort_keys('created')
+
+    assert keys[0](todo_1) == todo_1.created_at
+
+
+def test_list_tasks_status_loads_selected_statuses(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should ask the state only for the requested statuses.
+    """
+
+    requested: list[list[StatusEnum]] = []
+
+    def fake_load(statuses: list[StatusEnum]) -> TodoList:
+        requested.append(statuses)
+        return mixed_todo_list.filter_by(status=StatusEnum.COMPLETED)
+
+    def fail() -> TodoList:
+        raise AssertionError
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', fail)
+    monkeypatch.setattr('src.cli.commands.list_tasks.load_tasks_with_status', fake_load)
+
+    list_tasks(status=[StatusEnum.COMPLETED], output_format=OutputFormatEnum.CSV)
+
+    assert requested == [[StatusEnum.COMPLETED]]
+
+
+def test_list_tasks_status_table_shows_stored_positions(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList
+) -> None:
+    """
+    Should number the filtered rows with their positions in the whole list.
+    """
+
+    captured: dict[str, object] = {}
+
+    def fake_build_tasks_table(todo_list: TodoList, positions: dict[int, int] | None = None) -> Table:
+        captured['rows'] = [(positions or {}).get(task.idx_int) for task in todo_list]
+        return Table()
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr(
+        'src.cli.commands.list_tasks.load_tasks_with_status',
+        lambda statuses: TodoList(task for task in mixed_todo_list if task.status in statuses),
+    )
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fake_build_tasks_table)
+
+    list_tasks(status=[StatusEnum.COMPLETED, StatusEnum.IN_PROGRESS])
+
+    assert captured['rows'] == [2, 3]
+
+
+def test_list_tasks_include_archived(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should extend the listed tasks with the archive only on request.
+    """
+
+    captured: dict[str, object] = {}
+    printed: list[Table] = []
+
+    def fake_with_archived(todo_list: TodoList, statuses: list[StatusEnum] | None) -> TodoList:
+        captured['statuses'] = statuses
+        return TodoList([*todo_list, Todo(description='Archived task', status=StatusEnum.COMPLETED)])
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', printed.append)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.with_archived_tasks', fake_with_archived)
+
+    list_tasks(include_archived=True)
+
+    assert captured == {'statuses': None}
+    assert list(printed[0].columns[0]._cells) == ['1', '2', '3', '4', '-']
+
+
+def test_list_tasks_shows_recurring_occurrences(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should list the occurrences within a requested horizon, unless filtered out by status.
+    """
+
+    shown: list[int] = []
+
+    def fake_build_tasks_table(todo_list: TodoList, _: object = None) -> Table:
+        shown.append(len(todo_list))
+        return Table()
+
+    mixed_todo_list.tasks[0].recurrence = Recurrence(1)
+    monkeypatch.setattr(list_tasks_module, 'datetime', _FixedDateTime)
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.load_tasks_with_status', lambda _: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fake_build_tasks_table)
+
+    list_tasks(horizon=7)
+    list_tasks()
+    list_tasks(horizon=30, status=[StatusEnum.TODO])
+    list_tasks(status=[StatusEnum.COMPLETED])
+
+    assert shown == [4 + 5, 4, 4 + 28, 4]
+
+
+def test_list_tasks_shows_occurrences_without_a_number(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList
+) -> None:
+    """
+    Should not number occurrences, which remove-task and update-task cannot address.
+    """
+
+    printed: list[Table] = []
+
+    mixed_todo_list.tasks[0].recurrence = Recurrence(1)
+    monkeypatch.setattr(list_tasks_module, 'datetime', _FixedDateTime)
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', printed.append)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+
+    list_tasks(horizon=4)
+
+    assert list(printed[0].columns[0]._cells) == ['1', '2', '3', '4', '-', '-']
+
+
+def test_list_tasks_limit(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should read only the first tasks when nothing else needs the full list, and cut the listing otherwise.
+    """
+
+    shown: list[list[str]] = []
+    first: list[int] = []
+
+    def fake_load_first_tasks(limit: int) -> TodoList:
+        first.append(limit)
+        return TodoList(mixed_todo_list.tasks[:limit])
+
+    def fake_build_tasks_table(todo_list: TodoList, _: object = None) -> Table:
+        shown.append([task.description for task in todo_list])
+        return Table()
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.console.print', lambda *_, **__: None)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.load_first_tasks', fake_load_first_tasks)
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fake_build_tasks_table)
+
+    list_tasks(limit=2, horizon=0)
+    list_tasks(limit=1, by='description', horizon=0)
+
+    assert first == [2]
+    assert shown == [['Learn FastAPI', 'Learn MongoDB'], ['Learn FastAPI']]
+
+
+def test_list_tasks_streams_other_formats(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], mixed_todo_list: TodoList
+) -> None:
+    """
+    Should write rows straight to stdout, without building a table.
+    """
+
+    def fail(*_: object) -> Table:
+        raise AssertionError
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.build_tasks_table', fail)
+
+    list_tasks(output_format=OutputFormatEnum.CSV, horizon=0, limit=2, by='description')
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'id,status,priority,description,deadline,tags'
+    assert [line.split(',')[3] for line in lines[1:]] == ['Learn FastAPI', 'Learn Java']
+
+
+def test_list_tasks_writes_plain_lines_to_a_pipe(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], mixed_todo_list: TodoList
+) -> None:
+    """
+    Should choose the plain format when stdout is not a terminal.
+    """
+    monkeypatch.setattr('src.cli.commands.list_tasks.stdout_is_terminal', lambda: False)
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+
+    list_tasks(horizon=0)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == len(mixed_todo_list)
+    assert all('Learn' in line or 'Task without deadline' in line for line in lines)
+
+
+def test_list_tasks_empty_in_other_formats(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Should write an empty document instead of the warning.
+    """
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', TodoList)
+
+    list_tasks(output_format=OutputFormatEnum.JSON)
+
+    assert capsys.readouterr().out == '{"tasks": []}\n'
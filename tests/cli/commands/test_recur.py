@@ -0,0 +1,69 @@
+from datetime import UTC, timedelta
+from typing import TYPE_CHECKING
+
+import src.cli.commands.recur as recur_module
+from src.cli.commands.recur import recur
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:
+    import pytest
+
+    from src.todo_list.todo_list import TodoList
+
+
+def test_recur_creates_instances_with_spaced_deadlines(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList
+) -> None:
+    """
+    Should clone every template with deadlines every N days and save once.
+    """
+    printed: list[str] = []
+    saved: list[bool] = []
+
+    monkeypatch.setattr(recur_module, 'datetime', _FixedDateTime)
+    monkeypatch.setattr('src.cli.commands.recur.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.recur.save_todo_list', lambda: saved.append(True))
+    monkeypatch.setattr('src.cli.commands.recur.console.print', printed.append)
+
+    recur('Backend', count=2, every=7)
+
+    today = _FixedDateTime.now(tz=UTC).date()
+    instances = mixed_todo_list.tasks[4:]
+    assert [task.deadline for task in instances] == [today + timedelta(days=7), today + timedelta(days=14)] * 3
+    assert all('backend' not in task.tags for task in instances)
+    assert saved == [True]
+    assert printed == ['[green]Created:[/green] 6 recurring task(s) from 3 template(s)']
+
+
+def test_recur_keeps_template_deadlines(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should keep the template deadline when no interval is given.
+    """
+    monkeypatch.setattr('src.cli.commands.recur.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.recur.save_todo_list', lambda: None)
+    monkeypatch.setattr('src.cli.commands.recur.console.print', lambda _: None)
+
+    recur('documentation')
+
+    assert len(mixed_todo_list) == 5
+    assert mixed_todo_list.tasks[-1].deadline is None
+    assert mixed_todo_list.tasks[-1].tags == []
+
+
+def test_recur_without_templates_does_not_save(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should warn and skip saving when no task has the tag.
+    """
+    printed: list[str] = []
+
+    def fail() -> None:
+        raise AssertionError
+
+    monkeypatch.setattr('src.cli.commands.recur.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.recur.save_todo_list', fail)
+    monkeypatch.setattr('src.cli.commands.recur.console.print', printed.append)
+
+    recur('weekly', count=3)
+
+    assert printed == ['[yellow]No tasks tagged weekly.[/yellow]']
@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING
+
+from rich.table import Table
+
+from src.cli.commands.stats import stats
+from src.todo_list.todo_list import TodoList
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_stats_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Should print a message when no tasks are present.
+    """
+    printed: list[tuple[object, ...]] = []
+
+    monkeypatch.setattr('src.cli.commands.stats.console.print', lambda *args, **_: printed.append(args))
+    monkeypatch.setattr('src.cli.commands.stats.get_todo_list', TodoList)
+
+    stats()
+
+    assert printed == [('[yellow]No tasks found.[/yellow]',)]
+
+
+def test_stats_prints_grouped_tables(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    """
+    Should print one table per group and the overdue summary.
+    """
+    printed: list[object] = []
+
+    monkeypatch.setattr('src.cli.commands.stats.console.print', lambda *args, **_: printed.extend(args))
+    monkeypatch.setattr('src.cli.commands.stats.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.stats.datetime', _FixedDateTime)
+
+    stats(top_tags=2)
+
+    tables = [item for item in printed if isinstance(item, Table)]
+
+    assert [table.title for table in tables] == ['Status', 'Priority', 'Tags', 'Deadlines per month']
+    assert tables[2].row_count == 2
+    assert printed[-1] == '[bold]Overdue:[/bold] 0 of 4 (0.0%)'
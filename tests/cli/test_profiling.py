@@ -0,0 +1,123 @@
+import pstats
+import re
+import time
+from typing import TYPE_CHECKING
+
+import typer
+from typer.testing import CliRunner
+
+from src.cli import profiling
+from src.cli.profiling import PHASES, format_timings, phase, profiling_callback, start_timings, stop_timings, timed
+from src.metrics import metrics
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@timed('load')
+def fake_load(delay: float) -> str:
+    time.sleep(delay)
+    return 'loaded'
+
+
+@timed('load')
+def nested_load() -> str:
+    return fake_load(0.01)
+
+
+def build_app() -> typer.Typer:
+    app = typer.Typer()
+    app.callback()(profiling_callback)
+
+    @app.command()
+    def work() -> None:
+        fake_load(0.01)
+        with phase('render'):
+            time.sleep(0.01)
+        typer.echo('done')
+
+    @app.command()
+    def other() -> None:
+        pass  # pragma: no cover - makes the app a group
+
+    return app
+
+
+def test_phases_do_nothing_when_disabled() -> None:
+    assert fake_load(0) == 'loaded'
+    with phase('save'):
+        pass
+
+    assert profiling._timings is None
+
+
+def test_timings_breakdown() -> None:
+    started = start_timings(0.5)
+
+    assert nested_load() == 'loaded'
+    with phase('save'):
+        time.sleep(0.01)
+
+    timings = stop_timings(started)
+    assert list(timings) == [*PHASES, 'total']
+    assert timings['import'] == 0.5
+    assert 0.01 <= timings['load'] < 0.1
+    assert timings['save'] >= 0.01
+    assert timings['render'] == 0
+    assert timings['command'] >= 0
+    assert timings['total'] >= 0.52
+    assert profiling._timings is None
+    assert not profiling._active
+
+
+def test_format_timings() -> None:
+    text = format_timings({'load': 0.25, 'save': 0.0, 'total': 1.0})
+
+    assert text.splitlines() == [
+        'load          250.0 ms  25.0%',
+        'save            0.0 ms   0.0%',
+        'total        1000.0 ms 100.0%',
+    ]
+    assert format_timings({'total': 0.0}) == 'total           0.0 ms   0.0%'
+
+
+def test_timings_option_reports_to_stderr() -> None:
+    result = CliRunner().invoke(build_app(), ['--timings', 'work'], obj=time.perf_counter() - 0.2)
+
+    assert result.exit_code == 0
+    assert result.stdout == 'done\n'
+    assert re.search(r'^import\s+2\d\d\.\d ms', result.stderr, re.MULTILINE)
+    assert re.search(r'^load\s+1\d\.\d ms', result.stderr, re.MULTILINE)
+    assert re.search(r'^render\s+1\d\.\d ms', result.stderr, re.MULTILINE)
+    assert profiling._timings is None
+
+
+def test_timings_without_start_time() -> None:
+    result = CliRunner().invoke(build_app(), ['--timings', 'work'])
+
+    assert re.search(r'^import\s+0\.0 ms', result.stderr, re.MULTILINE)
+
+
+def test_profile_option_writes_stats(tmp_path: Path) -> None:
+    output = tmp_path / 'run.pstats'
+
+    result = CliRunner().invoke(
+        build_app(), ['--profile', '--profile-output', str(output), '--profile-top', '40', 'work']
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == 'done\n'
+    assert 'fake_load' in result.stderr
+    assert f'Profile written to {output}' in result.stderr
+    assert any(name == 'fake_load' for _, _, name in pstats.Stats(str(output)).stats)  # type: ignore[attr-defined]
+
+
+def test_metrics_option_exports_on_close(tmp_path: Path) -> None:
+    output = tmp_path / 'todo.prom'
+
+    result = CliRunner().invoke(build_app(), ['--metrics', str(output), 'work'])
+
+    assert result.exit_code == 0
+    assert not metrics.enabled
+    assert '# TYPE todo_load_seconds histogram' in output.read_text(encoding='utf-8')
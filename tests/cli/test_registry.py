@@ -1,10 +1,14 @@
 from typing import TYPE_CHECKING, cast
 
 from src.cli.commands.add_task import add_task
+from src.cli.commands.archive import archive
 from src.cli.commands.flow_update import update_task
+from src.cli.commands.generate import generate
 from src.cli.commands.interactive import interactive
 from src.cli.commands.list_tasks import list_tasks
+from src.cli.commands.recur import recur
 from src.cli.commands.remove_task import remove_task
+from src.cli.commands.stats import stats
 from src.cli.registry import register_commands
 
 
@@ -37,4 +41,8 @@ def test_register_commands() -> None:
         remove_task,
         interactive,
         update_task,
+        stats,
+        archive,
+        recur,
+        generate,
     ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 import importlib
 from pathlib import Path
 import re
@@ -9,9 +10,17 @@ import pytest
 
 from src.cli import state
 import src.cli.state as state_module
+from src.enums.status_enum import StatusEnum
+from src.storage.archive import ArchiveStore
+from src.storage.ndjson import NdjsonStore
+from src.storage.sharded import ShardedStore
+from src.task.task import Todo
+from tests.conftest import _FixedDateTime
 
 
 if TYPE_CHECKING:
+    from typing import TextIO
+
     from src.todo_list.todo_list import TodoList
 
 
@@ -52,8 +61,69 @@ def test_load_todo_list_empty_file(monkeypatch: pytest.MonkeyPatch, temp_file: P
 
 
 def test_load_todo_list_read_error(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
-    temp_file.write_text('', encoding='utf-8')
+    temp_file.write_text('{"tasks": []}', encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+
+    def fake_open(*_: object, **__: object) -> TextIO:
+        raise OSError()
+
+    monkeypatch.setattr(Path, 'open', fake_open)
+
+    with pytest.raises(ValueError, match=re.escape('Data storage can not read.')):
+        state.load_todo_list()
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        'invalid',
+        '{"tasks": [1]}',
+        '{"tasks": []} []',
+        '{"tasks": [{"description": "Corrupt", "priority": 1, "created_at": "not-a-date", "deadline": null, '
+        '"tags": [], "status": "todo", "idx": "de184248-44f2-4944-a209-a6097846da17"}]}',
+    ],
+)
+def test_load_todo_list_invalid_json(monkeypatch: pytest.MonkeyPatch, temp_file: Path, content: str) -> None:
+    temp_file.write_text(content, encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+
+    with pytest.raises(ValueError, match=re.escape('Invalid data storage.')):
+        state.load_todo_list()
+
+
+def test_load_todo_list_streams_the_file(
+    monkeypatch: pytest.MonkeyPatch, temp_file: Path, mixed_todo_list: TodoList
+) -> None:
+    temp_file.write_text(mixed_todo_list.to_json(indent=4), encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+
+    def fail(*_: object, **__: object) -> str:
+        raise AssertionError
+
+    monkeypatch.setattr(Path, 'read_text', fail)
+
+    assert state.load_todo_list().to_dict() == mixed_todo_list.to_dict()
+
+
+@pytest.mark.parametrize(
+    ('content', 'message'),
+    [('', 'Data storage is invalid.'), ('invalid', 'Invalid data storage.')],
+)
+def test_load_todo_list_parallel_errors(
+    monkeypatch: pytest.MonkeyPatch, temp_file: Path, content: str, message: str
+) -> None:
+    temp_file.write_text(content, encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setenv('STORAGE_LOAD_WORKERS', '2')
+
+    with pytest.raises(ValueError, match=re.escape(message)):
+        state.load_todo_list()
+
+
+def test_load_todo_list_parallel_read_error(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
+    temp_file.write_text('{"tasks": []}', encoding='utf-8')
     monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setenv('STORAGE_LOAD_WORKERS', '2')
 
     def fake_read_text(*_: object, **__: object) -> str:
         raise OSError()
@@ -64,17 +134,40 @@ def test_load_todo_list_read_error(monkeypatch: pytest.MonkeyPatch, temp_file: P
         state.load_todo_list()
 
 
-def test_load_todo_list_invalid_json(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
-    temp_file.write_text('invalid', encoding='utf-8')
+def test_get_load_workers_defaults_to_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv('STORAGE_LOAD_WORKERS', raising=False)
+
+    assert state.get_load_workers() == 1
+
+
+@pytest.mark.parametrize(('configured', 'expected'), [('4', 4), ('0', 1)])
+def test_get_load_workers_reads_env(monkeypatch: pytest.MonkeyPatch, configured: str, expected: int) -> None:
+    monkeypatch.setenv('STORAGE_LOAD_WORKERS', configured)
+
+    assert state.get_load_workers() == expected
+
+
+def test_get_load_workers_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv('STORAGE_LOAD_WORKERS', 'many')
+
+    with pytest.raises(ValueError, match=re.escape('Load workers configuration is invalid.')):
+        state.get_load_workers()
+
+
+def test_load_todo_list_passes_workers(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
+    temp_file.write_text('{}', encoding='utf-8')
     monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setenv('STORAGE_LOAD_WORKERS', '3')
+    seen: dict[str, object] = {}
 
-    def fake_from_json(_: str) -> TodoList:
-        raise ValueError()
+    def fake_from_json(_: str, **kwargs: object) -> None:
+        seen.update(kwargs)
 
     monkeypatch.setattr('src.todo_list.todo_list.TodoList.from_json', fake_from_json)
 
-    with pytest.raises(ValueError, match=re.escape('Invalid data storage.')):
-        state.load_todo_list()
+    state.load_todo_list()
+
+    assert seen == {'workers': 3, 'trusted': True}
 
 
 def test_load_todo_list_success(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
@@ -84,10 +177,10 @@ def test_load_todo_list_success(monkeypatch: pytest.MonkeyPatch, temp_file: Path
     class Dummy:
         pass
 
-    def fake_from_json(_: str) -> Dummy:
+    def fake_load_stream(_: TextIO, **__: object) -> Dummy:
         return Dummy()
 
-    monkeypatch.setattr('src.todo_list.todo_list.TodoList.from_json', fake_from_json)
+    monkeypatch.setattr('src.todo_list.todo_list.TodoList.load_stream', fake_load_stream)
 
     result = state.load_todo_list()
 
@@ -99,9 +192,8 @@ def test_save_todo_list(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> Non
 
     class Dummy:
         @staticmethod
-        def to_json(indent: int) -> str:
-            _ = indent
-            return 'data'
+        def dump(fp: TextIO) -> None:
+            fp.write('data')
 
     monkeypatch.setattr(state, '_todo_list', Dummy())
 
@@ -110,6 +202,25 @@ def test_save_todo_list(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> Non
     assert temp_file.read_text(encoding='utf-8') == 'data'
 
 
+def test_interrupted_save_keeps_the_previous_store(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
+    temp_file.write_text('previous', encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+
+    class Dummy:
+        @staticmethod
+        def dump(fp: TextIO) -> None:
+            fp.write('partial')
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(state, '_todo_list', Dummy())
+
+    with pytest.raises(KeyboardInterrupt):
+        state.save_todo_list()
+
+    assert temp_file.read_text(encoding='utf-8') == 'previous'
+    assert list(temp_file.parent.iterdir()) == [temp_file]
+
+
 def test_get_todo_list_returns_global(monkeypatch: pytest.MonkeyPatch) -> None:
     class Dummy:
         pass
@@ -137,11 +248,11 @@ def test_get_todo_list_loads_once_after_import(monkeypatch: pytest.MonkeyPatch,
 
     calls = {'count': 0}
 
-    def fake_from_json(_: str) -> Dummy:
+    def fake_load_stream(_: TextIO, **__: object) -> Dummy:
         calls['count'] += 1
         return Dummy()
 
-    monkeypatch.setattr('src.todo_list.todo_list.TodoList.from_json', fake_from_json)
+    monkeypatch.setattr('src.todo_list.todo_list.TodoList.load_stream', fake_load_stream)
 
     module = cast('type(state_module)', importlib.reload(state_module))
 
@@ -152,3 +263,404 @@ def test_get_todo_list_loads_once_after_import(monkeypatch: pytest.MonkeyPatch,
 
     assert first is second
     assert calls['count'] == 1
+
+
+@pytest.fixture
+def sharded_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList) -> Path:
+    directory = tmp_path / 'store'
+    ShardedStore(directory).save(mixed_todo_list)
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(directory))
+    monkeypatch.delenv('STORAGE_SHARD_KEY', raising=False)
+    monkeypatch.setattr(state, '_sharded_store', None)
+    monkeypatch.setattr(state, '_todo_list', None)
+    return directory
+
+
+def test_get_sharded_store_reads_shard_key(monkeypatch: pytest.MonkeyPatch, sharded_dir: Path) -> None:
+    monkeypatch.setenv('STORAGE_SHARD_KEY', 'hash')
+
+    store = state.get_sharded_store()
+
+    assert store.directory == sharded_dir
+    assert store.shard_key == 'hash'
+    assert state.get_sharded_store() is store
+
+
+def test_load_todo_list_from_shards(sharded_dir: Path) -> None:
+    assert len(state.load_todo_list()) == 4
+
+
+def test_save_todo_list_rewrites_dirty_shards(sharded_dir: Path) -> None:
+    todo_list = state.get_todo_list()
+    completed_mtime = (sharded_dir / 'completed.json').stat().st_mtime_ns
+
+    next(task for task in todo_list if task.status == StatusEnum.TODO).add_tag('changed')
+    state.save_todo_list()
+
+    assert (sharded_dir / 'completed.json').stat().st_mtime_ns == completed_mtime
+    assert 'changed' in (sharded_dir / 'todo.json').read_text(encoding='utf-8')
+
+
+def test_load_todo_list_invalid_shard(sharded_dir: Path) -> None:
+    (sharded_dir / 'todo.json').write_text('{"tasks": 1}', encoding='utf-8')
+
+    with pytest.raises(ValueError, match=re.escape('Invalid data storage.')):
+        state.load_todo_list()
+
+
+def test_load_todo_list_unreadable_shard(monkeypatch: pytest.MonkeyPatch, sharded_dir: Path) -> None:
+    def fake_open(*_: object, **__: object) -> TextIO:
+        raise OSError()
+
+    monkeypatch.setattr(Path, 'open', fake_open)
+
+    with pytest.raises(ValueError, match=re.escape('Data storage can not read.')):
+        state.load_todo_list()
+
+
+def test_load_tasks_with_status_reads_only_needed_shards(monkeypatch: pytest.MonkeyPatch, sharded_dir: Path) -> None:
+    (sharded_dir / 'completed.json').write_text('not json', encoding='utf-8')
+
+    active = state.load_tasks_with_status([StatusEnum.TODO, StatusEnum.IN_PROGRESS])
+
+    assert sorted(task.description for task in active) == ['Learn FastAPI', 'Learn MongoDB', 'Task without deadline']
+    assert state._todo_list is None
+
+
+def test_load_tasks_with_status_filters_loaded_list(sharded_dir: Path) -> None:
+    state.get_todo_list()
+
+    completed = state.load_tasks_with_status([StatusEnum.COMPLETED])
+
+    assert [task.description for task in completed] == ['Learn Java']
+
+
+def test_load_tasks_with_status_from_single_file(
+    monkeypatch: pytest.MonkeyPatch, temp_file: Path, mixed_todo_list: TodoList
+) -> None:
+    temp_file.write_text(mixed_todo_list.to_json(), encoding='utf-8')
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setattr(state, '_todo_list', None)
+
+    todo = state.load_tasks_with_status([StatusEnum.TODO])
+
+    assert len(todo) == 2
+
+
+def test_load_tasks_with_status_hash_shards(monkeypatch: pytest.MonkeyPatch, sharded_dir: Path) -> None:
+    monkeypatch.setenv('STORAGE_SHARD_KEY', 'hash')
+
+    blocked = state.load_tasks_with_status([StatusEnum.BLOCKED])
+
+    assert len(blocked) == 0
+    assert state._todo_list is not None
+
+
+@pytest.fixture
+def frozen_state_today(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(state, 'datetime', _FixedDateTime)
+
+
+@pytest.fixture
+def old_completed() -> Todo:
+    return Todo(
+        'Old completed task',
+        status=StatusEnum.COMPLETED,
+        created_at=datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC),
+    )
+
+
+def test_get_archive_path_defaults_next_to_storage(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.delenv('STORAGE_ARCHIVE_PATH', raising=False)
+
+    assert state.get_archive_path() == temp_file.with_name('data.archive.ndjson.gz')
+
+
+def test_get_archive_path_inside_sharded_store(monkeypatch: pytest.MonkeyPatch, sharded_dir: Path) -> None:
+    monkeypatch.delenv('STORAGE_ARCHIVE_PATH', raising=False)
+
+    assert state.get_archive_path() == sharded_dir / 'archive.ndjson.gz'
+
+
+def test_get_archive_path_reads_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'cold.gz'))
+
+    assert state.get_archive_path() == tmp_path / 'cold.gz'
+
+
+@pytest.mark.parametrize(('configured', 'expected'), [('', None), ('0', 0), ('45', 45)])
+def test_get_archive_after_days(monkeypatch: pytest.MonkeyPatch, configured: str, expected: int | None) -> None:
+    monkeypatch.setenv('ARCHIVE_AFTER_DAYS', configured)
+
+    assert state.get_archive_after_days() == expected
+
+
+@pytest.mark.parametrize('configured', ['soon', '-1'])
+def test_get_archive_after_days_invalid(monkeypatch: pytest.MonkeyPatch, configured: str) -> None:
+    monkeypatch.setenv('ARCHIVE_AFTER_DAYS', configured)
+
+    with pytest.raises(ValueError, match=re.escape('Archive policy configuration is invalid.')):
+        state.get_archive_after_days()
+
+
+def test_archive_tasks_moves_old_completed_tasks(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    frozen_state_today: None,
+    mixed_todo_list: TodoList,
+    old_completed: Todo,
+) -> None:
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'archive.ndjson.gz'))
+    mixed_todo_list.add(old_completed)
+
+    archived = state.archive_tasks(mixed_todo_list, 30)
+
+    assert archived == [old_completed]
+    assert old_completed.idx not in mixed_todo_list
+    assert len(mixed_todo_list) == 4
+    assert [task.idx for task in ArchiveStore(tmp_path / 'archive.ndjson.gz').iter_tasks()] == [old_completed.idx]
+
+
+def test_archive_tasks_without_candidates(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, frozen_state_today: None, mixed_todo_list: TodoList
+) -> None:
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'archive.ndjson.gz'))
+
+    assert state.archive_tasks(mixed_todo_list, 0) == []
+    assert not (tmp_path / 'archive.ndjson.gz').exists()
+
+
+def test_save_todo_list_applies_archive_policy(
+    monkeypatch: pytest.MonkeyPatch,
+    temp_file: Path,
+    frozen_state_today: None,
+    mixed_todo_list: TodoList,
+    old_completed: Todo,
+) -> None:
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setenv('ARCHIVE_AFTER_DAYS', '30')
+    monkeypatch.delenv('STORAGE_ARCHIVE_PATH', raising=False)
+    mixed_todo_list.add(old_completed)
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    state.save_todo_list()
+
+    assert 'Old completed task' not in temp_file.read_text(encoding='utf-8')
+    assert len(state.with_archived_tasks(mixed_todo_list)) == 5
+
+
+def test_with_archived_tasks_filters_and_skips_known(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList, old_completed: Todo
+) -> None:
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'archive.ndjson.gz'))
+    ArchiveStore(tmp_path / 'archive.ndjson.gz').append([old_completed, mixed_todo_list[0]])
+
+    merged = state.with_archived_tasks(mixed_todo_list)
+    only_todo = state.with_archived_tasks(mixed_todo_list, [StatusEnum.TODO])
+
+    assert [task.description for task in merged][-1] == 'Old completed task'
+    assert len(merged) == 5
+    assert len(only_todo) == 4
+
+
+def test_with_archived_tasks_invalid_archive(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList
+) -> None:
+    (tmp_path / 'archive.ndjson.gz').write_bytes(b'not gzip')
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'archive.ndjson.gz'))
+
+    with pytest.raises(ValueError, match=re.escape('Invalid archive storage.')):
+        state.with_archived_tasks(mixed_todo_list)
+
+
+@pytest.fixture
+def compressed_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / 'data.json.zst'
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(path))
+    monkeypatch.delenv('STORAGE_COMPRESSION_LEVEL', raising=False)
+    monkeypatch.delenv('ARCHIVE_AFTER_DAYS', raising=False)
+    monkeypatch.setattr(state, '_todo_list', None)
+    return path
+
+
+@pytest.mark.parametrize(('configured', 'expected'), [('', None), ('19', 19), ('-5', -5)])
+def test_get_compression_level(
+    monkeypatch: pytest.MonkeyPatch, compressed_file: Path, configured: str, expected: int | None
+) -> None:
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', configured)
+
+    assert state.get_compression_level() == expected
+
+
+def test_get_compression_level_ignores_bounds_of_plain_files(monkeypatch: pytest.MonkeyPatch, temp_file: Path) -> None:
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', '99')
+
+    assert state.get_compression_level() == 99
+
+
+@pytest.mark.parametrize(
+    ('name', 'configured'), [('data.json.zst', 'max'), ('data.json.gz', '10'), ('data.json.xz', '-1')]
+)
+def test_get_compression_level_invalid(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, name: str, configured: str
+) -> None:
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(tmp_path / name))
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', configured)
+
+    with pytest.raises(ValueError, match=re.escape('Compression level configuration is invalid.')):
+        state.get_compression_level()
+
+
+def test_save_and_load_compressed_store(
+    monkeypatch: pytest.MonkeyPatch, compressed_file: Path, mixed_todo_list: TodoList
+) -> None:
+    monkeypatch.setenv('STORAGE_COMPRESSION_LEVEL', '10')
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    state.save_todo_list()
+
+    assert compressed_file.read_bytes()[:4] == b'\x28\xb5\x2f\xfd'
+    assert state.load_todo_list().to_dict() == mixed_todo_list.to_dict()
+
+
+def test_load_compressed_store_invalid(compressed_file: Path) -> None:
+    compressed_file.write_bytes(b'not zstd')
+
+    with pytest.raises(ValueError, match=re.escape('Invalid data storage.')):
+        state.load_todo_list()
+
+
+def test_load_compressed_store_read_error(monkeypatch: pytest.MonkeyPatch, compressed_file: Path) -> None:
+    compressed_file.write_bytes(b'')
+
+    def fake_read_compressed(*_: object, **__: object) -> TodoList:
+        raise OSError
+
+    monkeypatch.setattr(state, 'read_compressed', fake_read_compressed)
+
+    with pytest.raises(ValueError, match=re.escape('Data storage can not read.')):
+        state.load_todo_list()
+
+
+def test_get_archive_path_next_to_compressed_store(monkeypatch: pytest.MonkeyPatch, compressed_file: Path) -> None:
+    monkeypatch.delenv('STORAGE_ARCHIVE_PATH', raising=False)
+
+    assert state.get_archive_path() == compressed_file.with_name('data.archive.ndjson.gz')
+
+
+@pytest.fixture
+def ndjson_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    path = tmp_path / 'data.ndjson'
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(path))
+    monkeypatch.delenv('ARCHIVE_AFTER_DAYS', raising=False)
+    monkeypatch.setattr(state, '_todo_list', None)
+    return path
+
+
+def test_save_and_load_ndjson_store(
+    monkeypatch: pytest.MonkeyPatch, ndjson_file: Path, mixed_todo_list: TodoList
+) -> None:
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    state.save_todo_list()
+
+    assert len(ndjson_file.read_text(encoding='utf-8').splitlines()) == 4
+    assert NdjsonStore(ndjson_file)[3].idx == mixed_todo_list.tasks[3].idx
+    assert state.load_todo_list().to_dict() == mixed_todo_list.to_dict()
+
+
+def test_load_ndjson_store_errors(monkeypatch: pytest.MonkeyPatch, ndjson_file: Path) -> None:
+    ndjson_file.write_text('not json\n', encoding='utf-8')
+
+    with pytest.raises(ValueError, match=re.escape('Invalid data storage.')):
+        state.load_todo_list()
+
+    def fake_open(*_: object, **__: object) -> TextIO:
+        raise OSError()
+
+    monkeypatch.setattr(Path, 'open', fake_open)
+
+    with pytest.raises(ValueError, match=re.escape('Data storage can not read.')):
+        state.load_todo_list()
+
+
+def test_load_first_tasks_reads_only_needed_lines(ndjson_file: Path, mixed_todo_list: TodoList) -> None:
+    NdjsonStore(ndjson_file).write(mixed_todo_list)
+    with ndjson_file.open('a', encoding='utf-8') as fp:
+        fp.write('not json\n')
+
+    first = state.load_first_tasks(2)
+
+    assert [task.idx for task in first] == [task.idx for task in mixed_todo_list.tasks[:2]]
+    assert state._todo_list is None
+
+
+def test_load_first_tasks_slices_loaded_list(
+    monkeypatch: pytest.MonkeyPatch, temp_file: Path, mixed_todo_list: TodoList
+) -> None:
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(temp_file))
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    assert state.load_first_tasks(3).tasks == mixed_todo_list.tasks[:3]
+
+
+def test_append_task_appends_to_unloaded_ndjson_store(
+    ndjson_file: Path, mixed_todo_list: TodoList, todo_1: Todo
+) -> None:
+    NdjsonStore(ndjson_file).write(mixed_todo_list)
+
+    state.append_task(todo_1)
+
+    assert state._todo_list is None
+    assert NdjsonStore(ndjson_file)[-1].idx == todo_1.idx
+
+
+def test_append_task_applies_archive_policy_to_ndjson_store(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    ndjson_file: Path,
+    frozen_state_today: None,
+    mixed_todo_list: TodoList,
+    old_completed: Todo,
+    todo_1: Todo,
+) -> None:
+    monkeypatch.setenv('ARCHIVE_AFTER_DAYS', '30')
+    monkeypatch.setenv('STORAGE_ARCHIVE_PATH', str(tmp_path / 'archive.ndjson.gz'))
+    NdjsonStore(ndjson_file).write([*mixed_todo_list, old_completed])
+
+    state.append_task(todo_1)
+
+    stored = [task.idx for task in NdjsonStore(ndjson_file).load()]
+    assert stored == [*(task.idx for task in mixed_todo_list), todo_1.idx]
+    assert [task.idx for task in ArchiveStore(tmp_path / 'archive.ndjson.gz').iter_tasks()] == [old_completed.idx]
+
+
+def test_append_task_saves_loaded_list(
+    monkeypatch: pytest.MonkeyPatch, ndjson_file: Path, mixed_todo_list: TodoList, todo_1: Todo
+) -> None:
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    state.append_task(todo_1)
+
+    assert mixed_todo_list.tasks[-1] is todo_1
+    assert [task.idx for task in NdjsonStore(ndjson_file).load()] == [task.idx for task in mixed_todo_list]
+
+
+@pytest.mark.parametrize('name', ['export.json', 'export.json.gz', 'export.json.zst', 'export.ndjson'])
+def test_export_tasks_streams_each_format(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList, name: str
+) -> None:
+    path = tmp_path / 'out' / name
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(path))
+    monkeypatch.delenv('STORAGE_COMPRESSION_LEVEL', raising=False)
+    monkeypatch.setattr(state, '_todo_list', None)
+
+    assert state.export_tasks(path, iter(mixed_todo_list)) == 4
+    assert state.load_todo_list().to_dict() == mixed_todo_list.to_dict()
+
+
+def test_export_tasks_rejects_sharded_store(tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    with pytest.raises(ValueError, match=re.escape('Tasks can not be streamed to a sharded store.')):
+        state.export_tasks(tmp_path, mixed_todo_list)
@@ -11,6 +11,8 @@ from src.enums.status_enum import StatusEnum
 if TYPE_CHECKING:
     import pytest
 
+    from src.todo_list.todo_list import TodoList
+
 
 class DummyTodoList:
     def __init__(self) -> None:
@@ -44,29 +46,27 @@ def test_cli_help_lists_registered_commands() -> None:
     assert 'remove-task' in result.stdout
     assert 'interactive' in result.stdout
     assert 'update-task' in result.stdout
+    assert 'stats' in result.stdout
+    assert 'archive' in result.stdout
+    assert 'recur' in result.stdout
+    assert 'generate' in result.stdout
 
 
 def test_add_task_command_runs_via_typer(monkeypatch: pytest.MonkeyPatch) -> None:
     runner = CliRunner()
     todo_list = DummyTodoList()
-    saved = {'called': False}
-
-    def fake_save() -> None:
-        saved['called'] = True
 
     monkeypatch.setattr('src.cli.commands.add_task.prompt_description', lambda: 'CLI task')
     monkeypatch.setattr('src.cli.commands.add_task.prompt_priority', lambda: PriorityEnum.HIGH)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_status', lambda: StatusEnum.TODO)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_deadline_graphical', lambda: None)
     monkeypatch.setattr('src.cli.commands.add_task.prompt_tags', lambda: ['cli'])
-    monkeypatch.setattr('src.cli.commands.add_task.get_todo_list', lambda: todo_list)
-    monkeypatch.setattr('src.cli.commands.add_task.save_todo_list', fake_save())
+    monkeypatch.setattr('src.cli.commands.add_task.append_task', todo_list.add)
 
-    result = runner.invoke(build_app(), ['add-task'], color=False)
+    result = runner.invoke(build_app(), ['add-task', '--repeat', 'daily'], color=False)
 
-    assert result.exit_code == 1
+    assert result.exit_code == 0
     assert len(todo_list.tasks) == 1
-    assert saved['called'] is True
 
 
 def test_remove_task_invalid_id_runs_via_typer() -> None:
@@ -98,3 +98,57 @@ def test_interactive_exit_runs_via_typer(monkeypatch: pytest.MonkeyPatch) -> Non
 
     assert result.exit_code == 0
     assert calls == {'menu': 1, 'exit': 1}
+
+
+def test_list_tasks_top_option_runs_via_typer(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    runner = CliRunner()
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+
+    result = runner.invoke(build_app(), ['list-tasks', '--top', '1', '--by', 'priority'], color=False)
+
+    assert result.exit_code == 0
+    assert 'Learn FastAPI' in result.stdout
+    assert 'Learn MongoDB' not in result.stdout
+
+
+def test_remove_task_after_list_tasks_top_removes_the_shown_task(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList
+) -> None:
+    runner = CliRunner()
+    app = build_app()
+    shown = mixed_todo_list.top_k(2, lambda task: task.description)[1]
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.list_tasks.stdout_is_terminal', lambda: True)
+    monkeypatch.setattr('src.cli.commands.remove_task.get_todo_list', lambda: mixed_todo_list)
+    monkeypatch.setattr('src.cli.commands.remove_task.save_todo_list', lambda: None)
+
+    listed = runner.invoke(app, ['list-tasks', '--top', '2', '--by', 'description'], color=False)
+    row_id = next(line.split()[0] for line in listed.stdout.splitlines() if shown.description in line)
+    result = runner.invoke(app, ['remove-task'], input=f'{row_id}\n', color=False)
+
+    assert result.exit_code == 0
+    assert f'Task removed: {shown.description}' in result.stdout
+    assert shown not in mixed_todo_list.tasks
+
+
+def test_list_tasks_format_option_runs_via_typer(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    runner = CliRunner()
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+
+    result = runner.invoke(build_app(), ['list-tasks', '--format', 'ndjson', '--horizon', '0'], color=False)
+
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == len(mixed_todo_list)
+
+
+def test_list_tasks_unknown_sort_key_runs_via_typer(monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList) -> None:
+    runner = CliRunner()
+
+    monkeypatch.setattr('src.cli.commands.list_tasks.get_todo_list', lambda: mixed_todo_list)
+
+    result = runner.invoke(build_app(), ['list-tasks', '--top', '1', '--by', 'urgency'], color=False)
+
+    assert result.exit_code == 2
@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.metrics import metrics
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def recording() -> Iterator[None]:
+    """
+    Record metrics from zero during the test.
+    """
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
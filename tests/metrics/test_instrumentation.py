@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.cli import state
+from src.enums.status_enum import StatusEnum
+from src.metrics import metrics
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+pytestmark = pytest.mark.usefixtures('recording')
+
+
+def test_todo_list_hot_paths(mixed_todo_list: TodoList) -> None:
+    calls = metrics.UNIQUE_IDS_CALLS.value
+    raw = mixed_todo_list.to_json()
+
+    TodoList.from_json(raw)
+    todo = mixed_todo_list.filter_by(status=StatusEnum.TODO)
+    mixed_todo_list.filter_by(status=StatusEnum.TODO, workers=2, parallel_threshold=1)
+
+    assert metrics.DECODED_RECORDS.value == 4
+    assert metrics.DECODE_SECONDS.count == 1
+    assert metrics.UNIQUE_IDS_CALLS.value > calls
+    assert metrics.FILTER_SCANNED.value == 8
+    assert metrics.FILTER_RETURNED.value == 2 * len(todo)
+
+
+@pytest.mark.parametrize('name', ['todo.json', 'shards'])
+def test_load_and_save_report_store_size(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList, name: str
+) -> None:
+    path = tmp_path / name
+    if name == 'shards':
+        path.mkdir()
+    monkeypatch.setenv('STORAGE_PATH_ENV', str(path))
+    monkeypatch.delenv('ARCHIVE_AFTER_DAYS', raising=False)
+    monkeypatch.delenv('STORAGE_LOAD_WORKERS', raising=False)
+    monkeypatch.setattr(state, '_sharded_store', None)
+    monkeypatch.setattr(state, '_todo_list', mixed_todo_list)
+
+    state.save_todo_list()
+    saved = metrics.SAVE_BYTES.value
+    state.load_todo_list()
+
+    assert saved > 0
+    assert metrics.LOAD_BYTES.value == saved
+    assert metrics.SAVE_SECONDS.count == metrics.LOAD_SECONDS.count == 1
+    assert metrics.DECODED_RECORDS.value == 4
@@ -0,0 +1,96 @@
+import json
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.metrics import metrics
+from src.metrics.metrics import Counter, Histogram
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def instruments(monkeypatch: pytest.MonkeyPatch) -> tuple[Counter, Histogram]:
+    monkeypatch.setattr(metrics, '_instruments', {})
+    return Counter('rows_total', 'Rows seen.'), Histogram('step_seconds', 'Step time.', buckets=(0.1, 1.0))
+
+
+def test_counter_and_histogram_record(instruments: tuple[Counter, Histogram]) -> None:
+    counter, histogram = instruments
+
+    counter.inc()
+    counter.inc(4)
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert metrics.snapshot() == {
+        'rows_total': 5,
+        'step_seconds': {'count': 4, 'sum': 3.65, 'buckets': {'0.1': 2, '1': 3, '+Inf': 4}},
+    }
+
+    metrics.reset()
+    assert metrics.snapshot() == {
+        'rows_total': 0,
+        'step_seconds': {'count': 0, 'sum': 0, 'buckets': {'0.1': 0, '1': 0, '+Inf': 0}},
+    }
+
+
+def test_to_prometheus(instruments: tuple[Counter, Histogram]) -> None:
+    counter, histogram = instruments
+    counter.inc(2)
+    histogram.observe(0.5)
+
+    assert metrics.to_prometheus() == (
+        '# HELP rows_total Rows seen.\n'
+        '# TYPE rows_total counter\n'
+        'rows_total 2\n'
+        '# HELP step_seconds Step time.\n'
+        '# TYPE step_seconds histogram\n'
+        'step_seconds_bucket{le="0.1"} 0\n'
+        'step_seconds_bucket{le="1"} 1\n'
+        'step_seconds_bucket{le="+Inf"} 1\n'
+        'step_seconds_sum 0.5\n'
+        'step_seconds_count 1\n'
+    )
+
+
+def test_export_by_suffix(instruments: tuple[Counter, Histogram], tmp_path: Path) -> None:
+    instruments[0].inc(3)
+
+    metrics.export(tmp_path / 'todo.prom')
+    metrics.export(tmp_path / 'todo.json')
+
+    assert (tmp_path / 'todo.prom').read_text(encoding='utf-8') == metrics.to_prometheus()
+    assert json.loads((tmp_path / 'todo.json').read_text(encoding='utf-8'))['rows_total'] == 3
+
+
+def test_duplicate_names_are_rejected(instruments: tuple[Counter, Histogram]) -> None:
+    with pytest.raises(ValueError, match=re.escape('Metric rows_total is already registered.')):
+        Counter('rows_total', 'Again.')
+
+
+def test_timed_observes_only_while_enabled(instruments: tuple[Counter, Histogram]) -> None:
+    _, histogram = instruments
+
+    @histogram.timed
+    def work(value: int) -> int:
+        if value < 0:
+            raise ValueError(value)
+        return value * 2
+
+    assert work(1) == 2
+    assert histogram.count == 0
+
+    metrics.enable()
+    try:
+        assert work(2) == 4
+        with pytest.raises(ValueError, match='-1'):
+            work(-1)
+    finally:
+        metrics.disable()
+
+    assert histogram.count == 2
+    assert work.__name__ == 'work'
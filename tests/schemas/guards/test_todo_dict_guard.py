@@ -34,3 +34,15 @@ def test_is_todo_dict_returns_false_when_wrong_type_description(valid_todo_dict:
     valid_todo_dict['description'] = 5
 
     assert is_todo_dict(valid_todo_dict) is False
+
+
+def test_is_todo_dict_accepts_optional_recurrence(valid_todo_dict: dict[str, object]) -> None:
+    valid_todo_dict['recurrence'] = 'weekly'
+
+    assert is_todo_dict(valid_todo_dict) is True
+
+
+def test_is_todo_dict_returns_false_when_wrong_type_recurrence(valid_todo_dict: dict[str, object]) -> None:
+    valid_todo_dict['recurrence'] = 7
+
+    assert is_todo_dict(valid_todo_dict) is False
@@ -0,0 +1,76 @@
+from compression import gzip
+from datetime import UTC, date, datetime
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.enums.status_enum import StatusEnum
+from src.storage.archive import ArchiveStore, select_archivable
+from src.task.task import Todo
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from src.todo_list.todo_list import TodoList
+
+
+def test_iter_tasks_of_missing_archive(tmp_path: Path) -> None:
+    assert list(ArchiveStore(tmp_path / 'archive.ndjson.gz').iter_tasks()) == []
+
+
+def test_append_and_read_back(tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    store = ArchiveStore(tmp_path / 'cold' / 'archive.ndjson.gz')
+
+    assert store.append(mixed_todo_list.tasks[:2]) == 2
+    assert store.append(mixed_todo_list.tasks[2:]) == 2
+
+    archived = list(store.iter_tasks())
+
+    assert [task.to_dict() for task in archived] == mixed_todo_list.to_dict()['tasks']
+
+
+def test_archive_is_gzip_ndjson(tmp_path: Path, todo_completed: Todo) -> None:
+    path = tmp_path / 'archive.ndjson.gz'
+
+    ArchiveStore(path).append([todo_completed])
+
+    with gzip.open(path, 'rt', encoding='utf-8') as fp:
+        lines = fp.read().splitlines()
+
+    assert lines == [todo_completed.to_json()]
+
+
+def test_iter_tasks_skips_blank_lines(tmp_path: Path, todo_completed: Todo) -> None:
+    path = tmp_path / 'archive.ndjson.gz'
+    with gzip.open(path, 'wt', encoding='utf-8') as fp:
+        fp.write(f'\n{todo_completed.to_json()}\n\n')
+
+    assert [task.idx for task in ArchiveStore(path).iter_tasks()] == [todo_completed.idx]
+
+
+def test_iter_tasks_rejects_invalid_lines(tmp_path: Path) -> None:
+    path = tmp_path / 'archive.ndjson.gz'
+    with gzip.open(path, 'wt', encoding='utf-8') as fp:
+        fp.write('{"tasks": []}\n')
+
+    with pytest.raises(TypeError, match=re.escape('Invalid Todo JSON structure.')):
+        list(ArchiveStore(path).iter_tasks())
+
+
+def test_select_archivable_uses_status_and_age() -> None:
+    created_at = datetime(2025, 11, 1, 12, 0, tzinfo=UTC)
+    old_completed = Todo('Old completed', status=StatusEnum.COMPLETED, created_at=created_at)
+    old_todo = Todo('Old todo', status=StatusEnum.TODO, created_at=created_at)
+    recent_completed = Todo(
+        'Recent completed', status=StatusEnum.COMPLETED, created_at=datetime(2025, 11, 25, tzinfo=UTC)
+    )
+
+    selected = select_archivable(
+        [old_completed, old_todo, recent_completed],
+        older_than_days=30,
+        today=date(2025, 12, 11),
+    )
+
+    assert selected == [old_completed]
@@ -0,0 +1,56 @@
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.storage.atomic import TEMP_PREFIX, replacing
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+
+def test_replacing_swaps_the_file_in_when_done(tmp_path: Path) -> None:
+    path = tmp_path / 'todo.json.gz'
+    path.write_text('old', encoding='utf-8')
+    path.chmod(0o640)
+
+    with replacing(path) as temp:
+        assert temp.parent == tmp_path
+        assert temp.name.startswith(TEMP_PREFIX)
+        assert temp.suffixes[-2:] == ['.json', '.gz']
+        temp.write_text('new', encoding='utf-8')
+        assert path.read_text(encoding='utf-8') == 'old'
+
+    assert path.read_text(encoding='utf-8') == 'new'
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ['todo.json.gz']
+
+
+@pytest.mark.parametrize('error', [ValueError, KeyboardInterrupt])
+def test_replacing_keeps_the_file_on_errors(tmp_path: Path, error: type[BaseException]) -> None:
+    path = tmp_path / 'todo.json'
+    path.write_text('old', encoding='utf-8')
+
+    def write() -> None:
+        with replacing(path) as temp:
+            temp.write_text('partial', encoding='utf-8')
+            raise error
+
+    with pytest.raises(error):
+        write()
+
+    assert path.read_text(encoding='utf-8') == 'old'
+    assert [p.name for p in tmp_path.iterdir()] == ['todo.json']
+
+
+def test_replacing_creates_files_with_the_umask_mode(tmp_path: Path) -> None:
+    path = tmp_path / 'todo.json'
+    umask = os.umask(0o027)
+    try:
+        with replacing(path) as temp:
+            temp.write_text('new', encoding='utf-8')
+    finally:
+        os.umask(umask)
+
+    assert path.stat().st_mode & 0o777 == 0o640
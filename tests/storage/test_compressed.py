@@ -0,0 +1,81 @@
+from compression import gzip, lzma, zstd
+from pathlib import Path
+import re
+
+import pytest
+
+from src.storage.compressed import DEFAULT_LEVELS, codec_of, read_compressed, write_compressed
+from src.todo_list.todo_list import TodoList
+
+
+OPENERS = {'.gz': gzip.open, '.xz': lzma.open, '.zst': zstd.open}
+
+
+@pytest.mark.parametrize(
+    ('name', 'expected'),
+    [
+        ('data.json.gz', '.gz'),
+        ('data.json.zst', '.zst'),
+        ('data.json.xz', '.xz'),
+        ('data.json', None),
+        ('data.gz', None),
+        ('data.json.bz2', None),
+    ],
+)
+def test_codec_of(name: str, expected: str | None) -> None:
+    assert codec_of(Path(name)) == expected
+
+
+@pytest.mark.parametrize('codec', list(OPENERS))
+def test_write_and_read_round_trip(tmp_path: Path, mixed_todo_list: TodoList, codec: str) -> None:
+    path = tmp_path / f'data.json{codec}'
+
+    write_compressed(path, mixed_todo_list)
+
+    with OPENERS[codec](path, 'rt', encoding='utf-8') as fp:
+        raw = fp.read()
+
+    assert raw == mixed_todo_list.to_json()
+    assert read_compressed(path).to_dict() == mixed_todo_list.to_dict()
+
+
+@pytest.mark.parametrize('codec', list(OPENERS))
+def test_write_with_level_and_indent(tmp_path: Path, mixed_todo_list: TodoList, codec: str) -> None:
+    path = tmp_path / f'data.json{codec}'
+
+    write_compressed(path, mixed_todo_list, level=DEFAULT_LEVELS[codec] - 1, indent=4)
+
+    assert read_compressed(path).to_json(indent=4) == mixed_todo_list.to_json(indent=4)
+
+
+def test_read_passes_workers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    captured: dict[str, object] = {}
+
+    def fake_from_json(_: str, **kwargs: object) -> TodoList:
+        captured.update(kwargs)
+        return mixed_todo_list
+
+    path = tmp_path / 'data.json.gz'
+    write_compressed(path, mixed_todo_list)
+    monkeypatch.setattr(TodoList, 'from_json', fake_from_json)
+
+    assert read_compressed(path, workers=3) is mixed_todo_list
+    assert captured == {'workers': 3, 'trusted': True}
+
+
+@pytest.mark.parametrize('codec', list(OPENERS))
+def test_read_corrupted_store(tmp_path: Path, codec: str) -> None:
+    path = tmp_path / f'data.json{codec}'
+    path.write_bytes(b'definitely not compressed')
+
+    with pytest.raises(ValueError, match=re.escape(f'Corrupted compressed store: data.json{codec}.')):
+        read_compressed(path)
+
+
+def test_not_a_compressed_store(tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    path = tmp_path / 'data.json'
+
+    with pytest.raises(ValueError, match=re.escape('Not a compressed store: data.json.')):
+        read_compressed(path)
+    with pytest.raises(ValueError, match=re.escape('Not a compressed store: data.json.')):
+        write_compressed(path, mixed_todo_list)
@@ -0,0 +1,118 @@
+import json
+import re
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+
+from src.storage.ndjson import NdjsonStore
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from src.task.task import Todo
+    from src.todo_list.todo_list import TodoList
+
+
+@pytest.fixture
+def store(tmp_path: Path, mixed_todo_list: TodoList) -> NdjsonStore:
+    store = NdjsonStore(tmp_path / 'data' / 'todo.ndjson')
+    store.write(mixed_todo_list)
+    return store
+
+
+def test_write_stores_one_task_per_line(store: NdjsonStore, mixed_todo_list: TodoList) -> None:
+    lines = store.path.read_text(encoding='utf-8').splitlines()
+
+    assert [json.loads(line) for line in lines] == mixed_todo_list.to_dict()['tasks']
+    assert store.index_path.name == 'todo.ndjson.idx'
+    assert store.load().to_dict() == mixed_todo_list.to_dict()
+
+
+def test_write_consumes_an_iterator(tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    store = NdjsonStore(tmp_path / 'todo.ndjson')
+
+    assert store.write(iter(mixed_todo_list)) == 4
+    assert len(store) == 4
+    assert store.get(mixed_todo_list.tasks[2].idx).idx == mixed_todo_list.tasks[2].idx
+
+
+def test_interrupted_write_keeps_the_store(store: NdjsonStore, todo_1: Todo) -> None:
+    data, index = store.path.read_bytes(), store.index_path.read_bytes()
+
+    def tasks() -> Iterator[Todo]:
+        yield todo_1
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        store.write(tasks())
+
+    assert (store.path.read_bytes(), store.index_path.read_bytes()) == (data, index)
+    assert sorted(path.name for path in store.path.parent.iterdir()) == ['todo.ndjson', 'todo.ndjson.idx']
+
+
+def test_load_reads_only_the_first_lines(store: NdjsonStore, mixed_todo_list: TodoList) -> None:
+    with store.path.open('a', encoding='utf-8') as fp:
+        fp.write('not json\n')
+
+    assert [task.idx for task in store.load(limit=2)] == [task.idx for task in mixed_todo_list.tasks[:2]]
+
+
+def test_getitem_and_get_seek_to_one_record(store: NdjsonStore, mixed_todo_list: TodoList) -> None:
+    assert len(store) == 4
+    assert store[1].to_dict() == mixed_todo_list.tasks[1].to_dict()
+    assert store[-1].idx == mixed_todo_list.tasks[-1].idx
+    assert store.get(mixed_todo_list.tasks[2].idx).to_dict() == mixed_todo_list.tasks[2].to_dict()
+
+
+def test_lookup_errors(store: NdjsonStore) -> None:
+    missing = uuid4()
+
+    with pytest.raises(IndexError):
+        store[4]
+    with pytest.raises(ValueError, match=re.escape(f'Task with idx: {missing} not found.')):
+        store.get(missing)
+
+
+def test_get_ignores_unaligned_matches(tmp_path: Path, todo_1: Todo, todo_2: Todo) -> None:
+    store = NdjsonStore(tmp_path / 'todo.ndjson')
+    store.write([todo_1])
+    key = todo_2.idx_int.to_bytes(16)
+    # A copy of the id that does not start at an entry boundary must not match.
+    store.index_path.write_bytes(store.index_path.read_bytes() + key[:8] + key + b'\0' * 24)
+
+    with pytest.raises(ValueError, match='not found'):
+        store.get(todo_2.idx)
+
+
+def test_append_extends_data_and_index(store: NdjsonStore, todo_1: Todo, todo_2: Todo) -> None:
+    index_size = store.index_path.stat().st_size
+
+    assert store.append([todo_1, todo_2]) == 2
+
+    assert len(store) == 6
+    assert store.index_path.stat().st_size == index_size + 2 * 24
+    assert store[4].idx == todo_1.idx
+    assert store.get(todo_2.idx).description == todo_2.description
+
+
+def test_append_creates_the_store(tmp_path: Path, todo_1: Todo) -> None:
+    store = NdjsonStore(tmp_path / 'new' / 'todo.ndjson')
+
+    store.append([todo_1])
+
+    assert [task.idx for task in store.load()] == [todo_1.idx]
+    assert store[0].idx == todo_1.idx
+
+
+def test_stale_index_is_rebuilt(store: NdjsonStore, mixed_todo_list: TodoList, todo_1: Todo) -> None:
+    with store.path.open('a', encoding='utf-8') as fp:
+        fp.write('\n' + todo_1.to_json() + '\n')
+    store.index_path.write_bytes(b'')
+
+    assert len(store) == 5
+    assert len(store.load()) == 5
+    assert store[4].idx == todo_1.idx
+    assert store[0].idx == mixed_todo_list.tasks[0].idx
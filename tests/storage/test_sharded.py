@@ -0,0 +1,119 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.enums.status_enum import StatusEnum
+from src.storage.atomic import TEMP_PREFIX
+from src.storage.sharded import ShardedStore
+from src.task.recurrence import Recurrence
+from src.task.task import Todo
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from src.todo_list.todo_list import TodoList
+
+
+@pytest.fixture
+def store(tmp_path: Path, mixed_todo_list: TodoList) -> ShardedStore:
+    store = ShardedStore(tmp_path / 'shards')
+    store.save(mixed_todo_list)
+    return ShardedStore(tmp_path / 'shards')
+
+
+def _mtimes(store: ShardedStore) -> dict[str, int]:
+    return {name: store.shard_path(name).stat().st_mtime_ns for name in store.shard_names()}
+
+
+def test_unknown_shard_key(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match='Unknown shard key: colour'):
+        ShardedStore(tmp_path, 'colour')
+
+
+def test_save_splits_by_status(store: ShardedStore) -> None:
+    assert store.shard_names() == ['completed', 'in_progress', 'todo']
+    assert [t.description for t in store.load(['todo'])] == ['Learn FastAPI', 'Task without deadline']
+
+
+def test_hash_shards(tmp_path: Path, mixed_todo_list: TodoList) -> None:
+    store = ShardedStore(tmp_path, 'hash')
+
+    written = store.save(mixed_todo_list)
+
+    assert written == sorted({task.idx.hex[0] for task in mixed_todo_list})
+    for name in written:
+        assert all(task.idx.hex[0] == name for task in ShardedStore(tmp_path, 'hash').load([name]))
+    assert len(store.load()) == 4
+
+
+def test_load_roundtrip(store: ShardedStore, mixed_todo_list: TodoList) -> None:
+    loaded = store.load()
+
+    assert sorted(t.description for t in loaded) == sorted(t.description for t in mixed_todo_list)
+
+
+def test_save_without_changes_writes_nothing(store: ShardedStore) -> None:
+    todo_list = store.load()
+
+    assert store.save(todo_list) == []
+
+
+def test_save_rewrites_only_dirty_shards(store: ShardedStore) -> None:
+    todo_list = store.load()
+    before = _mtimes(store)
+
+    next(t for t in todo_list if t.status == StatusEnum.TODO).add_tag('changed')
+    todo_list.add(Todo('New in progress', status=StatusEnum.IN_PROGRESS))
+
+    assert store.save(todo_list) == ['in_progress', 'todo']
+    assert _mtimes(store)['completed'] == before['completed']
+    assert store.save(todo_list) == []
+
+
+@pytest.mark.parametrize(
+    ('field', 'value'),
+    [('description', 'Edited description'), ('recurrence', Recurrence(7))],
+)
+def test_description_and_recurrence_edits_are_saved(store: ShardedStore, field: str, value: object) -> None:
+    todo_list = store.load()
+    task = next(t for t in todo_list if t.status == StatusEnum.COMPLETED)
+
+    setattr(task, field, value)
+
+    assert store.save(todo_list) == ['completed']
+    assert getattr(ShardedStore(store.directory).load(['completed']).tasks[0], field) == value
+
+
+def test_status_change_moves_task_between_shards(store: ShardedStore) -> None:
+    todo_list = store.load()
+    task = next(t for t in todo_list if t.status == StatusEnum.IN_PROGRESS)
+
+    task.status = StatusEnum.COMPLETED
+
+    assert store.save(todo_list) == ['completed', 'in_progress']
+    assert task.idx in ShardedStore(store.directory).load(['completed'])
+    assert len(ShardedStore(store.directory).load(['in_progress'])) == 0
+    assert store.save(todo_list) == []
+
+
+def test_partial_load_merges_unloaded_shard_on_save(store: ShardedStore) -> None:
+    active = store.load(['todo'])
+    task = active[0]
+
+    task.status = StatusEnum.COMPLETED
+
+    assert store.save(active) == ['completed', 'todo']
+
+    completed = ShardedStore(store.directory).load(['completed'])
+    assert sorted(t.description for t in completed) == ['Learn FastAPI', 'Learn Java']
+
+
+def test_shard_names_skip_unfinished_writes(store: ShardedStore) -> None:
+    (store.directory / f'{TEMP_PREFIX}abc-todo.json').write_text('{"tasks": [', encoding='utf-8')
+
+    assert store.shard_names() == ['completed', 'in_progress', 'todo']
+
+
+def test_load_missing_shard_is_empty(store: ShardedStore) -> None:
+    assert len(store.load(['blocked'])) == 0
@@ -0,0 +1,69 @@
+from datetime import UTC, timedelta
+import re
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import pytest
+
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+
+
+def test_clone_many_shares_fields_and_creation_time(basic_todo: Todo) -> None:
+    clones = basic_todo.clone_many(3)
+
+    assert len(clones) == 3
+    for clone in clones:
+        assert clone.description == basic_todo.description
+        assert clone.priority == basic_todo.priority
+        assert clone.deadline == basic_todo.deadline
+        assert clone.tags == basic_todo.tags
+        assert clone.status == basic_todo.status
+        assert clone.created_at == _FixedDateTime.now(tz=UTC)
+
+
+def test_clone_many_draws_distinct_uuid4_ids(basic_todo: Todo) -> None:
+    clones = basic_todo.clone_many(50)
+
+    ids = {clone.idx for clone in clones}
+
+    assert len(ids) == 50
+    assert basic_todo.idx not in ids
+    assert all(idx.version == 4 and idx.variant == UUID(int=1 << 63).variant for idx in ids)
+    assert all(UUID(clone.idx_str) == clone.idx for clone in clones)
+
+
+def test_clone_many_uses_given_deadlines_and_tags(basic_todo: Todo) -> None:
+    today = _FixedDateTime.now(tz=UTC).date()
+    deadlines = [today + timedelta(days=7), None, today]
+
+    clones = basic_todo.clone_many(3, deadlines=deadlines, tags=[' Weekly ', 'python'])
+
+    assert [clone.deadline for clone in clones] == deadlines
+    assert all(clone.tags == ['weekly', 'python'] for clone in clones)
+    assert basic_todo.tags == ['python', 'javascript', 'java']
+
+
+def test_clone_many_drops_past_template_deadline(basic_todo: Todo) -> None:
+    basic_todo._deadline = (_FixedDateTime.now(tz=UTC) - timedelta(days=1)).date()
+
+    assert [clone.deadline for clone in basic_todo.clone_many(2)] == [None, None]
+
+
+def test_clone_many_rejects_wrong_number_of_deadlines(basic_todo: Todo) -> None:
+    with pytest.raises(ValueError, match=re.escape('Expected 2 deadlines, got 1.')):
+        basic_todo.clone_many(2, deadlines=[None])
+
+
+def test_clone_many_rejects_past_deadline(basic_todo: Todo) -> None:
+    past = (_FixedDateTime.now(tz=UTC) - timedelta(days=1)).date()
+
+    with pytest.raises(ValueError, match=f'Deadline {past} is invalid'):
+        basic_todo.clone_many(2, deadlines=[None, past])
+
+
+def test_clone_many_zero_returns_empty_list(basic_todo: Todo) -> None:
+    assert basic_todo.clone_many(0) == []
@@ -0,0 +1,47 @@
+from datetime import UTC, date, datetime, timedelta, timezone
+
+import pytest
+
+from src.task.dates import DATE_CACHE_SIZE, check_datetime, format_date, parse_date
+
+
+def test_parse_date_shares_cached_objects() -> None:
+    parsed = parse_date('2026-03-01')
+
+    assert parsed == date(2026, 3, 1)
+    assert parse_date(''.join(['2026-03', '-01'])) is parsed
+    assert parse_date.cache_info().maxsize == DATE_CACHE_SIZE
+
+
+def test_parse_date_rejects_invalid_dates() -> None:
+    with pytest.raises(ValueError, match='Invalid isoformat string'):
+        parse_date('2026-02-30x')
+
+
+def test_format_date_round_trips() -> None:
+    formatted = format_date(date(2026, 3, 1))
+
+    assert formatted == '2026-03-01'
+    assert format_date(date(2026, 3, 1)) is formatted
+    assert parse_date(formatted) == date(2026, 3, 1)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        datetime(2026, 3, 1, 9, 5, 7, tzinfo=UTC),
+        datetime(2026, 3, 1, 23, 59, 59, 123456, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+    ],
+)
+def test_check_datetime_accepts_isoformat_output(value: datetime) -> None:
+    text = value.isoformat()
+
+    assert check_datetime(text) is text
+
+
+@pytest.mark.parametrize(
+    'text', ['not-a-date', '2026-02-30T10:00:00', '2026-03-01T24:00:00', '2026-03-01 10:00:00', '2026-03-01']
+)
+def test_check_datetime_rejects_other_strings(text: str) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011 - same errors as datetime.fromisoformat
+        check_datetime(text)
@@ -0,0 +1,81 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+import src.task.task as task_module
+from src.task.task import Todo, parse_uuid4
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        'de184248-44f2-4944-a209-a6097846da17',
+        'DE184248-44F2-4944-A209-A6097846DA17',
+        '{de184248-44f2-4944-a209-a6097846da17}',
+        'urn:uuid:de184248-44f2-4944-a209-a6097846da17',
+        'de18424844f24944a209a6097846da17',
+        'de184248-44f2-1944-0209-a6097846da17',
+        '00000000-0000-0000-0000-000000000000',
+    ],
+)
+def test_parse_uuid4_matches_uuid(value: str) -> None:
+    assert parse_uuid4(value) == UUID(value, version=4).int
+
+
+@pytest.mark.parametrize(
+    'value',
+    ['de184248-44f2-4944-a209-a6097846da1g', 'de184248-44f2-4944-a209-a6097846da1_', 'not a uuid', ''],
+)
+def test_parse_uuid4_rejects_invalid(value: str) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011 - same errors as uuid.UUID
+        parse_uuid4(value)
+
+
+def test_parse_uuid4_leaves_hex_prefix_to_uuid(monkeypatch: pytest.MonkeyPatch) -> None:
+    def strict_uuid(value: str, version: int) -> UUID:
+        raise ValueError(value)
+
+    monkeypatch.setattr('src.task.task.UUID', strict_uuid)
+
+    with pytest.raises(ValueError, match='0x345678'):
+        parse_uuid4('0x345678-1234-4234-8234-123456789012')
+
+
+def test_hex_prefix_is_never_kept_as_id_string() -> None:
+    assert not task_module._is_canonical_uuid4('0x345678-1234-4234-8234-123456789012')
+    assert task_module._is_canonical_uuid4('00345678-1234-4234-8234-123456789012')
+
+
+def test_idx_str_reuses_canonical_input() -> None:
+    idx = ''.join(['de184248-44f2-4944-', 'a209-a6097846da17'])
+    t = Todo('Write tests', idx=idx)
+
+    assert t.idx_str is idx
+    assert t.idx_int == UUID(idx).int
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('DE184248-44F2-4944-A209-A6097846DA17', 'de184248-44f2-4944-a209-a6097846da17'),
+        ('de184248-44f2-1944-0209-a6097846da17', 'de184248-44f2-4944-8209-a6097846da17'),
+    ],
+)
+def test_idx_str_of_non_canonical_input(value: str, expected: str) -> None:
+    t = Todo('Write tests', idx=value)
+
+    assert t.idx_str == expected
+    assert t.idx_str is t.idx_str
+    assert t.idx == UUID(expected)
+
+
+def test_idx_object_is_created_lazily() -> None:
+    idx = uuid4()
+    t = Todo('Write tests', idx=idx)
+    loaded = Todo.from_dict(t.to_dict(), trusted=True)
+
+    assert t.idx is idx
+    assert t.idx_int == idx.int
+    assert loaded._idx is None
+    assert loaded.idx == idx
+    assert loaded.idx is loaded.idx
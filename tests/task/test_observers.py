@@ -0,0 +1,113 @@
+from datetime import date
+import gc
+
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple[Todo, str, object, object]] = []
+
+    def task_changed(self, task: Todo, field: str, old: object, new: object) -> None:
+        self.events.append((task, field, old, new))
+
+
+def test_setters_notify_subscribed_observer(basic_todo: Todo) -> None:
+    recorder = _Recorder()
+    basic_todo.subscribe(recorder)
+
+    basic_todo.priority = PriorityEnum.HIGH
+    basic_todo.status = StatusEnum.COMPLETED
+    basic_todo.deadline = date(2026, 1, 1)
+    basic_todo.tags = ['New']
+
+    assert recorder.events == [
+        (basic_todo, 'priority', PriorityEnum.LOW, PriorityEnum.HIGH),
+        (basic_todo, 'status', StatusEnum.IN_PROGRESS, StatusEnum.COMPLETED),
+        (basic_todo, 'deadline', date(2025, 12, 21), date(2026, 1, 1)),
+        (basic_todo, 'tags', ('python', 'javascript', 'java'), ('new',)),
+    ]
+
+
+def test_add_and_remove_tag_notify_only_on_change(basic_todo: Todo) -> None:
+    recorder = _Recorder()
+    basic_todo.subscribe(recorder)
+
+    basic_todo.add_tag('Rust')
+    basic_todo.add_tag('rust')
+    basic_todo.remove_tag('Python')
+    basic_todo.remove_tag('missing')
+
+    assert recorder.events == [
+        (basic_todo, 'tags', (), ('rust',)),
+        (basic_todo, 'tags', ('python',), ()),
+    ]
+
+
+def test_unsubscribe_stops_notifications(basic_todo: Todo) -> None:
+    first = _Recorder()
+    second = _Recorder()
+    basic_todo.subscribe(first)
+    basic_todo.subscribe(second)
+
+    basic_todo.unsubscribe(first)
+    basic_todo.priority = PriorityEnum.HIGH
+
+    assert first.events == []
+    assert len(second.events) == 1
+
+
+def test_observers_are_weakly_referenced(basic_todo: Todo) -> None:
+    recorder = _Recorder()
+    basic_todo.subscribe(recorder)
+
+    del recorder
+    gc.collect()
+    basic_todo.priority = PriorityEnum.HIGH
+
+    survivor = _Recorder()
+    basic_todo.subscribe(survivor)
+    basic_todo.unsubscribe(survivor)
+
+    assert basic_todo._observers == ()
+
+
+def test_dead_observers_are_dropped(basic_todo: Todo) -> None:
+    for _ in range(3):
+        basic_todo.subscribe(_Recorder())
+    gc.collect()
+
+    survivor = _Recorder()
+    basic_todo.subscribe(survivor)
+
+    assert [ref() for ref in basic_todo._observers] == [survivor]
+
+    basic_todo.subscribe(_Recorder())
+    gc.collect()
+    basic_todo.priority = PriorityEnum.HIGH
+
+    assert [ref() for ref in basic_todo._observers] == [survivor]
+    assert len(survivor.events) == 1
+
+
+def test_construction_does_not_share_observers() -> None:
+    recorder = _Recorder()
+    first = Todo('Write tests')
+    first.subscribe(recorder)
+
+    second = Todo('Write docs')
+    second.priority = PriorityEnum.HIGH
+
+    assert recorder.events == []
+
+
+def test_subscribe_is_idempotent(basic_todo: Todo) -> None:
+    recorder = _Recorder()
+
+    basic_todo.subscribe(recorder)
+    basic_todo.subscribe(recorder)
+    basic_todo.priority = PriorityEnum.HIGH
+
+    assert len(recorder.events) == 1
@@ -0,0 +1,72 @@
+from datetime import UTC, timedelta
+from typing import TYPE_CHECKING
+
+from src.enums.status_enum import StatusEnum
+from src.task.recurrence import Recurrence
+from src.task.task import Todo
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datetime import date
+
+
+def _today() -> date:
+    return _FixedDateTime.now(tz=UTC).date()
+
+
+def test_occurrences_follow_the_deadline(basic_todo: Todo) -> None:
+    basic_todo.recurrence = Recurrence(7)
+    assert basic_todo.deadline is not None
+
+    instances = list(basic_todo.occurrences(_today(), basic_todo.deadline + timedelta(days=21)))
+
+    assert [task.deadline for task in instances] == [basic_todo.deadline + timedelta(days=7 * k) for k in (1, 2, 3)]
+    for task in instances:
+        assert task.description == basic_todo.description
+        assert task.priority == basic_todo.priority
+        assert task.tags == basic_todo.tags
+        assert task.status == StatusEnum.TODO
+        assert task.recurrence is None
+        assert task.idx.version == 4
+    assert len({task.idx for task in instances} | {basic_todo.idx}) == 4
+
+
+def test_occurrence_ids_are_stable(basic_todo: Todo) -> None:
+    basic_todo.recurrence = Recurrence(1)
+    end = _today() + timedelta(days=30)
+
+    first = [task.idx for task in basic_todo.occurrences(_today(), end)]
+    second = [task.idx for task in basic_todo.occurrences(_today() + timedelta(days=20), end)]
+
+    assert first[-len(second) :] == second
+
+
+def test_occurrences_without_deadline_start_from_creation() -> None:
+    task = Todo(description='Water plants', recurrence=Recurrence(2))
+
+    deadlines = [instance.deadline for instance in task.occurrences(_today(), _today() + timedelta(days=5))]
+
+    assert deadlines == [_today() + timedelta(days=2), _today() + timedelta(days=4)]
+
+
+def test_one_off_task_has_no_occurrences(basic_todo: Todo) -> None:
+    assert list(basic_todo.occurrences(_today(), _today() + timedelta(days=365))) == []
+
+
+def test_recurrence_round_trips_through_dict(basic_todo: Todo) -> None:
+    assert 'recurrence' not in basic_todo.to_dict()
+
+    basic_todo.recurrence = Recurrence(7)
+    data = basic_todo.to_dict()
+
+    assert data['recurrence'] == 'weekly'
+    assert Todo.from_dict(data).recurrence == Recurrence(7)
+    assert Todo.from_json(basic_todo.to_json(), trusted=True).recurrence == Recurrence(7)
+
+
+def test_clone_and_repr_keep_recurrence(basic_todo: Todo) -> None:
+    basic_todo.recurrence = Recurrence(3)
+
+    assert basic_todo.clone().recurrence == Recurrence(3)
+    assert repr(basic_todo).endswith(', recurrence=Recurrence(interval_days=3))')
@@ -0,0 +1,54 @@
+from datetime import date
+import pickle  # noqa: S403
+
+import pytest
+
+from src.task.recurrence import Recurrence, parse_recurrence
+
+
+@pytest.mark.parametrize(
+    ('text', 'interval_days'),
+    [('daily', 1), ('Weekly', 7), (' every 3 days ', 3), ('every 1 day', 1), ('EVERY  14 DAYS', 14)],
+)
+def test_parse_recurrence(text: str, interval_days: int) -> None:
+    assert parse_recurrence(text) == Recurrence(interval_days)
+
+
+@pytest.mark.parametrize('text', ['monthly', 'every days', 'every -2 days', 'every 0 days', ''])
+def test_parse_recurrence_rejects_invalid_rules(text: str) -> None:
+    with pytest.raises(ValueError, match='Recurrence'):
+        parse_recurrence(text)
+
+
+@pytest.mark.parametrize(('interval_days', 'text'), [(1, 'daily'), (7, 'weekly'), (10, 'every 10 days')])
+def test_str_round_trips(interval_days: int, text: str) -> None:
+    assert str(Recurrence(interval_days)) == text
+    assert parse_recurrence(text) == Recurrence(interval_days)
+
+
+def test_recurrence_is_immutable_hashable_and_picklable() -> None:
+    rule = Recurrence(3)
+
+    with pytest.raises(AttributeError, match='immutable'):
+        rule.interval_days = 4
+
+    assert {rule, Recurrence(3)} == {rule}
+    assert rule != 3
+    assert repr(rule) == 'Recurrence(interval_days=3)'
+    assert pickle.loads(pickle.dumps(rule)) == rule  # noqa: S301
+
+
+def test_dates_start_after_the_anchor() -> None:
+    dates = list(Recurrence(7).dates(date(2026, 1, 1), date(2025, 12, 1), date(2026, 1, 22)))
+
+    assert dates == [(1, date(2026, 1, 8)), (2, date(2026, 1, 15)), (3, date(2026, 1, 22))]
+
+
+def test_dates_skip_to_a_distant_window() -> None:
+    dates = list(Recurrence(3).dates(date(2026, 1, 1), date(2027, 1, 1), date(2027, 1, 7)))
+
+    assert dates == [(122, date(2027, 1, 2)), (123, date(2027, 1, 5))]
+
+
+def test_dates_of_an_empty_window() -> None:
+    assert list(Recurrence(1).dates(date(2026, 1, 1), date(2026, 2, 1), date(2026, 1, 31))) == []
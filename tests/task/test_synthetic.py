@@ -0,0 +1,78 @@
+from collections import Counter
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.synthetic import DEFAULT_START, generate_tasks, zipf_weights
+from src.task.task import Todo
+
+
+def test_generate_tasks_is_reproducible() -> None:
+    first = [task.to_dict() for task in generate_tasks(50, seed=7)]
+
+    assert first == [task.to_dict() for task in generate_tasks(50, seed=7)]
+    assert first != [task.to_dict() for task in generate_tasks(50, seed=8)]
+    assert len({record['idx'] for record in first}) == 50
+
+
+def test_generated_tasks_are_valid() -> None:
+    for task in generate_tasks(200, seed=1, max_tags=5, deadline_days=10, description_words=(2, 4)):
+        record = task.to_dict()
+        assert Todo.from_dict(record).to_dict() == record
+        assert UUID(record['idx']).version == 4
+        assert 2 <= len(task.description.split()) <= 4
+        assert len(task.tags) <= 5
+        assert DEFAULT_START <= task.created_at < DEFAULT_START + timedelta(days=365)
+        assert task.deadline is None or 0 <= (task.deadline - task.created_at.date()).days <= 10
+
+
+def test_generate_tasks_follows_the_weights() -> None:
+    tasks = list(
+        generate_tasks(
+            2000,
+            priority_weights={PriorityEnum.HIGH: 1},
+            status_weights={StatusEnum.TODO: 1, StatusEnum.BLOCKED: 3},
+            deadline_ratio=0,
+        )
+    )
+
+    statuses = Counter(task.status for task in tasks)
+    assert {task.priority for task in tasks} == {PriorityEnum.HIGH}
+    assert set(statuses) == {StatusEnum.TODO, StatusEnum.BLOCKED}
+    assert statuses[StatusEnum.BLOCKED] > 2 * statuses[StatusEnum.TODO]
+    assert all(task.deadline is None for task in tasks)
+
+
+def test_tag_popularity_is_zipfian() -> None:
+    tags = Counter(tag for task in generate_tasks(5000, tag_count=100, max_tags=1) for tag in task.tags)
+
+    assert set(tags) <= {f'tag-{rank}' for rank in range(1, 101)}
+    assert tags['tag-1'] > 2 * tags['tag-5'] > 0
+    assert tags.most_common(1)[0][0] == 'tag-1'
+
+
+def test_zipf_weights() -> None:
+    assert zipf_weights(3, 1) == pytest.approx([1, 1.5, 1.5 + 1 / 3])
+    assert zipf_weights(2, 0) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'message'),
+    [
+        ({'count': -1}, 'must not be negative'),
+        ({'tag_count': 0}, 'must not be negative'),
+        ({'description_words': (0, 3)}, 'Description length'),
+        ({'description_words': (4, 3)}, 'Description length'),
+        ({'deadline_ratio': 1.5}, 'Deadline ratio'),
+        ({'priority_weights': {}}, 'Priority weights'),
+        ({'status_weights': {StatusEnum.TODO: -1, StatusEnum.BLOCKED: 2}}, 'Status weights'),
+    ],
+)
+def test_generate_tasks_checks_arguments_eagerly(kwargs: dict[str, object], message: str) -> None:
+    arguments: dict[str, object] = {'count': 1} | kwargs
+
+    with pytest.raises(ValueError, match=message):
+        generate_tasks(**arguments)  # type: ignore[arg-type]
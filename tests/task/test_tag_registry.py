@@ -0,0 +1,53 @@
+import pickle  # noqa: S403
+
+from src.task.tags import TAG_REGISTRY, TagRegistry
+from src.task.task import Todo
+
+
+def test_intern_assigns_stable_sequential_ids() -> None:
+    registry = TagRegistry()
+
+    assert registry.intern('python') == 0
+    assert registry.intern('sql') == 1
+    assert registry.intern('python') == 0
+    assert registry.id_of('sql') == 1
+    assert registry.id_of('rust') is None
+    assert registry.name(1) == 'sql'
+    assert registry.names([1, 0, 1]) == ['sql', 'python', 'sql']
+    assert len(registry) == 2
+
+
+def test_intern_rechecks_under_lock() -> None:
+    registry = TagRegistry()
+
+    class RegisteringLock:
+        def __enter__(self) -> None:
+            registry._ids['late'] = 7
+
+        def __exit__(self, *_: object) -> None:
+            return None
+
+    registry._lock = RegisteringLock()  # type: ignore[assignment]
+
+    assert registry.intern('late') == 7
+    assert len(registry) == 0
+
+
+def test_tasks_share_tag_ids() -> None:
+    first = Todo('First task', tags=['Shared', 'one'])
+    second = Todo('Second task', tags=['shared'])
+
+    assert next(iter(first.tags.ids)) == next(iter(second.tags.ids)) == TAG_REGISTRY.id_of('shared')
+    assert first.to_dict()['tags'] == ['shared', 'one']
+
+
+def test_pickled_task_carries_tag_strings() -> None:
+    task = Todo('Pickled task', tags=['a', 'b'])
+
+    state = task.__getstate__()
+    restored = pickle.loads(pickle.dumps(task))  # noqa: S301
+
+    assert state['_tag_ids'] == ['a', 'b']
+    assert '_tags_view' not in state
+    assert restored.tags == ['a', 'b']
+    assert list(restored.tags.ids) == list(task.tags.ids)
@@ -0,0 +1,61 @@
+import pickle  # noqa: S403
+
+import pytest
+
+from src.task.task import Todo
+
+
+def test_tags_view_is_read_only_sequence() -> None:
+    t = Todo('Write test', tags=['b', 'a', 'c'])
+
+    assert list(t.tags) == ['b', 'a', 'c']
+    assert t.tags[0] == 'b'
+    assert t.tags[-1] == 'c'
+    assert t.tags[1:] == ['a', 'c']
+    assert list(reversed(t.tags)) == ['c', 'a', 'b']
+    assert t.tags.index('a') == 1
+    assert 'a' in t.tags
+    assert 'z' not in t.tags
+    assert not hasattr(t.tags, 'append')
+    assert not hasattr(t.tags, 'remove')
+
+
+def test_tags_view_follows_changes() -> None:
+    t = Todo('Write test', tags=['a'])
+    view = t.tags
+
+    t.add_tag('b')
+    t.remove_tag('a')
+
+    assert view == ['b']
+
+
+def test_tags_view_equality_and_repr() -> None:
+    t = Todo('Write test', tags=['a', 'b'])
+
+    assert t.tags == ['a', 'b']
+    assert t.tags == ('a', 'b')
+    assert t.tags == Todo('Other task', tags=['A', 'B']).tags
+    assert t.tags != ['b', 'a']
+    assert t.tags != 'ab'
+    assert repr(t.tags) == "['a', 'b']"
+    with pytest.raises(TypeError):
+        hash(t.tags)
+
+
+def test_assign_tags_from_own_view() -> None:
+    t = Todo('Write test', tags=['a', 'b'])
+
+    t.tags = t.tags
+
+    assert t.tags == ['a', 'b']
+
+
+def test_tags_survive_pickle() -> None:
+    t = Todo('Write test', tags=['a', 'b'])
+
+    restored = pickle.loads(pickle.dumps(t))  # noqa: S301
+    restored.add_tag('c')
+
+    assert restored.tags == ['a', 'b', 'c']
+    assert t.tags == ['a', 'b']
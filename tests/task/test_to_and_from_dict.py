@@ -44,3 +44,70 @@ def test_from_dict_correct() -> None:
     assert tfd.deadline == datetime.date(2026, 1, 16)
     assert tfd.created_at == datetime.datetime(2026, 1, 14, 19, 52, 0, 737625, tzinfo=datetime.UTC)
     assert tfd.idx == UUID('7f4deca0-44b7-413a-80d7-550fedb1dc6a')
+
+
+def test_from_dict_trusted_matches_validated_path(todo_high_priority: Todo) -> None:
+    data = todo_high_priority.to_dict()
+
+    trusted = Todo.from_dict(data, trusted=True)
+
+    assert trusted.to_dict() == Todo.from_dict(data).to_dict() == data
+    assert trusted._observers == ()
+
+
+def test_from_dict_trusted_skips_validation() -> None:
+    data: TodoDict = {
+        'description': ' x ',
+        'priority': 1,
+        'created_at': '2026-01-14T19:52:00+00:00',
+        'deadline': '2026-01-01',
+        'tags': ['Not Normalized'],
+        'status': 'todo',
+        'idx': '7f4deca0-44b7-413a-80d7-550fedb1dc6a',
+    }
+
+    task = Todo.from_dict(data, trusted=True)
+
+    assert task.description == ' x '
+    assert task.deadline == datetime.date(2026, 1, 1)
+    assert task.tags == ['Not Normalized']
+
+
+def test_from_dict_trusted_task_stays_mutable_and_observable(todo_high_priority: Todo) -> None:
+    task = Todo.from_dict(todo_high_priority.to_dict(), trusted=True)
+
+    class Recorder:
+        def __init__(self) -> None:
+            self.events: list[str] = []
+
+        def task_changed(self, _: Todo, field: str, *__: object) -> None:
+            self.events.append(field)
+
+    recorder = Recorder()
+    task.subscribe(recorder)
+    task.add_tag('New')
+    task.status = StatusEnum.COMPLETED
+
+    assert task.tags == ['urgent', 'backend', 'new']
+    assert recorder.events == ['tags', 'status']
+
+
+def test_from_dict_trusted_parses_created_at_lazily(todo_high_priority: Todo) -> None:
+    data = todo_high_priority.to_dict()
+    data['created_at'] = '2025-12-11T21:30:00'
+
+    task = Todo.from_dict(data, trusted=True)
+
+    assert task._created_at is None
+    assert task.to_dict()['created_at'] is data['created_at']
+    assert task.created_at == datetime.datetime(2025, 12, 11, 21, 30)  # noqa: DTZ001
+    assert task.created_at.tzinfo is None
+    assert task.created_at is task.created_at
+
+
+def test_set_created_at_drops_cached_string(todo_high_priority: Todo) -> None:
+    task = Todo.from_dict(todo_high_priority.to_dict(), trusted=True)
+
+    task.created_at = datetime.datetime(2025, 12, 1, 8, 0, tzinfo=datetime.UTC)
+
+    assert task.to_dict()['created_at'] == '2025-12-01T08:00:00+00:00'
@@ -1,4 +1,5 @@
 import datetime
+import io
 import json
 from uuid import UUID
 
@@ -6,6 +7,7 @@ import pytest
 
 from src.enums.priority_enum import PriorityEnum
 from src.enums.status_enum import StatusEnum
+from src.task.recurrence import Recurrence
 from src.task.task import Todo
 
 
@@ -105,3 +107,34 @@ def test_from_json_with_none_deadline() -> None:
 
     todo = Todo.from_json(json_str)
     assert todo.deadline is None
+
+
+@pytest.mark.parametrize(
+    'description',
+    ['Write "quoted" tests', 'Zażółć gęślą jaźń 🚀', 'Back\\slash and\ttab', 'Line\u2028separator\n'],
+)
+def test_compact_json_matches_json_dumps(basic_todo: Todo, description: str) -> None:
+    basic_todo.description = description
+    basic_todo.tags = ['quote " tag', 'ünïcode']
+    basic_todo.recurrence = Recurrence(3)
+
+    assert basic_todo.to_json() == json.dumps(basic_todo.to_dict(), ensure_ascii=False)
+
+
+def test_write_json_without_deadline_and_recurrence(basic_todo: Todo) -> None:
+    basic_todo.deadline = None
+    buffer = io.StringIO()
+
+    basic_todo.write_json(buffer)
+
+    assert buffer.getvalue() == json.dumps(basic_todo.to_dict(), ensure_ascii=False)
+    assert Todo.from_json(buffer.getvalue()).to_dict() == basic_todo.to_dict()
+
+
+def test_to_dict_does_not_share_mutable_state(basic_todo: Todo) -> None:
+    data = basic_todo.to_dict()
+
+    data['tags'].append('leaked')
+
+    assert 'leaked' not in basic_todo.tags
+    assert basic_todo.to_dict()['tags'] == ['python', 'javascript', 'java']
@@ -4,6 +4,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
 import src.task.task as task_module
 from src.task.task import Todo
 
@@ -63,3 +64,29 @@ def test_todo_deadline_invalid() -> None:
 def test_todo_deadline_valid() -> None:
     t = Todo('Write tests', deadline=date(2024, 3, 1), created_at=datetime(2024, 2, 10, tzinfo=UTC))
     assert t.deadline == date(2024, 3, 1)
+
+
+def test_version_counts_changes_of_editable_fields() -> None:
+    t = Todo('Write tests', tags=['a'])
+    version = t.version
+
+    t.description = 'Write more tests'
+    t.priority = PriorityEnum.HIGH
+    t.status = StatusEnum.COMPLETED
+    t.deadline = None
+    t.recurrence = None
+    t.tags = ['b']
+    t.add_tag('c')
+    t.add_tag('c')
+    t.remove_tag('b')
+    t.remove_tag('missing')
+
+    assert t.version == version + 8
+
+
+def test_version_of_trusted_tasks_starts_at_zero() -> None:
+    t = Todo.from_dict(Todo('Write tests').to_dict(), trusted=True)
+
+    assert t.version == 0
+    t.add_tag('a')
+    assert t.version == 1
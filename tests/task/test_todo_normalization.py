@@ -1,6 +1,6 @@
 import pytest
 
-from src.task.task import Todo
+from src.task.task import TAG_CACHE_SIZE, Todo, _normalize_cached, normalize_tag  # noqa: PLC2701
 
 
 @pytest.mark.parametrize(
@@ -15,3 +15,20 @@ from src.task.task import Todo
 )
 def test_normalize_collapses_whitespaces_and_lowercases(raw: str, expected: str) -> None:
     assert Todo._normalize(raw) == expected
+
+
+def test_normalize_tag_returns_normalized_tags_unchanged() -> None:
+    tag = ''.join(['back', 'end'])
+
+    assert normalize_tag(tag) is tag
+
+
+def test_normalize_tag_caches_results() -> None:
+    _normalize_cached.cache_clear()
+
+    first = normalize_tag('Needs  Review')
+    second = normalize_tag('Needs  Review')
+
+    assert first == second == 'needs review'
+    assert _normalize_cached.cache_info().hits == 1
+    assert _normalize_cached.cache_info().maxsize == TAG_CACHE_SIZE
@@ -145,7 +145,7 @@ def test_todolist_duplicates_on_reassign(basic_todo: Todo) -> None:
     assert my_list.tasks[0] is basic_todo
 
 
-def test_todolist_external_mutation_affects_internal_list() -> None:
+def test_todolist_external_mutation_does_not_affect_internal_list() -> None:
     task_1 = Todo('Write tests', idx=UUID('931f66ba-0000-484e-8b19-4866c2f51721'))
     task_2 = Todo('Learning python', idx=UUID('931f66ba-1111-484e-8b19-4866c2f51721'))
 
@@ -153,9 +153,11 @@ def test_todolist_external_mutation_affects_internal_list() -> None:
 
     external_ref = my_list.tasks
     external_ref.append(task_2)
+    external_ref.remove(task_1)
 
-    assert len(my_list.tasks) == 2
-    assert my_list.tasks[1] is task_2
+    assert my_list.tasks == [task_1]
+    assert my_list.get(task_1.idx) is task_1
+    assert task_2.idx not in my_list
 
 
 def test_todolist_multiple_duplicates() -> None:
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pytest
 
 
@@ -24,9 +26,13 @@ def test_main_executes_app(monkeypatch: pytest.MonkeyPatch) -> None:
     called: dict[str, bool] = {'run': False}
 
     class DummyApp:
-        def __call__(self) -> None:
+        def __call__(self, **_: object) -> None:
             called['run'] = True
 
+        @staticmethod
+        def callback() -> Callable[[Callable[..., None]], Callable[..., None]]:
+            return lambda func: func
+
     def fake_typer(*args: object, **kwargs: object) -> DummyApp:
         return DummyApp()
 
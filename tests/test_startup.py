@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Heavy modules only some commands need; importing one at start-up slows every
+# command down. The timing budget itself is checked by benchmarks/bench_startup.py.
+DEFERRED_MODULES = (
+    'questionary',
+    'prompt_toolkit',
+    'multiprocessing',
+    'concurrent.futures.process',
+    'cProfile',
+    'pstats',
+    'hashlib',
+)
+
+
+def test_cli_import_defers_heavy_modules() -> None:
+    """
+    Should import the CLI without loading the modules deferred to first use.
+    """
+    script = 'import json, sys; import src.main; print(json.dumps(sorted(sys.modules)))'
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', script], capture_output=True, text=True, cwd=PROJECT_ROOT, check=True
+    )
+
+    loaded = set(json.loads(result.stdout))
+    assert not loaded.intersection(DEFERRED_MODULES)
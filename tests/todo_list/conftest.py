@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import json
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
@@ -19,11 +20,22 @@ class _TodoStub:
     description: str
     tags: list[str]
 
+    @property
+    def idx_int(self) -> int:
+        return self.idx.int
+
+    @property
+    def idx_str(self) -> str:
+        return str(self.idx)
+
     def to_dict(self) -> dict[str, Any]:
         return {'idx': str(self.idx), 'description': self.description, 'tags': self.tags}
 
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> _TodoStub:
+    def from_dict(cls, data: dict[str, Any], **_: object) -> _TodoStub:
         return cls(idx=UUID(data['idx']), description=data['description'], tags=data['tags'])
 
 
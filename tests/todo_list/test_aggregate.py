@@ -0,0 +1,138 @@
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+
+
+def test_aggregate_by_status(mixed_todo_list: TodoList) -> None:
+    assert mixed_todo_list.aggregate('status') == {
+        StatusEnum.TODO: 2,
+        StatusEnum.IN_PROGRESS: 1,
+        StatusEnum.COMPLETED: 1,
+    }
+
+
+def test_aggregate_by_priority(mixed_todo_list: TodoList) -> None:
+    assert mixed_todo_list.aggregate('priority') == {
+        PriorityEnum.HIGH: 1,
+        PriorityEnum.LOW: 1,
+        PriorityEnum.MEDIUM: 2,
+    }
+
+
+def test_aggregate_by_tag_is_ordered_by_frequency(mixed_todo_list: TodoList) -> None:
+    tags = mixed_todo_list.aggregate('tag')
+
+    assert next(iter(tags)) == 'backend'
+    assert tags == {'backend': 3, 'urgent': 1, 'data': 1, 'documentation': 1}
+
+
+def test_aggregate_deadline_histograms(mixed_todo_list: TodoList) -> None:
+    assert mixed_todo_list.aggregate('deadline') == {
+        date(2025, 12, 13): 1,
+        date(2025, 12, 26): 1,
+        date(2026, 1, 10): 1,
+    }
+    assert mixed_todo_list.aggregate('month') == {'2025-12': 2, '2026-01': 1}
+
+
+def test_aggregate_rejects_unknown_group(mixed_todo_list: TodoList) -> None:
+    with pytest.raises(ValueError, match='Unsupported group_by: colour'):
+        mixed_todo_list.aggregate('colour')
+
+
+def test_stats_are_built_once_and_follow_add_and_remove(mixed_todo_list: TodoList, basic_todo: Todo) -> None:
+    stats = mixed_todo_list.stats
+
+    mixed_todo_list.add(basic_todo)
+    assert mixed_todo_list.stats is stats
+    assert stats.total == 5
+    assert stats.tags['python'] == 1
+
+    mixed_todo_list.remove(basic_todo.idx)
+    assert stats.total == 4
+    assert 'python' not in stats.tags
+
+    basic_todo.add_tag('ignored')
+    assert 'ignored' not in stats.tags
+
+
+def test_stats_follow_task_setters(mixed_todo_list: TodoList, todo_high_priority: Todo) -> None:
+    stats = mixed_todo_list.stats
+
+    todo_high_priority.priority = PriorityEnum.LOW
+    todo_high_priority.tags = ['frontend']
+    todo_high_priority.remove_tag('frontend')
+    todo_high_priority.add_tag('ops')
+    todo_high_priority.deadline = date(2026, 2, 1)
+
+    assert stats.priority == {PriorityEnum.LOW: 2, PriorityEnum.MEDIUM: 2}
+    assert stats.tags == {'backend': 2, 'data': 1, 'documentation': 1, 'ops': 1}
+    assert stats.aggregate('deadline') == {date(2025, 12, 26): 1, date(2026, 1, 10): 1, date(2026, 2, 1): 1}
+
+    todo_high_priority.deadline = None
+    assert date(2026, 2, 1) not in stats.open_deadlines
+
+
+def test_stats_reset_when_tasks_are_replaced(mixed_todo_list: TodoList, basic_todo: Todo) -> None:
+    stats = mixed_todo_list.stats
+
+    mixed_todo_list.tasks = [basic_todo]
+
+    assert mixed_todo_list.stats is not stats
+    assert mixed_todo_list.stats.total == 1
+
+
+def test_overdue_tracks_completion(mixed_todo_list: TodoList, todo_high_priority: Todo, todo_completed: Todo) -> None:
+    stats = mixed_todo_list.stats
+    today = date(2025, 12, 27)
+
+    assert stats.overdue(today) == 1
+    assert stats.overdue_ratio(today) == 0.25
+
+    todo_completed.status = StatusEnum.TODO
+    assert stats.overdue(today) == 2
+
+    todo_high_priority.status = StatusEnum.COMPLETED
+    todo_high_priority.status = StatusEnum.BLOCKED
+    todo_high_priority.status = StatusEnum.COMPLETED
+    assert stats.overdue(today) == 1
+
+    todo_completed.status = StatusEnum.COMPLETED
+    todo_completed.deadline += timedelta(days=1)
+    assert stats.overdue(today) == 0
+
+
+def test_status_change_without_deadline_keeps_open_deadlines(mixed_todo_list: TodoList, todo_no_deadline: Todo) -> None:
+    stats = mixed_todo_list.stats
+    open_before = dict(stats.open_deadlines)
+
+    todo_no_deadline.status = StatusEnum.COMPLETED
+
+    assert stats.open_deadlines == open_before
+    assert stats.status[StatusEnum.COMPLETED] == 2
+
+    todo_no_deadline.deadline = date(2026, 3, 1)
+    assert stats.deadlines[date(2026, 3, 1)] == 1
+    assert date(2026, 3, 1) not in stats.open_deadlines
+
+
+def test_overdue_ratio_of_empty_list() -> None:
+    assert TodoList().stats.overdue_ratio(date(2025, 12, 27)) == 0.0
+
+
+def test_unknown_field_changes_are_ignored(mixed_todo_list: TodoList, todo_1: Todo) -> None:
+    stats = mixed_todo_list.stats
+    before = dict(stats.status)
+
+    stats.task_changed(todo_1, 'description', 'old', 'new')
+
+    assert stats.status == before
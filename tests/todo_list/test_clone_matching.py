@@ -0,0 +1,65 @@
+from datetime import UTC, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.todo_list.filters import TaskFilter
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+    from src.todo_list.todo_list import TodoList
+
+
+def test_clone_matching_appends_clones_grouped_by_template(
+    mixed_todo_list: TodoList, todo_high_priority: Todo, todo_low_priority: Todo
+) -> None:
+    clones = mixed_todo_list.clone_matching(TaskFilter(tag='data'), n=2)
+
+    assert len(clones) == 2
+    assert [clone.description for clone in clones] == [todo_low_priority.description] * 2
+    assert mixed_todo_list.tasks[-2:] == clones.tasks
+    assert len(mixed_todo_list) == 6
+    assert all(clone.idx in mixed_todo_list for clone in clones)
+    assert mixed_todo_list.get(clones.tasks[0].idx) is clones.tasks[0]
+    assert todo_high_priority in mixed_todo_list.tasks
+
+
+def test_clone_matching_sets_deadlines_and_drops_tags(mixed_todo_list: TodoList) -> None:
+    today = _FixedDateTime.now(tz=UTC).date()
+    deadlines = [today + timedelta(days=7), today + timedelta(days=14)]
+
+    clones = mixed_todo_list.clone_matching(TaskFilter(tag='backend'), n=2, deadlines=deadlines, drop_tags=['Backend'])
+
+    assert len(clones) == 6
+    assert [clone.deadline for clone in clones] == deadlines * 3
+    assert [clone.tags for clone in clones] == [['urgent']] * 2 + [['data']] * 2 + [[]] * 2
+
+
+def test_clone_matching_updates_existing_stats(mixed_todo_list: TodoList) -> None:
+    stats = mixed_todo_list.stats
+    backend = stats.tags['backend']
+
+    mixed_todo_list.clone_matching(TaskFilter(tag='backend'), n=3)
+
+    assert stats.tags['backend'] == backend * 4
+    assert sum(stats.status.values()) == 13
+
+
+def test_clone_matching_without_matches_changes_nothing(mixed_todo_list: TodoList) -> None:
+    clones = mixed_todo_list.clone_matching(TaskFilter(tag='missing'))
+
+    assert len(clones) == 0
+    assert len(mixed_todo_list) == 4
+
+
+def test_clone_matching_rejects_existing_ids(
+    monkeypatch: pytest.MonkeyPatch, mixed_todo_list: TodoList, todo_high_priority: Todo
+) -> None:
+    monkeypatch.setattr('src.task.task.os.urandom', lambda size: todo_high_priority.idx.bytes * (size // 16))
+
+    with pytest.raises(ValueError, match='Duplicate Todo index values detected'):
+        mixed_todo_list.clone_matching(TaskFilter(tag='urgent'))
+
+    assert len(mixed_todo_list) == 4
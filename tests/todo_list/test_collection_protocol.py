@@ -53,3 +53,8 @@ def test_getitem_returns_correct_task(
 def test_getitem_index_error(mixed_todo_list: TodoList) -> None:
     with pytest.raises(IndexError):
         _ = mixed_todo_list[5]
+
+
+def test_contains_rejects_non_uuid(mixed_todo_list: TodoList, todo_high_priority: Todo) -> None:
+    assert str(todo_high_priority.idx) not in mixed_todo_list
+    assert todo_high_priority.idx_int not in mixed_todo_list
@@ -33,6 +33,12 @@ def test_filter_by_tag(mixed_todo_list: TodoList, todo_high_priority: Todo, todo
     assert todo_low_priority in res.tasks
 
 
+def test_filter_by_tag_is_normalized(mixed_todo_list: TodoList) -> None:
+    res = mixed_todo_list.filter_by(tag='  BackEnd ')
+
+    assert len(res.tasks) == 3
+
+
 def test_filter_by_deadline_before(
     mixed_todo_list: TodoList,
     todo_high_priority: Todo,
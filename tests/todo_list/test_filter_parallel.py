@@ -0,0 +1,109 @@
+import pickle  # noqa: S403
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.enums.priority_enum import PriorityEnum
+from src.task.tags import TAG_REGISTRY
+from src.task.task import Todo
+from src.todo_list.filters import TaskFilter
+import src.todo_list.parallel as parallel_module
+from src.todo_list.parallel import filter_parallel
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from src.todo_list.todo_list import TodoList
+
+
+def _mentions_learn(task: Todo) -> bool:
+    return 'learn' in task.description.lower()
+
+
+@pytest.fixture
+def thread_pool(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel_module, 'is_free_threaded', lambda: True)
+
+
+def test_filter_parallel_keeps_order_and_identity(mixed_todo_list: TodoList, thread_pool: None) -> None:
+    result = filter_parallel(mixed_todo_list.tasks, _mentions_learn, workers=2, chunk_size=1)
+
+    assert result == mixed_todo_list.tasks[:3]
+    assert all(a is b for a, b in zip(result, mixed_todo_list.tasks, strict=False))
+
+
+def test_filter_parallel_in_process_pool(mixed_todo_list: TodoList) -> None:
+    result = filter_parallel(mixed_todo_list.tasks, _mentions_learn, workers=2)
+
+    assert result == mixed_todo_list.tasks[:3]
+
+
+def test_filter_by_parallel_above_threshold(
+    mixed_todo_list: TodoList, todo_high_priority: Todo, thread_pool: None, monkeypatch: MonkeyPatch
+) -> None:
+    calls: list[int] = []
+    original = parallel_module.filter_parallel
+
+    def spy(*args: object, **kwargs: object) -> list[Todo]:
+        calls.append(1)
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr('src.todo_list.todo_list.filter_parallel', spy)
+
+    res = mixed_todo_list.filter_by(priority=PriorityEnum.HIGH, workers=2, parallel_threshold=4)
+
+    assert res.tasks == [todo_high_priority]
+    assert calls == [1]
+
+
+def test_filter_by_falls_back_to_serial_below_threshold(mixed_todo_list: TodoList, monkeypatch: MonkeyPatch) -> None:
+    def fail(*_: object, **__: object) -> list[Todo]:
+        raise AssertionError
+
+    monkeypatch.setattr('src.todo_list.todo_list.filter_parallel', fail)
+
+    res = mixed_todo_list.filter_by(custom_filter=_mentions_learn, workers=4, parallel_threshold=5)
+
+    assert len(res) == 3
+
+
+def test_filter_by_custom_filter_runs_only_after_cheap_criteria(mixed_todo_list: TodoList) -> None:
+    seen: list[Todo] = []
+
+    def spy(task: Todo) -> bool:
+        seen.append(task)
+        return True
+
+    res = mixed_todo_list.filter_by(priority=PriorityEnum.LOW, custom_filter=spy)
+
+    assert seen == res.tasks
+    assert len(seen) == 1
+
+
+def test_filter_parallel_by_tag_in_process_pool(mixed_todo_list: TodoList) -> None:
+    result = filter_parallel(mixed_todo_list.tasks, TaskFilter(tag='backend'), workers=2)
+
+    assert [task.idx for task in result] == [task.idx for task in mixed_todo_list.filter_by(tag='backend')]
+
+
+def test_task_filter_pickles_tag_not_tag_id() -> None:
+    matches = TaskFilter(tag='Pickled Tag')
+
+    state = matches.__getstate__()
+    restored = pickle.loads(pickle.dumps(matches))  # noqa: S301
+
+    assert '_tag_id' not in state
+    assert restored.tag == 'pickled tag'
+    assert restored(Todo('Tagged task', tags=['pickled tag']))
+    assert not restored(Todo('Untagged task'))
+
+
+def test_task_filter_does_not_register_unknown_tags(mixed_todo_list: TodoList) -> None:
+    registered = len(TAG_REGISTRY)
+    matches = TaskFilter(tag='Never used tag')
+
+    assert mixed_todo_list.filter_by(tag='another unused tag').tasks == []
+    assert not any(map(matches, mixed_todo_list))
+    assert len(TAG_REGISTRY) == registered
+    assert matches(Todo('Tagged later', tags=['never used tag']))
@@ -0,0 +1,42 @@
+from datetime import UTC, timedelta
+from typing import TYPE_CHECKING
+
+from src.task.recurrence import Recurrence
+from tests.conftest import _FixedDateTime
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+    from src.todo_list.todo_list import TodoList
+
+
+def test_occurrences_are_merged_by_deadline(
+    mixed_todo_list: TodoList, todo_high_priority: Todo, todo_no_deadline: Todo
+) -> None:
+    today = _FixedDateTime.now(tz=UTC).date()
+    todo_high_priority.recurrence = Recurrence(3)
+    todo_no_deadline.recurrence = Recurrence(2)
+
+    instances = list(mixed_todo_list.occurrences(today, today + timedelta(days=8)))
+
+    assert [(task.description, (task.deadline - today).days) for task in instances] == [
+        ('Task without deadline', 2),
+        ('Task without deadline', 4),
+        ('Learn FastAPI', 5),
+        ('Task without deadline', 6),
+        ('Learn FastAPI', 8),
+        ('Task without deadline', 8),
+    ]
+    assert len(mixed_todo_list) == 4
+
+
+def test_with_occurrences_supports_deadline_queries(mixed_todo_list: TodoList, todo_completed: Todo) -> None:
+    today = _FixedDateTime.now(tz=UTC).date()
+    todo_completed.recurrence = Recurrence(7)
+
+    expanded = mixed_todo_list.with_occurrences(today, today + timedelta(days=30))
+    due = expanded.filter_by(deadline_after=today + timedelta(days=16), deadline_before=today + timedelta(days=23))
+
+    assert len(expanded) == 6
+    assert [task.deadline for task in due] == [today + timedelta(days=22)]
+    assert len(mixed_todo_list) == 4
@@ -0,0 +1,102 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pickle  # noqa: S403
+from typing import TYPE_CHECKING
+
+import pytest
+
+import src.todo_list.parallel as parallel_module
+from src.todo_list.parallel import is_free_threaded, make_executor, parse_parallel, split_chunks
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from src.task.task import Todo
+
+
+@pytest.fixture
+def records(mixed_todo_list: TodoList) -> list[dict]:
+    return [task.to_dict() for task in mixed_todo_list]
+
+
+@pytest.fixture
+def thread_pool(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel_module, 'is_free_threaded', lambda: True)
+
+
+def test_split_chunks_default_size_keeps_order() -> None:
+    chunks = split_chunks(list(range(10)), workers=2)
+
+    assert chunks == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+
+
+def test_split_chunks_explicit_size() -> None:
+    assert split_chunks(list(range(5)), workers=8, chunk_size=3) == [[0, 1, 2], [3, 4]]
+
+
+def test_split_chunks_empty() -> None:
+    assert split_chunks([], workers=4) == []
+
+
+def test_make_executor_uses_processes_with_gil(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel_module, 'is_free_threaded', lambda: False)
+
+    with make_executor(1) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+
+
+def test_make_executor_uses_threads_when_free_threaded(thread_pool: None) -> None:
+    with make_executor(1) as executor:
+        assert isinstance(executor, ThreadPoolExecutor)
+
+
+def test_is_free_threaded_matches_interpreter(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel_module.sys, '_is_gil_enabled', lambda: False, raising=False)
+
+    assert is_free_threaded() is True
+
+
+def test_parse_parallel_preserves_order(records: list[dict], thread_pool: None) -> None:
+    tasks = parse_parallel(records, workers=2, chunk_size=1)
+
+    assert [task.to_dict() for task in tasks] == records
+
+
+def test_parse_parallel_in_process_pool(records: list[dict]) -> None:
+    tasks = parse_parallel(records, workers=2)
+
+    assert [task.to_dict() for task in tasks] == records
+
+
+def test_from_dict_with_workers(records: list[dict], thread_pool: None) -> None:
+    tl = TodoList.from_dict({'tasks': records}, workers=3)
+
+    assert [task.to_dict() for task in tl] == records
+
+
+def test_from_dict_with_workers_detects_duplicates(records: list[dict], thread_pool: None) -> None:
+    with pytest.raises(ValueError, match=r'Duplicate Todo index values detected'):
+        TodoList.from_dict({'tasks': [*records, records[0]]}, workers=2)
+
+
+def test_from_json_with_workers(mixed_todo_list: TodoList, thread_pool: None) -> None:
+    tl = TodoList.from_json(mixed_todo_list.to_json(), workers=2)
+
+    assert tl.to_dict() == mixed_todo_list.to_dict()
+
+
+def test_pickled_todo_drops_observers(basic_todo: Todo) -> None:
+    stats = TodoList([basic_todo]).stats
+
+    clone = pickle.loads(pickle.dumps(basic_todo))  # noqa: S301
+
+    assert clone.to_dict() == basic_todo.to_dict()
+    assert clone._observers == ()
+    assert stats.total == 1
+
+
+def test_from_dict_trusted_in_parallel(mixed_todo_list: TodoList, thread_pool: None) -> None:
+    restored = TodoList.from_dict(mixed_todo_list.to_dict(), workers=2, trusted=True)
+
+    assert restored.to_dict() == mixed_todo_list.to_dict()
@@ -18,3 +18,11 @@ def test_remove_task_idx_in_tasks(basic_todo_list: TodoList, todo_1: Todo) -> No
 def test_remove_task_idx_not_in_tasks(basic_todo_list: TodoList, basic_todo: Todo) -> None:
     with pytest.raises(ValueError, match=rf'Task with idx: {basic_todo.idx} not found.'):
         basic_todo_list.remove(basic_todo.idx)
+
+
+def test_removed_task_can_be_added_again(basic_todo_list: TodoList, todo_1: Todo) -> None:
+    basic_todo_list.remove(todo_1.idx)
+
+    assert todo_1.idx not in basic_todo_list
+    basic_todo_list.add(todo_1)
+    assert basic_todo_list.get(todo_1.idx) is todo_1
@@ -0,0 +1,93 @@
+import io
+import json
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.todo_list.streaming import iter_task_records, write_tasks
+from src.todo_list.todo_list import TodoList
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.task.task import Todo
+
+
+@pytest.mark.parametrize('buffer_size', [1, 7, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 4])
+def test_iter_task_records_any_buffer_and_layout(
+    mixed_todo_list: TodoList, buffer_size: int, indent: int | None
+) -> None:
+    raw = mixed_todo_list.to_json(indent=indent)
+
+    records = list(iter_task_records(io.StringIO(raw), buffer_size=buffer_size))
+
+    assert records == json.loads(raw)['tasks']
+
+
+@pytest.mark.parametrize('raw', ['{"tasks": []}', ' \n{ "tasks" :\n[\n]\n}\n'])
+def test_iter_task_records_empty_list(raw: str) -> None:
+    assert list(iter_task_records(io.StringIO(raw), buffer_size=2)) == []
+
+
+@pytest.mark.parametrize(
+    ('raw', 'message'),
+    [
+        ('', "Expected '{'"),
+        ('{"items": []}', 'Expected \'"tasks"\''),
+        ('{"tasks": [{"a": 1} {"b": 2}]}', "Expected ']'"),
+        ('{"tasks": []', "Expected '}'"),
+        ('{"tasks": []}{}', 'Extra data'),
+        ('{"tasks": [{"a": 1}, ]}', 'Expecting value'),
+        ('{"tasks": [{"a": ', 'Expecting value'),
+    ],
+)
+def test_iter_task_records_rejects_invalid_streams(raw: str, message: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(message)):
+        list(iter_task_records(io.StringIO(raw), buffer_size=3))
+
+
+def test_load_stream_round_trips_dump(mixed_todo_list: TodoList) -> None:
+    buffer = io.StringIO()
+    mixed_todo_list.dump(buffer, chunk_size=3)
+    buffer.seek(0)
+
+    loaded = TodoList.load_stream(buffer, trusted=True, buffer_size=64)
+
+    assert loaded.to_dict() == mixed_todo_list.to_dict()
+    assert buffer.getvalue() == mixed_todo_list.to_json()
+
+
+def test_load_stream_validates_records(todo_1: Todo) -> None:
+    record = todo_1.to_dict()
+    record['tags'] = ['Mixed  Case']
+    raw = json.dumps({'tasks': [record]})
+
+    assert TodoList.load_stream(io.StringIO(raw)).tasks[0].tags == ['mixed case']
+
+    with pytest.raises(TypeError, match=re.escape('Invalid TodoList JSON structure.')):
+        TodoList.load_stream(io.StringIO('{"tasks": [{"description": "x"}]}'))
+
+
+def test_load_stream_rejects_duplicates(todo_1: Todo) -> None:
+    raw = json.dumps({'tasks': [todo_1.to_dict(), todo_1.to_dict()]})
+
+    with pytest.raises(ValueError, match='Duplicate Todo index values detected'):
+        TodoList.load_stream(io.StringIO(raw))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_write_tasks_consumes_an_iterator(mixed_todo_list: TodoList, chunk_size: int) -> None:
+    fp = io.StringIO()
+
+    written = write_tasks(fp, iter(mixed_todo_list), chunk_size=chunk_size)
+
+    assert written == 4
+    assert fp.getvalue() == mixed_todo_list.to_json()
+
+
+def test_write_tasks_empty() -> None:
+    fp = io.StringIO()
+
+    assert write_tasks(fp, iter(())) == 0
+    assert fp.getvalue() == TodoList().to_json()
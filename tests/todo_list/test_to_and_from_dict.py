@@ -15,11 +15,19 @@ class _TodoStub:
     payload: dict[str, str]
     idx: UUID
 
+    @property
+    def idx_int(self) -> int:
+        return self.idx.int
+
+    @property
+    def idx_str(self) -> str:
+        return str(self.idx)
+
     def to_dict(self) -> dict[str, str]:
         return self.payload
 
     @classmethod
-    def from_dict(cls, data: dict[str, str]) -> _TodoStub:
+    def from_dict(cls, data: dict[str, str], **_: object) -> _TodoStub:
         return cls(payload=data, idx=uuid4())
 
 
@@ -38,7 +46,7 @@ def test_from_dict_creates_todo_list_and_calls_todo_from_dict(monkeypatch: Monke
 
     class _TodoSpy(_TodoStub):
         @classmethod
-        def from_dict(cls, data: dict[str, str]) -> _TodoSpy:
+        def from_dict(cls, data: dict[str, str], **_: object) -> _TodoSpy:
             calls.append(data)
 
             return cls(payload=data, idx=uuid4())
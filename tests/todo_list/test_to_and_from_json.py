@@ -1,3 +1,4 @@
+import io
 import json
 from typing import TYPE_CHECKING, Any, cast
 
@@ -83,3 +84,21 @@ def test_from_json_roundtrip_equals_by_dict(
 
     assert tl.to_dict() == parsed.to_dict()
     assert [task.idx for task in tl] == [task.idx for task in parsed]
+
+
+def test_dump_writes_the_compact_json(mixed_todo_list: TodoList) -> None:
+    buffer = io.StringIO()
+
+    mixed_todo_list.dump(buffer)
+
+    assert buffer.getvalue() == json.dumps(mixed_todo_list.to_dict(), ensure_ascii=False)
+    assert mixed_todo_list.to_json() == buffer.getvalue()
+    assert TodoList.from_json(buffer.getvalue()).to_dict() == mixed_todo_list.to_dict()
+
+
+def test_dump_empty_list() -> None:
+    buffer = io.StringIO()
+
+    TodoList().dump(buffer)
+
+    assert json.loads(buffer.getvalue()) == {'tasks': []}
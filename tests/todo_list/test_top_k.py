@@ -0,0 +1,55 @@
+from datetime import date
+
+from src.enums.priority_enum import PriorityEnum
+from src.task.task import Todo
+from src.todo_list.todo_list import TodoList
+
+
+def test_top_k_matches_sorted_prefix(
+    todo_high_priority: Todo, todo_low_priority: Todo, todo_completed: Todo, todo_no_deadline: Todo
+) -> None:
+    my_todo_list = TodoList([todo_low_priority, todo_no_deadline, todo_high_priority, todo_completed])
+    keys = (lambda todo: -todo.priority, lambda todo: (todo.deadline is None, todo.deadline))
+
+    tl = my_todo_list.top_k(2, *keys)
+
+    assert tl.tasks == my_todo_list.sort_by_many(*keys).tasks[:2]
+    assert [t.priority for t in tl] == [PriorityEnum.HIGH, PriorityEnum.MEDIUM]
+    assert tl[1].deadline == date(2025, 12, 26)
+
+
+def test_top_k_reverse(todo_high_priority: Todo, todo_low_priority: Todo, todo_completed: Todo) -> None:
+    my_todo_list = TodoList([todo_low_priority, todo_completed, todo_high_priority])
+
+    tl = my_todo_list.top_k(1, lambda todo: todo.priority, reverse=True)
+
+    assert tl.tasks == [todo_high_priority]
+
+
+def test_top_k_is_stable_for_ties() -> None:
+    t1 = Todo(description='Python')
+    t2 = Todo(description='Java')
+    t3 = Todo(description='Rust')
+
+    tl = TodoList([t1, t2, t3]).top_k(2, lambda todo: todo.priority)
+
+    assert tl.tasks == [t1, t2]
+
+
+def test_top_k_larger_than_list(basic_todo_list: TodoList) -> None:
+    tl = basic_todo_list.top_k(10, lambda todo: todo.description)
+
+    assert [t.description for t in tl] == ['Learn js', 'Learn python', 'Learn sql', 'Learn ts']
+
+
+def test_top_k_non_positive_returns_empty(basic_todo_list: TodoList) -> None:
+    assert len(basic_todo_list.top_k(0)) == 0
+    assert len(basic_todo_list.top_k(-3)) == 0
+
+
+def test_top_k_does_not_mutate_original(basic_todo_list: TodoList) -> None:
+    original = list(basic_todo_list.tasks)
+
+    basic_todo_list.top_k(2, lambda todo: todo.description)
+
+    assert basic_todo_list.tasks == original
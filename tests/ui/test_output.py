@@ -0,0 +1,100 @@
+import csv
+from datetime import date
+import io
+import json
+
+import pytest
+
+from src.enums.output_format_enum import OutputFormatEnum
+from src.enums.priority_enum import PriorityEnum
+from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
+from src.todo_list.todo_list import TodoList
+from src.ui.output import COLUMNS, WRITERS, write_csv, write_json, write_ndjson, write_plain, write_tsv
+
+
+@pytest.fixture
+def tasks() -> list[Todo]:
+    """Provide a task with tags and a deadline, and one with neither."""
+    return [
+        Todo(
+            description='Ship release',
+            priority=PriorityEnum.HIGH,
+            status=StatusEnum.IN_PROGRESS,
+            deadline=date(2099, 1, 31),
+            tags=['work', 'urgent'],
+        ),
+        Todo(description='Read, then\twrite', priority=PriorityEnum.LOW, status=StatusEnum.TODO),
+    ]
+
+
+def test_write_plain(tasks: list[Todo]) -> None:
+    fp = io.StringIO()
+
+    assert write_plain(fp, tasks, chunk_size=1) == 2
+    assert fp.getvalue().splitlines() == [
+        'in_progress HIGH   2099-01-31 Ship release [work, urgent]',
+        'todo        LOW    -          Read, then\twrite',
+    ]
+
+
+def test_write_csv(tasks: list[Todo]) -> None:
+    fp = io.StringIO()
+
+    assert write_csv(fp, tasks) == 2
+
+    rows = list(csv.reader(io.StringIO(fp.getvalue())))
+    assert rows == [
+        list(COLUMNS),
+        [tasks[0].idx_str, 'in_progress', 'high', 'Ship release', '2099-01-31', 'work,urgent'],
+        [tasks[1].idx_str, 'todo', 'low', 'Read, then\twrite', '', ''],
+    ]
+
+
+def test_write_tsv_keeps_one_line_per_task(tasks: list[Todo]) -> None:
+    fp = io.StringIO()
+
+    assert write_tsv(fp, tasks) == 2
+
+    lines = fp.getvalue().splitlines()
+    assert lines[0] == 'id\tstatus\tpriority\tdescription\tdeadline\ttags'
+    assert lines[1] == f'{tasks[0].idx_str}\tin_progress\thigh\tShip release\t2099-01-31\twork,urgent'
+    assert lines[2] == f'{tasks[1].idx_str}\ttodo\tlow\tRead, then\\twrite\t\t'
+
+
+def test_write_tsv_escapes_line_breaks_and_backslashes() -> None:
+    task = Todo(description='First line\nsecond "line"\r\nC:\\temp', priority=PriorityEnum.LOW)
+    fp = io.StringIO()
+
+    write_tsv(fp, [task])
+
+    lines = fp.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[1].split('\t')[3] == 'First line\\nsecond "line"\\r\\nC:\\\\temp'
+
+
+def test_write_ndjson(tasks: list[Todo]) -> None:
+    fp = io.StringIO()
+
+    assert write_ndjson(fp, tasks, chunk_size=1) == 2
+    assert [json.loads(line) for line in fp.getvalue().splitlines()] == [task.to_dict() for task in tasks]
+
+
+def test_write_json_is_a_todo_list(tasks: list[Todo]) -> None:
+    fp = io.StringIO()
+
+    assert write_json(fp, iter(tasks)) == 2
+    assert fp.getvalue().endswith('\n')
+    assert TodoList.from_json(fp.getvalue()).to_json() == TodoList(tasks).to_json()
+
+
+@pytest.mark.parametrize('output_format', list(WRITERS))
+def test_writers_accept_no_tasks(output_format: OutputFormatEnum) -> None:
+    fp = io.StringIO()
+
+    assert WRITERS[output_format](fp, []) == 0
+    assert len(fp.getvalue().splitlines()) <= 1
+
+
+def test_every_format_but_the_table_has_a_writer() -> None:
+    assert set(WRITERS) == set(OutputFormatEnum) - {OutputFormatEnum.TABLE}
@@ -40,7 +40,7 @@ def test_prompt_description_valid(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_priority(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('High'),
     )
 
@@ -51,7 +51,7 @@ def test_prompt_priority(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_priority_abort(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect(None),
     )
 
@@ -61,7 +61,7 @@ def test_prompt_priority_abort(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_status(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('In Progress'),
     )
 
@@ -72,7 +72,7 @@ def test_prompt_status(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_status_abort(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect(None),
     )
 
@@ -82,7 +82,7 @@ def test_prompt_status_abort(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_deadline_no_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('No deadline'),
     )
 
@@ -93,7 +93,7 @@ def test_prompt_deadline_today(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed = datetime(2026, 1, 1, tzinfo=UTC)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('Today'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -107,7 +107,7 @@ def test_prompt_deadline_tomorrow(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed = datetime(2026, 1, 1, tzinfo=UTC)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('Tomorrow'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -121,7 +121,7 @@ def test_prompt_deadline_in_7_days(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed = datetime(2026, 1, 1, tzinfo=UTC)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('In 7 days'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -135,7 +135,7 @@ def test_prompt_deadline_in_14_days(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed = datetime(2026, 1, 1, tzinfo=UTC)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('In 14 days'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -149,7 +149,7 @@ def test_prompt_deadline_manual_valid(monkeypatch: pytest.MonkeyPatch) -> None:
     fixed = datetime(2026, 1, 1, tzinfo=UTC)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('Pick exact date (YYYY-MM-DD)'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -169,7 +169,7 @@ def test_prompt_deadline_manual_retry(monkeypatch: pytest.MonkeyPatch) -> None:
         return next(inputs)
 
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('Pick exact date (YYYY-MM-DD)'),
     )
     monkeypatch.setattr('src.ui.prompts.datetime', type('X', (), {'now': lambda _: fixed}))
@@ -183,7 +183,7 @@ def test_prompt_deadline_manual_retry(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_deadline_abort(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect(None),
     )
 
@@ -205,10 +205,20 @@ def test_prompt_tags_values(monkeypatch: pytest.MonkeyPatch) -> None:
 
 def test_prompt_menu(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        'src.ui.prompts.questionary.select',
+        'questionary.select',
         lambda *_, **__: DummySelect('X'),
     )
 
     result = prompts.prompt_menu(['X', 'Y'])
 
     assert result == 'X'
+
+
+def test_prompt_menu_abort(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        'questionary.select',
+        lambda *_, **__: DummySelect(None),
+    )
+
+    with pytest.raises(typer.Abort):
+        prompts.prompt_menu(['X', 'Y'])
@@ -8,22 +8,24 @@ from rich.table import Table
 
 from src.enums.priority_enum import PriorityEnum
 from src.enums.status_enum import StatusEnum
+from src.task.task import Todo
 from src.todo_list.todo_list import TodoList
-from src.ui.tables import build_tasks_table
+from src.ui.tables import build_counts_table, build_tasks_table, task_row_cells
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from datetime import date
 
 
-@dataclass
+@dataclass(eq=False)
 class DummyTask:
     description: str
     priority: PriorityEnum | int
     status: StatusEnum
     deadline: date | str | None
     tags: list[str]
+    version: int = 0
 
 
 class DummyTodoList(TodoList):
@@ -82,6 +84,14 @@ def test_build_tasks_table_rows_content(sample_tasks: DummyTodoList) -> None:
     assert ('2', 'completed'.center(6), '[green]LOW[/green]', 'Task 2', '2026-01-01', '-') in rows
 
 
+def test_build_tasks_table_shows_stored_positions() -> None:
+    first, second, virtual = (Todo(description=f'Task {n}') for n in range(1, 4))
+
+    table = build_tasks_table(TodoList([second, virtual, first]), {first.idx_int: 1, second.idx_int: 2})
+
+    assert [(row[0], row[3]) for row in extract_rows(table)] == [('2', 'Task 2'), ('-', 'Task 3'), ('1', 'Task 1')]
+
+
 def test_build_tasks_table_priority_default_color(sample_tasks: DummyTodoList) -> None:
     class FakePriority:
         name = 'CUSTOM'
@@ -93,3 +103,60 @@ def test_build_tasks_table_priority_default_color(sample_tasks: DummyTodoList) -
     rows = extract_rows(table)
 
     assert any('[white]CUSTOM[/white]' in row[2] for row in rows)
+
+
+def test_task_row_cells_are_reused_until_the_task_changes() -> None:
+    task = Todo(description='Cached row', priority=PriorityEnum.LOW, tags=['a'])
+
+    first = task_row_cells(task)
+
+    assert first == (' todo ', '[green]LOW[/green]', 'Cached row', 'None', 'a')
+    assert task_row_cells(task) is first
+
+    task.add_tag('b')
+    task.priority = PriorityEnum.HIGH
+
+    assert task_row_cells(task) == (' todo ', '[red]HIGH[/red]', 'Cached row', 'None', 'a, b')
+
+
+@pytest.mark.parametrize(
+    'change',
+    [
+        lambda task: setattr(task, 'description', 'Renamed'),
+        lambda task: setattr(task, 'status', StatusEnum.COMPLETED),
+        lambda task: setattr(task, 'deadline', None),
+        lambda task: setattr(task, 'tags', ['x']),
+        lambda task: task.remove_tag('a'),
+    ],
+)
+def test_task_row_cells_follow_every_change(change: Callable[[Todo], None]) -> None:
+    task = Todo(description='Cached row', tags=['a'])
+    before = task_row_cells(task)
+
+    change(task)
+
+    assert task_row_cells(task) is not before
+
+
+def test_build_tasks_table_reuses_rows_of_unchanged_tasks(sample_tasks: DummyTodoList) -> None:
+    build_tasks_table(sample_tasks)
+    sample_tasks._tasks[0].description = 'Stale'
+
+    assert extract_rows(build_tasks_table(sample_tasks))[0][3] == 'Task 1'
+
+    sample_tasks._tasks[0].version += 1
+
+    assert extract_rows(build_tasks_table(sample_tasks))[0][3] == 'Stale'
+
+
+def test_build_counts_table_rows() -> None:
+    table = build_counts_table('Status', {'todo': 3, 'completed': 1}, 4)
+
+    assert table.title == 'Status'
+    assert extract_rows(table) == [('todo', '3', '75.0%'), ('completed', '1', '25.0%')]
+
+
+def test_build_counts_table_zero_total() -> None:
+    table = build_counts_table('Tags', {'a': 0}, 0)
+
+    assert extract_rows(table) == [('a', '0', '0.0%')]